@@ -13,10 +13,98 @@ This script performs pre-release checks and preparations:
 """
 
 import argparse
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import tomllib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from xml.etree import ElementTree
+
+_SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)(?:-([\w\.-]+))?(?:\+([\w\.-]+))?")
+# The Unreleased body runs from the end of its header line to the next version
+# heading or the trailing link-reference block.
+_UNRELEASED_HEADER_RE = re.compile(r"## \[Unreleased\][^\n]*\n", re.IGNORECASE)
+_SECTION_END_RE = re.compile(r"\n(?:## \[|\[unreleased\])", re.IGNORECASE)
+# `pip list --outdated` queries the index for every installed distribution, so
+# its answer is reused for a day across release rehearsals -- but only while the
+# environment and lockfile it was computed for are unchanged.
+_OUTDATED_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "gopher-mcp"
+    / "outdated.json"
+)
+_OUTDATED_CACHE_TTL = 24 * 60 * 60
+_README_SECTIONS = (
+    "Gopher & Gemini MCP Server",
+    "gopher_fetch",
+    "gemini_fetch",
+    "Configuration",
+    "Installation",
+)
+_README_SECTIONS_RE = re.compile("|".join(map(re.escape, _README_SECTIONS)))
+
+
+def _stage_file(path: Path, text: str) -> Path:
+    """Write ``text`` to a fsynced temp file beside ``path`` and return it."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp_path
+
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_semver(version: str) -> bool:
+    """Return whether ``version`` is a semantic version (X.Y.Z[-pre][+build])."""
+    return _SEMVER_RE.fullmatch(version) is not None
+
+
+def _count_failures_by_category(junit_path: Path) -> dict[str, int]:
+    """Count failed/errored test cases in a JUnit report by test category.
+
+    Streams ``<testcase>`` elements and classifies each by the ``marker``
+    properties the test conftest records: ``integration`` and ``slow`` tests
+    are reported as such, everything else as a unit test.
+    """
+    counts: dict[str, int] = {}
+    for _, element in ElementTree.iterparse(junit_path):
+        if element.tag != "testcase":
+            continue
+        if element.find("failure") is not None or element.find("error") is not None:
+            markers = {
+                prop.get("value")
+                for prop in element.iterfind("properties/property")
+                if prop.get("name") == "marker"
+            }
+            if "integration" in markers:
+                category = "integration"
+            elif "slow" in markers:
+                category = "slow"
+            else:
+                category = "unit"
+            counts[category] = counts.get(category, 0) + 1
+        element.clear()
+    return counts
+
+
+def _worker_count(jobs: int) -> int:
+    """Number of threads to use for ``jobs`` independent subprocess jobs.
+
+    On a machine with two or fewer CPUs the child processes would just
+    compete for the same cores, so they run one at a time instead.
+    """
+    return max(jobs, 1) if (os.cpu_count() or 1) > 2 else 1
 
 
 class ReleasePreparation:
@@ -26,124 +114,165 @@ class ReleasePreparation:
         self.project_root = Path(__file__).parent.parent
         self.errors: list[str] = []
         self.warnings: list[str] = []
+        self._step_output = threading.local()
+        self._pyproject_data: dict | None = None
+
+    def _pyproject(self) -> dict:
+        """Return pyproject.toml parsed once per run (reset after rewrites)."""
+        if self._pyproject_data is None:
+            pyproject_path = self.project_root / "pyproject.toml"
+            if not pyproject_path.exists():
+                raise FileNotFoundError("pyproject.toml not found!")
+            self._pyproject_data = tomllib.loads(pyproject_path.read_text())
+        return self._pyproject_data
 
     def _get_current_version(self) -> str:
         """Get the current version from pyproject.toml."""
-        pyproject_path = self.project_root / "pyproject.toml"
-        if not pyproject_path.exists():
-            raise FileNotFoundError("pyproject.toml not found!")
-
-        content = pyproject_path.read_text()
-        # Anchor to the start of a line so we read [project].version and not a
-        # substring of target-version / python_version / minversion.
-        match = re.search(r'^version = "([^"]+)"', content, flags=re.MULTILINE)
-        if not match:
+        version = self._pyproject().get("project", {}).get("version")
+        if not version:
             raise ValueError("Version not found in pyproject.toml!")
 
-        return match.group(1)
+        return version
 
     def _validate_version_format(self, version: str) -> bool:
         """Validate version format (semantic versioning)."""
-        pattern = r"^(\d+)\.(\d+)\.(\d+)(?:-([\w\.-]+))?(?:\+([\w\.-]+))?$"
-        return bool(re.match(pattern, version))
+        return _is_valid_semver(version)
 
-    def _update_version(self, new_version: str) -> None:
-        """Update the version in pyproject.toml and server.json.
+    def _apply_version_bump(self, new_version: str) -> None:
+        """Update the version in pyproject.toml, server.json and CHANGELOG.md.
 
         The release workflow validates that pyproject.toml AND server.json (its
         two version fields) all match the tag, so both must be bumped here -- a
         pyproject-only bump produces a tag push that fails at validate-release.
+
+        Every file is read once and rewritten in memory first. The new
+        contents are then staged to fsynced temp files concurrently and only
+        renamed into place once all of them are on disk, so a failure while
+        writing leaves the tree untouched.
         """
-        # pyproject.toml: anchor to the start of a line and replace only the
-        # first match, so we don't rewrite target-version / python_version /
+        writes: list[tuple[Path, str, str]] = []
+
+        # pyproject.toml: the current value is known, so this is a literal
+        # replace. Anchor it to the start of a line and replace only the first
+        # match, so we don't rewrite target-version / python_version /
         # minversion (which an unanchored substring match would clobber, breaking
         # ruff/mypy/pytest config).
         pyproject_path = self.project_root / "pyproject.toml"
-        content = pyproject_path.read_text()
-        content, n = re.subn(
-            r'^version = "[^"]+"',
-            f'version = "{new_version}"',
-            content,
-            count=1,
-            flags=re.MULTILINE,
-        )
-        if n != 1:
+        original = pyproject_path.read_text()
+        current_line = f'\nversion = "{self._get_current_version()}"'
+        if current_line not in original:
             raise ValueError("Could not locate [project].version in pyproject.toml")
-        pyproject_path.write_text(content)
-        print(f"✅ Updated version to {new_version} in pyproject.toml")
+        content = original.replace(current_line, f'\nversion = "{new_version}"', 1)
+        writes.append(
+            (
+                pyproject_path,
+                content,
+                f"✅ Updated version to {new_version} in pyproject.toml",
+            )
+        )
 
         # server.json: the MCP registry manifest carries the version twice (the
         # top-level field and each package entry). Use json load/dump so we touch
         # only the version fields and preserve formatting elsewhere.
         server_json_path = self.project_root / "server.json"
         if server_json_path.exists():
-            import json
-
             data = json.loads(server_json_path.read_text())
             data["version"] = new_version
             for package in data.get("packages", []):
                 if "version" in package:
                     package["version"] = new_version
-            server_json_path.write_text(json.dumps(data, indent=2) + "\n")
-            print(f"✅ Updated version to {new_version} in server.json")
+            writes.append(
+                (
+                    server_json_path,
+                    json.dumps(data, indent=2) + "\n",
+                    f"✅ Updated version to {new_version} in server.json",
+                )
+            )
 
-    def _update_changelog(self, version: str) -> None:
-        """Update CHANGELOG.md with new version."""
         changelog_path = self.project_root / "CHANGELOG.md"
-        if not changelog_path.exists():
+        if changelog_path.exists():
+            changelog = self._changelog_with_release(
+                changelog_path.read_text(), new_version
+            )
+            if changelog is not None:
+                writes.append(
+                    (
+                        changelog_path,
+                        changelog,
+                        f"✅ Updated CHANGELOG.md with version {new_version}",
+                    )
+                )
+        else:
             self.warnings.append("CHANGELOG.md not found!")
-            return
 
-        content = changelog_path.read_text()
+        with ThreadPoolExecutor(max_workers=_worker_count(len(writes))) as executor:
+            futures = [
+                executor.submit(_stage_file, path, text) for path, text, _ in writes
+            ]
+        staged = [f.result() for f in futures if f.exception() is None]
+        if len(staged) != len(writes):
+            for tmp_path in staged:
+                tmp_path.unlink(missing_ok=True)
+            raise next(e for f in futures if (e := f.exception()) is not None)
+
+        for tmp_path, (path, _, message) in zip(staged, writes, strict=True):
+            tmp_path.replace(path)
+            print(message)
+        self._pyproject_data = None
+
+    def _changelog_with_release(self, content: str, version: str) -> str | None:
+        """Return CHANGELOG.md content with Unreleased moved under ``version``.
 
+        Returns ``None`` (recording why) when there is nothing to change.
+        """
         # Check if version already exists
         if f"## [{version}]" in content:
             print(f"Version {version} already exists in CHANGELOG.md")
-            return
+            return None
 
         # Find the unreleased section
-        unreleased_pattern = (
-            r"## \[Unreleased\].*?\n(.*?)(?=\n## \[|\n\[unreleased\]|\Z)"
-        )
-        match = re.search(unreleased_pattern, content, re.DOTALL | re.IGNORECASE)
-
-        if match:
-            unreleased_content = match.group(1).strip()
-            if unreleased_content:
-                # Add new version section
-                import datetime
-
-                today = datetime.date.today().strftime("%Y-%m-%d")
-                new_section = f"\n## [{version}] - {today}\n\n{unreleased_content}\n"
-
-                # Replace unreleased section
-                content = re.sub(
-                    r"(## \[Unreleased\].*?\n).*?(?=\n## \[|\n\[unreleased\]|\Z)",
-                    r"\1\n" + new_section,
-                    content,
-                    flags=re.DOTALL | re.IGNORECASE,
-                )
-
-                changelog_path.write_text(content)
-                print(f"✅ Updated CHANGELOG.md with version {version}")
-            else:
-                self.warnings.append("No unreleased changes found in CHANGELOG.md")
-        else:
+        header = _UNRELEASED_HEADER_RE.search(content)
+        if not header:
             self.warnings.append("Could not find unreleased section in CHANGELOG.md")
-
-    def _create_git_tag(self, version: str, message: str | None = None) -> None:
-        """Create and push git tag."""
+            return None
+
+        body_start = header.end()
+        section_end = _SECTION_END_RE.search(content, body_start)
+        body_end = section_end.start() if section_end else len(content)
+        unreleased_content = content[body_start:body_end].strip()
+        if not unreleased_content:
+            self.warnings.append("No unreleased changes found in CHANGELOG.md")
+            return None
+
+        # Add new version section
+        import datetime
+
+        today = datetime.date.today().strftime("%Y-%m-%d")
+        new_section = f"\n## [{version}] - {today}\n\n{unreleased_content}\n"
+
+        # Replace unreleased section
+        return content[:body_start] + "\n" + new_section + content[body_end:]
+
+    @staticmethod
+    def _confirm(prompt: str, assume_yes: bool = False) -> bool:
+        """Ask a y/N question, or answer yes without prompting."""
+        return assume_yes or input(prompt).lower() == "y"
+
+    def _create_git_tag(
+        self,
+        version: str,
+        message: str | None = None,
+        *,
+        push: bool | None = None,
+    ) -> None:
+        """Create and push git tag.
+
+        ``push`` answers the push question up front; ``None`` asks.
+        """
         tag_name = f"v{version}"
 
         # Check if tag already exists
-        result = subprocess.run(
-            ["git", "tag", "-l", tag_name],
-            check=False,
-            capture_output=True,
-            text=True,
-            cwd=self.project_root,
-        )
-        if result.stdout.strip():
+        if self._tag_exists(tag_name):
             print(f"❌ Tag {tag_name} already exists!")
             return
 
@@ -154,13 +283,14 @@ class ReleasePreparation:
         else:
             cmd.extend(["-m", f"Release {version}"])
 
-        result = subprocess.run(cmd, check=False, cwd=self.project_root)
+        result = self._run(cmd, capture_stderr=True)
         if result.returncode == 0:
             print(f"✅ Created tag {tag_name}")
 
             # Ask if user wants to push
-            response = input(f"Push tag {tag_name} to origin? (y/N): ")
-            if response.lower() == "y":
+            if push is None:
+                push = self._confirm(f"Push tag {tag_name} to origin? (y/N): ")
+            if push:
                 push_result = subprocess.run(
                     ["git", "push", "origin", tag_name],
                     check=False,
@@ -172,44 +302,132 @@ class ReleasePreparation:
                     print(f"❌ Failed to push tag {tag_name}")
         else:
             print(f"❌ Failed to create tag {tag_name}")
+            print(result.stderr.decode(errors="replace").strip())
 
-    def prepare_release(self, skip_tests: bool = False) -> bool:
-        """Run all release preparation steps."""
+    def _tag_exists(self, tag_name: str) -> bool:
+        """Check whether a git tag exists, using only the exit status."""
+        result = self._run(
+            ["git", "rev-parse", "-q", "--verify", f"refs/tags/{tag_name}"]
+        )
+        return result.returncode == 0
+
+    def _run(
+        self,
+        cmd: list[str],
+        *,
+        capture_stdout: bool = False,
+        capture_stderr: bool = False,
+    ) -> subprocess.CompletedProcess[bytes]:
+        """Run a non-interactive command from the project root.
+
+        Most callers only look at the return code, so output is discarded
+        unless asked for, and what is kept stays as raw bytes.
+        """
+        return subprocess.run(
+            cmd,
+            check=False,
+            cwd=self.project_root,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+        )
+
+    def _say(self, message: str) -> None:
+        """Print a step message, buffered per step while steps run concurrently."""
+        lines = getattr(self._step_output, "lines", None)
+        if lines is None:
+            print(message)
+        else:
+            lines.append(message)
+
+    def _run_step(self, step_func: Callable[[], bool]) -> tuple[bool, list[str]]:
+        """Run one step in a worker thread, capturing what it prints."""
+        self._step_output.lines = []
+        try:
+            return step_func(), self._step_output.lines
+        finally:
+            self._step_output.lines = None
+
+    def _run_wave(
+        self,
+        steps: list[tuple[str, Callable[[], bool], bool]],
+        continue_on_error: bool = False,
+    ) -> bool:
+        """Run a wave of independent steps concurrently, reporting in order.
+
+        Every step is subprocess- or file-bound and only appends to the shared
+        error/warning lists, so threads overlap the child processes without
+        contention. When a step marked fatal fails, steps that have not started
+        yet are cancelled (unless ``continue_on_error``) and ``True`` is
+        returned so the caller can stop.
+        """
+        stop = False
+        with ThreadPoolExecutor(max_workers=_worker_count(len(steps))) as executor:
+            futures = [
+                (step_name, fatal, executor.submit(self._run_step, step_func))
+                for step_name, step_func, fatal in steps
+            ]
+            for step_name, fatal, future in futures:
+                if future.cancelled():
+                    sys.stdout.write(f"⏭️  {step_name} - SKIPPED\n\n")
+                    continue
+                success, output = future.result()
+                if not success and fatal and not continue_on_error:
+                    stop = True
+                    for _, _, pending in futures:
+                        pending.cancel()
+                status = "✅" if success else "❌"
+                verdict = "PASSED" if success else "FAILED"
+                # One write per step rather than one per line
+                block = [
+                    f"{step_name}...",
+                    *output,
+                    f"{status} {step_name} - {verdict}",
+                ]
+                sys.stdout.write("\n".join(block) + "\n\n")
+                sys.stdout.flush()
+        return stop
+
+    def prepare_release(
+        self, skip_tests: bool = False, continue_on_error: bool = False
+    ) -> bool:
+        """Run all release preparation steps.
+
+        A failing fatal step (configuration, tests, build) stops the run
+        instead of launching the remaining tools, unless ``continue_on_error``.
+        """
         print("🚀 Preparing Gopher & Gemini MCP Server Release")
         print("=" * 60)
         print()
 
-        steps = [
-            ("🔍 Validating Configuration", self._validate_configuration),
-            ("📋 Validating Changelog", self._validate_changelog),
-            ("🔢 Checking Version Consistency", self._check_version_consistency),
+        # Wave 1: quick file/config checks. Wave 2: the long-running tools
+        # (pytest, ruff/mypy, bandit, build), which dominate the wall clock.
+        # The third field marks steps whose failure makes the rest pointless.
+        checks = [
+            ("🔍 Validating Configuration", self._validate_configuration, True),
+            ("📋 Validating Changelog", self._validate_changelog, False),
+            ("🔢 Checking Version Consistency", self._check_version_consistency, False),
+            ("📚 Validating Documentation", self._validate_documentation, False),
+            ("🔧 Checking Dependencies", self._check_dependencies, False),
         ]
 
+        tools = []
         if not skip_tests:
-            steps.extend(
+            tools.extend(
                 [
-                    ("🧪 Running Tests", self._run_tests),
-                    ("📝 Checking Code Quality", self._check_code_quality),
-                    ("🔐 Security Scan", self._security_scan),
+                    ("🧪 Running Tests", self._run_tests, True),
+                    ("📝 Checking Code Quality", self._check_code_quality, False),
+                    ("🔐 Security Scan", self._security_scan, False),
                 ]
             )
+        tools.append(("📦 Building Package", self._build_package, True))
 
-        steps.extend(
-            [
-                ("📚 Validating Documentation", self._validate_documentation),
-                ("🔧 Checking Dependencies", self._check_dependencies),
-                ("📦 Building Package", self._build_package),
-            ]
-        )
-
-        for step_name, step_func in steps:
-            print(f"{step_name}...")
-            success = step_func()
-            if success:
-                print(f"✅ {step_name} - PASSED")
-            else:
-                print(f"❌ {step_name} - FAILED")
-            print()
+        for wave in (checks, tools):
+            if self._run_wave(wave, continue_on_error):
+                print(
+                    "⏹️  Stopping after a fatal failure (--continue-on-error to proceed)"
+                )
+                print()
+                break
 
         self._report_results()
         return len(self.errors) == 0
@@ -217,14 +435,11 @@ class ReleasePreparation:
     def _validate_configuration(self) -> bool:
         """Validate configuration settings."""
         try:
-            result = subprocess.run(
-                [sys.executable, "scripts/validate-config.py"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
-            return result.returncode == 0
+            result = self._run([sys.executable, "scripts/validate-config.py"])
+            if result.returncode != 0:
+                self.errors.append("Configuration validation failed")
+                return False
+            return True
         except Exception as e:
             self.errors.append(f"Configuration validation failed: {e}")
             return False
@@ -261,7 +476,7 @@ class ReleasePreparation:
                     )
                     return False
 
-            print(f"✅ Changelog entry found for version {current_version}")
+            self._say(f"✅ Changelog entry found for version {current_version}")
             return True
 
         except Exception as e:
@@ -278,23 +493,16 @@ class ReleasePreparation:
                 self.errors.append(f"Invalid version format: {current_version}")
                 return False
 
-            # Check for any git tags that might conflict
+            # Check for any git tags that might conflict. Outside a git repo the
+            # lookup simply fails; only a missing git binary raises.
             try:
-                result = subprocess.run(
-                    ["git", "tag", "-l", f"v{current_version}"],
-                    check=False,
-                    cwd=self.project_root,
-                    capture_output=True,
-                    text=True,
-                )
-                if result.stdout.strip():
+                if self._tag_exists(f"v{current_version}"):
                     self.warnings.append(f"Git tag v{current_version} already exists")
-
-            except subprocess.CalledProcessError:
-                # Git not available or not a git repo, skip tag check
+            except OSError:
+                # Git not available, skip tag check
                 pass
 
-            print(f"✅ Version {current_version} format is valid")
+            self._say(f"✅ Version {current_version} format is valid")
             return True
 
         except Exception as e:
@@ -302,67 +510,46 @@ class ReleasePreparation:
             return False
 
     def _run_tests(self) -> bool:
-        """Run comprehensive test suite."""
+        """Run comprehensive test suite.
+
+        One pytest run covers the whole suite with coverage. The conftest tags
+        each test's markers into the JUnit report, so failures are bucketed into
+        unit/integration afterwards instead of re-running (and re-collecting)
+        the suite once per marker expression.
+        """
         try:
-            # Run all tests with coverage
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "pytest",
-                    "tests/",
-                    "-v",
-                    "--cov=src/gopher_mcp",
-                    "--cov-fail-under=85",
-                ],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
+            with tempfile.TemporaryDirectory() as tmp:
+                junit_path = Path(tmp) / "junit.xml"
+                result = self._run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "pytest",
+                        "tests/",
+                        "--cov=src/gopher_mcp",
+                        "--cov-fail-under=85",
+                        f"--junitxml={junit_path}",
+                        "-o",
+                        "junit_family=xunit2",
+                    ]
+                )
+                failures = (
+                    _count_failures_by_category(junit_path)
+                    if junit_path.exists()
+                    else {}
+                )
 
             if result.returncode != 0:
-                self.errors.append("Test suite failed")
+                detail = ", ".join(
+                    f"{count} {category}" for category, count in failures.items()
+                )
+                self.errors.append(
+                    f"Test suite failed ({detail} failing)"
+                    if detail
+                    else "Test suite failed"
+                )
                 return False
 
-            # Check for specific test categories
-            test_results = []
-
-            # Unit tests
-            unit_result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "pytest",
-                    "tests/",
-                    "-v",
-                    "-m",
-                    "not integration and not slow",
-                ],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
-            test_results.append(("Unit tests", unit_result.returncode == 0))
-
-            # Integration tests (if any)
-            integration_result = subprocess.run(
-                [sys.executable, "-m", "pytest", "tests/", "-v", "-m", "integration"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
-            test_results.append(
-                ("Integration tests", integration_result.returncode == 0)
-            )
-
-            # Report test results
-            for test_type, passed in test_results:
-                if not passed:
-                    self.warnings.append(f"{test_type} had failures")
-
             return True
 
         except Exception as e:
@@ -370,34 +557,25 @@ class ReleasePreparation:
             return False
 
     def _check_code_quality(self) -> bool:
-        """Check code quality with linting and formatting."""
-        try:
-            # Run ruff linting
-            lint_result = subprocess.run(
-                [sys.executable, "-m", "ruff", "check", "src/", "tests/"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
+        """Check code quality with linting and formatting.
 
-            # Run ruff formatting check
-            format_result = subprocess.run(
-                [sys.executable, "-m", "ruff", "format", "--check", "src/", "tests/"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
-
-            # Run mypy type checking
-            mypy_result = subprocess.run(
-                [sys.executable, "-m", "mypy", "src/"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
+        ruff lint, ruff format and mypy read the same tree independently, so
+        they run side by side and the step takes as long as the slowest one.
+        """
+        try:
+            jobs = {
+                "lint": ["ruff", "check", "src/", "tests/"],
+                "format": ["ruff", "format", "--check", "src/", "tests/"],
+                "mypy": ["mypy", "src/"],
+            }
+            with ThreadPoolExecutor(max_workers=_worker_count(len(jobs))) as executor:
+                futures = {
+                    name: executor.submit(self._run, [sys.executable, "-m", *cmd])
+                    for name, cmd in jobs.items()
+                }
+            lint_result = futures["lint"].result()
+            format_result = futures["format"].result()
+            mypy_result = futures["mypy"].result()
 
             success = True
             if lint_result.returncode != 0:
@@ -428,10 +606,20 @@ class ReleasePreparation:
                 "config/example.env",
             ]
 
-            missing_docs = []
-            for doc in required_docs:
-                if not (self.project_root / doc).exists():
-                    missing_docs.append(doc)
+            # One directory listing per parent instead of one stat per file
+            present: dict[Path, set[str]] = {}
+            for parent in {Path(doc).parent for doc in required_docs}:
+                try:
+                    with os.scandir(self.project_root / parent) as entries:
+                        present[parent] = {entry.name for entry in entries}
+                except FileNotFoundError:
+                    present[parent] = set()
+
+            missing_docs = [
+                doc
+                for doc in required_docs
+                if Path(doc).name not in present[Path(doc).parent]
+            ]
 
             if missing_docs:
                 self.errors.append(
@@ -443,18 +631,9 @@ class ReleasePreparation:
             readme_path = self.project_root / "README.md"
             readme_content = readme_path.read_text()
 
-            required_sections = [
-                "Gopher & Gemini MCP Server",
-                "gopher_fetch",
-                "gemini_fetch",
-                "Configuration",
-                "Installation",
-            ]
-
-            missing_sections = []
-            for section in required_sections:
-                if section not in readme_content:
-                    missing_sections.append(section)
+            # Single pass over the README for all required markers
+            found = set(_README_SECTIONS_RE.findall(readme_content))
+            missing_sections = [s for s in _README_SECTIONS if s not in found]
 
             if missing_sections:
                 self.warnings.append(
@@ -471,28 +650,14 @@ class ReleasePreparation:
         """Check dependency status and security."""
         try:
             # Check for outdated dependencies
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "list", "--outdated"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
-
-            if result.stdout.strip():
+            if self._outdated_packages():
                 self.warnings.append("Some dependencies may be outdated")
 
             # Check pyproject.toml for version consistency
-            pyproject_path = self.project_root / "pyproject.toml"
-            if pyproject_path.exists():
-                content = pyproject_path.read_text()
-                if "version = " in content:
-                    # Extract version
-                    for line in content.split("\n"):
-                        if line.strip().startswith("version = "):
-                            version = line.split("=")[1].strip().strip("\"'")
-                            print(f"📋 Package version: {version}")
-                            break
+            if (self.project_root / "pyproject.toml").exists():
+                version = self._pyproject().get("project", {}).get("version")
+                if version:
+                    self._say(f"📋 Package version: {version}")
 
             return True
 
@@ -500,25 +665,71 @@ class ReleasePreparation:
             self.warnings.append(f"Dependency check failed: {e}")
             return True  # Non-critical
 
+    def _outdated_packages(self) -> list[dict]:
+        """List outdated distributions, reusing a recent cached answer.
+
+        The cached answer is only reused for the same environment: its key
+        covers the interpreter, every installed distribution's version and
+        the lockfile, so a ``uv sync`` or pip upgrade invalidates it at once.
+        """
+        key = self._environment_key()
+        try:
+            if time.time() - _OUTDATED_CACHE_PATH.stat().st_mtime < _OUTDATED_CACHE_TTL:
+                cached = json.loads(_OUTDATED_CACHE_PATH.read_bytes())
+                if cached.get("key") == key:
+                    return cached["packages"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        result = self._run(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "list",
+                "--outdated",
+                "--format=json",
+                "--timeout=10",
+            ],
+            capture_stdout=True,
+        )
+        if result.returncode != 0:
+            return []
+        packages = json.loads(result.stdout or b"[]")
+
+        try:
+            _OUTDATED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _OUTDATED_CACHE_PATH.write_text(
+                json.dumps({"key": key, "packages": packages})
+            )
+        except OSError:
+            pass  # Caching is best effort
+        return packages
+
+    def _environment_key(self) -> str:
+        """Hash the interpreter, installed distributions and ``uv.lock``."""
+        digest = hashlib.sha256(sys.executable.encode())
+        installed = sorted(
+            f"{dist.metadata['Name']}=={dist.version}"
+            for dist in importlib.metadata.distributions()
+        )
+        digest.update("\n".join(installed).encode())
+        lockfile = self.project_root / "uv.lock"
+        if lockfile.is_file():
+            digest.update(lockfile.read_bytes())
+        return digest.hexdigest()
+
     def _build_package(self) -> bool:
         """Build the package to verify it can be built."""
         try:
-            # Clean previous builds
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "--upgrade", "build"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-            )
+            # Only hit the package index when the build frontend is missing
+            try:
+                importlib.metadata.version("build")
+            except importlib.metadata.PackageNotFoundError:
+                self._run([sys.executable, "-m", "pip", "install", "build"])
 
             # Build package
-            result = subprocess.run(
-                [sys.executable, "-m", "build"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
+            result = self._run([sys.executable, "-m", "build"])
 
             if result.returncode != 0:
                 self.errors.append("Package build failed")
@@ -526,7 +737,7 @@ class ReleasePreparation:
 
             # Check if build artifacts exist
             dist_dir = self.project_root / "dist"
-            if not dist_dir.exists() or not list(dist_dir.glob("*.whl")):
+            if not dist_dir.exists() or next(dist_dir.glob("*.whl"), None) is None:
                 self.errors.append("Build artifacts not found")
                 return False
 
@@ -537,20 +748,32 @@ class ReleasePreparation:
             return False
 
     def _security_scan(self) -> bool:
-        """Run security scans."""
+        """Run security scans.
+
+        Only HIGH and MEDIUM severity findings are reported; LOW findings are
+        too noisy to act on at release time.
+        """
         try:
             # Try to run bandit security scan
-            result = subprocess.run(
-                [sys.executable, "-m", "bandit", "-r", "src/", "-f", "json"],
-                check=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
+            result = self._run(
+                [sys.executable, "-m", "bandit", "-r", "src/", "-f", "json", "-q"],
+                capture_stdout=True,
             )
-
-            # Bandit returns non-zero for issues, but we'll treat as warnings
-            if result.returncode != 0:
-                self.warnings.append("Security scan found potential issues")
+            if not result.stdout:
+                # `python -m bandit` exits non-zero with nothing on stdout
+                # when the module is missing
+                raise FileNotFoundError("bandit")
+
+            report = json.loads(result.stdout)
+            serious = sum(
+                1
+                for issue in report.get("results", [])
+                if issue.get("issue_severity") in ("HIGH", "MEDIUM")
+            )
+            if serious:
+                self.warnings.append(
+                    f"Security scan found {serious} HIGH/MEDIUM severity issue(s)"
+                )
 
             return True
 
@@ -562,45 +785,64 @@ class ReleasePreparation:
             return True  # Non-critical
 
     def _report_results(self):
-        """Report final results."""
-        print("=" * 60)
-        print("📊 RELEASE PREPARATION RESULTS")
-        print("=" * 60)
+        """Report final results, written to stdout in one go."""
+        lines = ["=" * 60, "📊 RELEASE PREPARATION RESULTS", "=" * 60]
 
         if self.errors:
-            print(f"❌ {len(self.errors)} ERROR(S) FOUND:")
+            lines.append(f"❌ {len(self.errors)} ERROR(S) FOUND:")
             for i, error in enumerate(self.errors, 1):
-                print(f"  {i}. {error}")
-            print()
+                lines.append(f"  {i}. {error}")
+            lines.append("")
 
         if self.warnings:
-            print(f"⚠️  {len(self.warnings)} WARNING(S) FOUND:")
+            lines.append(f"⚠️  {len(self.warnings)} WARNING(S) FOUND:")
             for i, warning in enumerate(self.warnings, 1):
-                print(f"  {i}. {warning}")
-            print()
+                lines.append(f"  {i}. {warning}")
+            lines.append("")
 
         if not self.errors and not self.warnings:
-            print("✅ Release preparation completed successfully!")
-            print("🎉 Ready for release!")
+            lines.extend(
+                [
+                    "✅ Release preparation completed successfully!",
+                    "🎉 Ready for release!",
+                ]
+            )
         elif not self.errors:
-            print("✅ Release preparation completed with warnings")
-            print("⚠️  Review warnings before proceeding with release")
+            lines.extend(
+                [
+                    "✅ Release preparation completed with warnings",
+                    "⚠️  Review warnings before proceeding with release",
+                ]
+            )
         else:
-            print("❌ Release preparation failed")
-            print("🔧 Fix errors before attempting release")
+            lines.extend(
+                [
+                    "❌ Release preparation failed",
+                    "🔧 Fix errors before attempting release",
+                ]
+            )
 
-        print()
-        print("📋 Next steps:")
+        lines.extend(["", "📋 Next steps:"])
         if not self.errors:
-            print("  1. Review any warnings above")
-            print("  2. Update CHANGELOG.md with release notes")
-            print("  3. Create and push git tag")
-            print("  4. Upload to PyPI (if applicable)")
-            print("  5. Create GitHub release")
+            lines.extend(
+                [
+                    "  1. Review any warnings above",
+                    "  2. Update CHANGELOG.md with release notes",
+                    "  3. Create and push git tag",
+                    "  4. Upload to PyPI (if applicable)",
+                    "  5. Create GitHub release",
+                ]
+            )
         else:
-            print("  1. Fix all errors listed above")
-            print("  2. Re-run release preparation")
-            print("  3. Proceed with release when all checks pass")
+            lines.extend(
+                [
+                    "  1. Fix all errors listed above",
+                    "  2. Re-run release preparation",
+                    "  3. Proceed with release when all checks pass",
+                ]
+            )
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -610,6 +852,20 @@ def main():
     parser.add_argument("--skip-tests", action="store_true", help="Skip running tests")
     parser.add_argument("--skip-tag", action="store_true", help="Skip creating git tag")
     parser.add_argument("--tag-message", "-m", help="Tag message")
+    parser.add_argument(
+        "--yes",
+        "-y",
+        action="store_true",
+        help="Answer yes to the version-update and tag prompts (for CI)",
+    )
+    parser.add_argument(
+        "--push", action="store_true", help="Push the created tag to origin"
+    )
+    parser.add_argument(
+        "--continue-on-error",
+        action="store_true",
+        help="Keep running the remaining steps after a fatal failure",
+    )
 
     args = parser.parse_args()
 
@@ -626,19 +882,24 @@ def main():
         print(f"Current version: {current_version}")
         print(f"New version: {args.version}")
 
-        response = input("Update version? (y/N): ")
-        if response.lower() == "y":
-            prep._update_version(args.version)
-            prep._update_changelog(args.version)
+        if prep._confirm("Update version? (y/N): ", args.yes):
+            prep._apply_version_bump(args.version)
 
     # Run release preparation
-    success = prep.prepare_release(skip_tests=args.skip_tests)
+    success = prep.prepare_release(
+        skip_tests=args.skip_tests, continue_on_error=args.continue_on_error
+    )
 
     # Create git tag if requested and successful
-    if success and args.version and not args.skip_tag:
-        response = input(f"Create git tag v{args.version}? (y/N): ")
-        if response.lower() == "y":
-            prep._create_git_tag(args.version, args.tag_message)
+    if (
+        success
+        and args.version
+        and not args.skip_tag
+        and prep._confirm(f"Create git tag v{args.version}? (y/N): ", args.yes)
+    ):
+        # --push pushes; --yes alone never pushes without being asked to
+        push = True if args.push else (False if args.yes else None)
+        prep._create_git_tag(args.version, args.tag_message, push=push)
 
     sys.exit(0 if success else 1)
 
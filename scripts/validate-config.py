@@ -6,16 +6,90 @@ This script validates environment variables and configuration settings
 to ensure they are properly formatted and within acceptable ranges.
 """
 
+import argparse
 import os
+import stat
+import string
 import sys
 from pathlib import Path
 from typing import Any
 
+# Deletes every character allowed in a hostname; anything left over is invalid
+_STRIP_HOSTNAME_CHARS = str.maketrans(
+    "", "", string.ascii_letters + string.digits + ".-"
+)
+
+_BOOL_VALUES = frozenset({"true", "false", "1", "0", "yes", "no", "on", "off"})
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_TLS_VERSIONS = frozenset({"TLSv1.2", "TLSv1.3"})
+
+_RangeSpec = tuple[str, type[int] | type[float], float, float]
+
 
 class ConfigValidator:
     """Validates configuration settings for the MCP server."""
 
-    def __init__(self) -> None:
+    # (environment variable, default, kind); the config key is the lowercased
+    # name. "bool" values are lowercased and "enum" values uppercased on load,
+    # so validators compare them as-is.
+    _SCHEMA: tuple[tuple[str, str, str], ...] = (
+        # Gopher configuration
+        ("GOPHER_MAX_RESPONSE_SIZE", "1048576", ""),
+        ("GOPHER_TIMEOUT_SECONDS", "30", ""),
+        ("GOPHER_CACHE_ENABLED", "true", "bool"),
+        ("GOPHER_CACHE_TTL_SECONDS", "300", ""),
+        ("GOPHER_MAX_CACHE_ENTRIES", "1000", ""),
+        ("GOPHER_ALLOWED_HOSTS", "", ""),
+        ("GOPHER_MAX_SELECTOR_LENGTH", "1024", ""),
+        ("GOPHER_MAX_SEARCH_LENGTH", "256", ""),
+        # Gemini configuration
+        ("GEMINI_MAX_RESPONSE_SIZE", "1048576", ""),
+        ("GEMINI_TIMEOUT_SECONDS", "30", ""),
+        ("GEMINI_CACHE_ENABLED", "true", "bool"),
+        ("GEMINI_CACHE_TTL_SECONDS", "300", ""),
+        ("GEMINI_MAX_CACHE_ENTRIES", "1000", ""),
+        ("GEMINI_ALLOWED_HOSTS", "", ""),
+        ("GEMINI_TOFU_ENABLED", "true", "bool"),
+        ("GEMINI_CLIENT_CERTS_ENABLED", "true", "bool"),
+        ("GEMINI_TOFU_STORAGE_PATH", "", ""),
+        ("GEMINI_CLIENT_CERT_STORAGE_PATH", "", ""),
+        # TLS configuration
+        ("GEMINI_TLS_VERSION", "TLSv1.2", ""),
+        ("GEMINI_TLS_VERIFY_HOSTNAME", "true", "bool"),
+        ("GEMINI_TLS_CLIENT_CERT_PATH", "", ""),
+        ("GEMINI_TLS_CLIENT_KEY_PATH", "", ""),
+        # Other configuration
+        ("LOG_LEVEL", "INFO", "enum"),
+        ("STRUCTURED_LOGGING", "true", "bool"),
+        ("LOG_FILE_PATH", "", ""),
+        ("DEVELOPMENT_MODE", "false", "bool"),
+        ("STRICT_HOST_VALIDATION", "false", "bool"),
+        ("MAX_REDIRECTS", "5", ""),
+        ("MAX_CONCURRENT_CONNECTIONS", "10", ""),
+    )
+
+    # (environment variable, type, minimum, maximum) for each numeric setting
+    _GOPHER_RANGES: tuple[_RangeSpec, ...] = (
+        ("GOPHER_MAX_RESPONSE_SIZE", int, 1024, 100 * 1024 * 1024),
+        ("GOPHER_TIMEOUT_SECONDS", float, 1.0, 300.0),
+        ("GOPHER_CACHE_TTL_SECONDS", int, 1, 86400),
+        ("GOPHER_MAX_CACHE_ENTRIES", int, 1, 100000),
+        ("GOPHER_MAX_SELECTOR_LENGTH", int, 1, 8192),
+        ("GOPHER_MAX_SEARCH_LENGTH", int, 1, 2048),
+    )
+    _GEMINI_RANGES: tuple[_RangeSpec, ...] = (
+        ("GEMINI_MAX_RESPONSE_SIZE", int, 1024, 100 * 1024 * 1024),
+        ("GEMINI_TIMEOUT_SECONDS", float, 1.0, 300.0),
+        ("GEMINI_CACHE_TTL_SECONDS", int, 1, 86400),
+        ("GEMINI_MAX_CACHE_ENTRIES", int, 1, 100000),
+    )
+    _SECURITY_RANGES: tuple[_RangeSpec, ...] = (("MAX_REDIRECTS", int, 0, 20),)
+    _PERFORMANCE_RANGES: tuple[_RangeSpec, ...] = (
+        ("MAX_CONCURRENT_CONNECTIONS", int, 1, 100),
+    )
+
+    def __init__(self, fail_fast: bool = False) -> None:
+        self.fail_fast = fail_fast
         self.errors: list[str] = []
         self.warnings: list[str] = []
         self.config: dict[str, Any] = {}
@@ -28,13 +102,19 @@ class ConfigValidator:
         # Load environment variables
         self._load_config()
 
-        # Validate each category
-        self._validate_gopher_config()
-        self._validate_gemini_config()
-        self._validate_tls_config()
-        self._validate_logging_config()
-        self._validate_security_config()
-        self._validate_performance_config()
+        # Validate each category, stopping at the first one with errors when
+        # failing fast
+        for validate in (
+            self._validate_gopher_config,
+            self._validate_gemini_config,
+            self._validate_tls_config,
+            self._validate_logging_config,
+            self._validate_security_config,
+            self._validate_performance_config,
+        ):
+            validate()
+            if self.errors and self.fail_fast:
+                break
 
         # Report results
         self._report_results()
@@ -43,113 +123,22 @@ class ConfigValidator:
 
     def _load_config(self):
         """Load configuration from environment variables."""
-        # Gopher configuration
-        self.config.update(
-            {
-                "gopher_max_response_size": os.getenv(
-                    "GOPHER_MAX_RESPONSE_SIZE", "1048576"
-                ),
-                "gopher_timeout_seconds": os.getenv("GOPHER_TIMEOUT_SECONDS", "30"),
-                "gopher_cache_enabled": os.getenv("GOPHER_CACHE_ENABLED", "true"),
-                "gopher_cache_ttl_seconds": os.getenv(
-                    "GOPHER_CACHE_TTL_SECONDS", "300"
-                ),
-                "gopher_max_cache_entries": os.getenv(
-                    "GOPHER_MAX_CACHE_ENTRIES", "1000"
-                ),
-                "gopher_allowed_hosts": os.getenv("GOPHER_ALLOWED_HOSTS", ""),
-                "gopher_max_selector_length": os.getenv(
-                    "GOPHER_MAX_SELECTOR_LENGTH", "1024"
-                ),
-                "gopher_max_search_length": os.getenv(
-                    "GOPHER_MAX_SEARCH_LENGTH", "256"
-                ),
-            }
-        )
-
-        # Gemini configuration
-        self.config.update(
-            {
-                "gemini_max_response_size": os.getenv(
-                    "GEMINI_MAX_RESPONSE_SIZE", "1048576"
-                ),
-                "gemini_timeout_seconds": os.getenv("GEMINI_TIMEOUT_SECONDS", "30"),
-                "gemini_cache_enabled": os.getenv("GEMINI_CACHE_ENABLED", "true"),
-                "gemini_cache_ttl_seconds": os.getenv(
-                    "GEMINI_CACHE_TTL_SECONDS", "300"
-                ),
-                "gemini_max_cache_entries": os.getenv(
-                    "GEMINI_MAX_CACHE_ENTRIES", "1000"
-                ),
-                "gemini_allowed_hosts": os.getenv("GEMINI_ALLOWED_HOSTS", ""),
-                "gemini_tofu_enabled": os.getenv("GEMINI_TOFU_ENABLED", "true"),
-                "gemini_client_certs_enabled": os.getenv(
-                    "GEMINI_CLIENT_CERTS_ENABLED", "true"
-                ),
-                "gemini_tofu_storage_path": os.getenv("GEMINI_TOFU_STORAGE_PATH", ""),
-                "gemini_client_cert_storage_path": os.getenv(
-                    "GEMINI_CLIENT_CERT_STORAGE_PATH", ""
-                ),
-            }
-        )
-
-        # TLS configuration
-        self.config.update(
-            {
-                "gemini_tls_version": os.getenv("GEMINI_TLS_VERSION", "TLSv1.2"),
-                "gemini_tls_verify_hostname": os.getenv(
-                    "GEMINI_TLS_VERIFY_HOSTNAME", "true"
-                ),
-                "gemini_tls_client_cert_path": os.getenv(
-                    "GEMINI_TLS_CLIENT_CERT_PATH", ""
-                ),
-                "gemini_tls_client_key_path": os.getenv(
-                    "GEMINI_TLS_CLIENT_KEY_PATH", ""
-                ),
-            }
-        )
-
-        # Other configuration
-        self.config.update(
-            {
-                "log_level": os.getenv("LOG_LEVEL", "INFO"),
-                "structured_logging": os.getenv("STRUCTURED_LOGGING", "true"),
-                "log_file_path": os.getenv("LOG_FILE_PATH", ""),
-                "development_mode": os.getenv("DEVELOPMENT_MODE", "false"),
-                "strict_host_validation": os.getenv("STRICT_HOST_VALIDATION", "false"),
-                "max_redirects": os.getenv("MAX_REDIRECTS", "5"),
-                "max_concurrent_connections": os.getenv(
-                    "MAX_CONCURRENT_CONNECTIONS", "10"
-                ),
-            }
-        )
+        # The environment cannot change mid-run; read it once
+        env = os.environ.copy()
+        for env_var, default, kind in self._SCHEMA:
+            value = env.get(env_var, default)
+            if kind == "bool":
+                value = value.lower()
+            elif kind == "enum":
+                value = value.upper()
+            self.config[env_var.lower()] = value
 
     def _validate_gopher_config(self):
         """Validate Gopher protocol configuration."""
         print("📡 Validating Gopher configuration...")
 
         # Validate numeric values
-        self._validate_positive_int(
-            "gopher_max_response_size",
-            "GOPHER_MAX_RESPONSE_SIZE",
-            1024,
-            100 * 1024 * 1024,
-        )
-        self._validate_positive_float(
-            "gopher_timeout_seconds", "GOPHER_TIMEOUT_SECONDS", 1.0, 300.0
-        )
-        self._validate_positive_int(
-            "gopher_cache_ttl_seconds", "GOPHER_CACHE_TTL_SECONDS", 1, 86400
-        )
-        self._validate_positive_int(
-            "gopher_max_cache_entries", "GOPHER_MAX_CACHE_ENTRIES", 1, 100000
-        )
-        self._validate_positive_int(
-            "gopher_max_selector_length", "GOPHER_MAX_SELECTOR_LENGTH", 1, 8192
-        )
-        self._validate_positive_int(
-            "gopher_max_search_length", "GOPHER_MAX_SEARCH_LENGTH", 1, 2048
-        )
+        self._validate_ranges(self._GOPHER_RANGES)
 
         # Validate boolean values
         self._validate_boolean("gopher_cache_enabled", "GOPHER_CACHE_ENABLED")
@@ -162,21 +151,7 @@ class ConfigValidator:
         print("🔐 Validating Gemini configuration...")
 
         # Validate numeric values
-        self._validate_positive_int(
-            "gemini_max_response_size",
-            "GEMINI_MAX_RESPONSE_SIZE",
-            1024,
-            100 * 1024 * 1024,
-        )
-        self._validate_positive_float(
-            "gemini_timeout_seconds", "GEMINI_TIMEOUT_SECONDS", 1.0, 300.0
-        )
-        self._validate_positive_int(
-            "gemini_cache_ttl_seconds", "GEMINI_CACHE_TTL_SECONDS", 1, 86400
-        )
-        self._validate_positive_int(
-            "gemini_max_cache_entries", "GEMINI_MAX_CACHE_ENTRIES", 1, 100000
-        )
+        self._validate_ranges(self._GEMINI_RANGES)
 
         # Validate boolean values
         self._validate_boolean("gemini_cache_enabled", "GEMINI_CACHE_ENABLED")
@@ -202,7 +177,7 @@ class ConfigValidator:
 
         # Validate TLS version
         tls_version = self.config["gemini_tls_version"]
-        if tls_version not in ["TLSv1.2", "TLSv1.3"]:
+        if tls_version not in _TLS_VERSIONS:
             self.errors.append(
                 f"GEMINI_TLS_VERSION must be 'TLSv1.2' or 'TLSv1.3', got: {tls_version}"
             )
@@ -235,8 +210,8 @@ class ConfigValidator:
         print("📝 Validating logging configuration...")
 
         # Validate log level
-        log_level = self.config["log_level"].upper()
-        if log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
+        log_level = self.config["log_level"]
+        if log_level not in _LOG_LEVELS:
             self.errors.append(
                 f"LOG_LEVEL must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL, got: {log_level}"
             )
@@ -260,53 +235,36 @@ class ConfigValidator:
         self._validate_boolean("strict_host_validation", "STRICT_HOST_VALIDATION")
 
         # Validate max redirects
-        self._validate_positive_int("max_redirects", "MAX_REDIRECTS", 0, 20)
+        self._validate_ranges(self._SECURITY_RANGES)
 
     def _validate_performance_config(self):
         """Validate performance configuration."""
         print("⚡ Validating performance configuration...")
 
         # Validate connection limits
-        self._validate_positive_int(
-            "max_concurrent_connections", "MAX_CONCURRENT_CONNECTIONS", 1, 100
-        )
-
-    def _validate_positive_int(
-        self, key: str, env_var: str, min_val: int, max_val: int
-    ):
-        """Validate a positive integer value."""
-        try:
-            value = int(self.config[key])
-            if value < min_val or value > max_val:
-                self.errors.append(
-                    f"{env_var} must be between {min_val} and {max_val}, got: {value}"
-                )
-        except ValueError:
-            self.errors.append(
-                f"{env_var} must be a valid integer, got: {self.config[key]}"
-            )
-
-    def _validate_positive_float(
-        self, key: str, env_var: str, min_val: float, max_val: float
-    ):
-        """Validate a positive float value."""
-        try:
-            value = float(self.config[key])
+        self._validate_ranges(self._PERFORMANCE_RANGES)
+
+    def _validate_ranges(self, specs: tuple[_RangeSpec, ...]):
+        """Validate numeric values against their allowed ranges."""
+        for env_var, cast, min_val, max_val in specs:
+            raw = self.config[env_var.lower()]
+            try:
+                value = cast(raw)
+            except ValueError:
+                kind = "integer" if cast is int else "number"
+                self.errors.append(f"{env_var} must be a valid {kind}, got: {raw}")
+                continue
             if value < min_val or value > max_val:
                 self.errors.append(
                     f"{env_var} must be between {min_val} and {max_val}, got: {value}"
                 )
-        except ValueError:
-            self.errors.append(
-                f"{env_var} must be a valid number, got: {self.config[key]}"
-            )
 
     def _validate_boolean(self, key: str, env_var: str):
         """Validate a boolean value."""
-        value = self.config[key].lower()
-        if value not in ["true", "false", "1", "0", "yes", "no", "on", "off"]:
+        value = self.config[key]
+        if value not in _BOOL_VALUES:
             self.errors.append(
-                f"{env_var} must be a boolean value (true/false, 1/0, yes/no, on/off), got: {self.config[key]}"
+                f"{env_var} must be a boolean value (true/false, 1/0, yes/no, on/off), got: {value}"
             )
 
     def _validate_host_list(self, key: str, env_var: str):
@@ -335,7 +293,12 @@ class ConfigValidator:
             return
 
         path_obj = Path(path)
-        if path_obj.exists() and not path_obj.is_dir() and not path_obj.suffix:
+        # One stat answers both "exists" and "is a directory"
+        try:
+            mode = path_obj.stat().st_mode
+        except OSError:
+            return
+        if not stat.S_ISDIR(mode) and not path_obj.suffix:
             # If it exists and is not a directory and has no extension, assume it should be a directory
             self.warnings.append(
                 f"{env_var} points to existing file, expected directory: {path}"
@@ -347,45 +310,54 @@ class ConfigValidator:
             return False
         if hostname.startswith(".") or hostname.endswith("."):
             return False
-        allowed = set(
-            "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-"
-        )
-        return all(c in allowed for c in hostname)
+        return not hostname.translate(_STRIP_HOSTNAME_CHARS)
 
     def _report_results(self):
-        """Report validation results."""
-        print()
-        print("=" * 60)
-        print("📊 VALIDATION RESULTS")
-        print("=" * 60)
+        """Report validation results, written to stdout in one go."""
+        lines = ["", "=" * 60, "📊 VALIDATION RESULTS", "=" * 60]
 
         if self.errors:
-            print(f"❌ {len(self.errors)} ERROR(S) FOUND:")
-            for i, error in enumerate(self.errors, 1):
-                print(f"  {i}. {error}")
-            print()
+            lines.append(f"❌ {len(self.errors)} ERROR(S) FOUND:")
+            lines.extend(f"  {i}. {error}" for i, error in enumerate(self.errors, 1))
+            lines.append("")
 
         if self.warnings:
-            print(f"⚠️  {len(self.warnings)} WARNING(S) FOUND:")
-            for i, warning in enumerate(self.warnings, 1):
-                print(f"  {i}. {warning}")
-            print()
+            lines.append(f"⚠️  {len(self.warnings)} WARNING(S) FOUND:")
+            lines.extend(
+                f"  {i}. {warning}" for i, warning in enumerate(self.warnings, 1)
+            )
+            lines.append("")
 
         if not self.errors and not self.warnings:
-            print("✅ All configuration settings are valid!")
+            lines.append("✅ All configuration settings are valid!")
         elif not self.errors:
-            print("✅ Configuration is valid (with warnings)")
+            lines.append("✅ Configuration is valid (with warnings)")
         else:
-            print("❌ Configuration validation failed")
-
-        print()
-        print("💡 TIP: See config/example.env for configuration examples")
-        print("📖 DOC: See docs/ directory for detailed documentation")
+            lines.append("❌ Configuration validation failed")
+
+        lines.extend(
+            [
+                "",
+                "💡 TIP: See config/example.env for configuration examples",
+                "📖 DOC: See docs/ directory for detailed documentation",
+            ]
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def main():
     """Main entry point."""
-    validator = ConfigValidator()
+    parser = argparse.ArgumentParser(description="Validate server configuration")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        default=os.getenv("FAIL_FAST", "").lower() in ("1", "true", "yes", "on"),
+        help="Stop after the first category with errors (or set FAIL_FAST=1)",
+    )
+    args = parser.parse_args()
+
+    validator = ConfigValidator(fail_fast=args.fail_fast)
     success = validator.validate_all()
     sys.exit(0 if success else 1)
 
@@ -7,10 +7,29 @@ It checks code quality, tests, security, and functionality.
 """
 
 import asyncio
+import contextlib
+import hashlib
+import importlib.util
+import io
+import os
+import shutil
 import subprocess
 import sys
 import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
+
+# Per-task output buffer, so validations running side by side don't interleave
+_output: ContextVar[list[str] | None] = ContextVar("_output", default=None)
+
+# Run tools from the interpreter this script runs under (the project env when
+# launched via `uv run`) instead of re-resolving the environment per command
+_PYTHON = sys.executable
+
+# Files whose changes can affect any tool result (dependency pins, tool config)
+_ALWAYS_INPUTS = ("pyproject.toml", "uv.lock")
 
 
 class ReleaseValidator:
@@ -20,180 +39,311 @@ class ReleaseValidator:
         self.project_root = Path(__file__).parent.parent
         self.passed_checks: list[str] = []
         self.failed_checks: list[str] = []
+        # Bound concurrent tool processes to the available cores
+        self._process_slots = asyncio.Semaphore(os.cpu_count() or 1)
+        self._cache_dir = self.project_root / ".validation-cache"
+
+    def say(self, message: str = "") -> None:
+        """Print a message, or buffer it while running as a concurrent task."""
+        lines = _output.get()
+        if lines is None:
+            print(message)
+        else:
+            lines.append(message)
+
+    async def _spawn(
+        self, argv: list[str], **kwargs: Any
+    ) -> asyncio.subprocess.Process:
+        """Start a child process in the project root.
+
+        The executable is resolved once with ``shutil.which``, and ``cwd`` is
+        only passed when the script runs from outside the project root.
+        """
+        executable = shutil.which(argv[0]) or argv[0]
+        in_root = Path.cwd().resolve() == self.project_root.resolve()
+        return await asyncio.create_subprocess_exec(
+            executable,
+            *argv[1:],
+            cwd=None if in_root else self.project_root,
+            **kwargs,
+        )
 
-    def run_command(self, command: str, description: str) -> tuple[bool, str]:
-        """Run a shell command and return success status and output."""
-        print(f"🔍 {description}...")
+    async def _git(self, *args: str) -> bytes | None:
+        """Run a git query and return its stdout, or None if git fails."""
         try:
-            # Split command into list for safer execution
-            import shlex
-
-            command_list = shlex.split(command)
-            result = subprocess.run(
-                command_list,
-                check=False,
-                shell=False,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
+            process = await self._spawn(
+                ["git", *args], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
             )
+        except OSError:
+            return None  # git not installed
+        stdout, _ = await process.communicate()
+        return stdout if process.returncode == 0 else None
+
+    async def _cache_key(self, argv: list[str], inputs: list[str]) -> str | None:
+        """Key a command's result on the committed state of its inputs.
+
+        Returns None (don't cache) when any input has uncommitted changes,
+        since the committed tree would then not describe what the tool saw.
+        """
+        paths = [*inputs, *_ALWAYS_INPUTS]
+        status = await self._git("status", "--porcelain", "--", *paths)
+        if status is None or status.strip():
+            return None
+        tree = await self._git("ls-tree", "-r", "HEAD", "--", *paths)
+        if tree is None:
+            return None
+        digest = hashlib.sha256("\0".join(argv).encode())
+        digest.update(tree)
+        return digest.hexdigest()
+
+    async def run_command(
+        self, argv: list[str], description: str, inputs: list[str] | None = None
+    ) -> tuple[bool, str]:
+        """Run a command and return success status and its error output.
+
+        Nothing reads a tool's stdout (pytest -v alone can produce megabytes),
+        so it is discarded rather than buffered; only stderr is kept for the
+        failure report.
+
+        When ``inputs`` lists the paths a command depends on, a pass is
+        remembered under ``.validation-cache/`` and reused until they change.
+        """
+        self.say(f"🔍 {description}...")
+        cache_key = await self._cache_key(argv, inputs) if inputs else None
+        marker = self._cache_dir / f"{cache_key}.pass" if cache_key else None
+        if marker is not None and marker.exists():
+            self.say(f"✅ {description} - PASSED (cached)")
+            self.passed_checks.append(description)
+            return True, ""
 
-            if result.returncode == 0:
-                print(f"✅ {description} - PASSED")
+        try:
+            async with self._process_slots:
+                process = await self._spawn(
+                    argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+                )
+                try:
+                    _, stderr = await asyncio.wait_for(
+                        process.communicate(),
+                        timeout=300,  # 5 minute timeout
+                    )
+                except TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    raise
+
+            if process.returncode == 0:
+                if marker is not None:
+                    self._cache_dir.mkdir(exist_ok=True)
+                    marker.touch()
+                self.say(f"✅ {description} - PASSED")
                 self.passed_checks.append(description)
-                return True, result.stdout
+                return True, ""
             else:
-                print(f"❌ {description} - FAILED")
-                print(f"Error: {result.stderr}")
+                error = stderr.decode(errors="replace")
+                self.say(f"❌ {description} - FAILED")
+                self.say(f"Error: {error}")
                 self.failed_checks.append(description)
-                return False, result.stderr
+                return False, error
 
-        except subprocess.TimeoutExpired:
-            print(f"⏰ {description} - TIMEOUT")
+        except TimeoutError:
+            self.say(f"⏰ {description} - TIMEOUT")
             self.failed_checks.append(f"{description} (timeout)")
             return False, "Command timed out"
         except Exception as e:
-            print(f"💥 {description} - ERROR: {e}")
+            self.say(f"💥 {description} - ERROR: {e}")
             self.failed_checks.append(f"{description} (error)")
             return False, str(e)
 
-    def validate_tests(self) -> bool:
+    async def validate_tests(self) -> bool:
         """Validate test suite."""
-        print("\n📋 TESTING VALIDATION")
-        print("=" * 50)
-
-        # Run test suite
-        success, _ = self.run_command(
-            "python -m pytest tests/ -v --tb=short", "Test suite execution"
-        )
+        self.say("\n📋 TESTING VALIDATION")
+        self.say("=" * 50)
+
+        # One run both executes the suite and enforces coverage
+        argv = [
+            _PYTHON,
+            "-m",
+            "pytest",
+            "tests/",
+            "-v",
+            "--tb=short",
+            "--cov=src",
+            "--cov-report=term-missing",
+            "--cov-fail-under=85",
+            # Shard across cores like the ``test`` task; loadfile keeps a
+            # module's fixtures on one worker
+            "-n",
+            "auto",
+            "--dist=loadfile",
+        ]
 
-        # Check test coverage
-        coverage_success, _coverage_output = self.run_command(
-            "python -m pytest --cov=src --cov-report=term-missing --cov-fail-under=85",
-            "Test coverage check",
+        success, _ = await self.run_command(
+            argv, "Test suite and coverage check", inputs=["src", "tests"]
         )
+        return success
 
-        return success and coverage_success
-
-    def validate_code_quality(self) -> bool:
+    async def validate_code_quality(self) -> bool:
         """Validate code quality."""
-        print("\n🔧 CODE QUALITY VALIDATION")
-        print("=" * 50)
+        self.say("\n🔧 CODE QUALITY VALIDATION")
+        self.say("=" * 50)
 
         # Linting
-        lint_success, _ = self.run_command("uv run ruff check .", "Ruff linting")
+        lint_success, _ = await self.run_command(
+            [_PYTHON, "-m", "ruff", "check", "."], "Ruff linting", inputs=["."]
+        )
 
         # Formatting
-        format_success, _ = self.run_command(
-            "uv run ruff format --check .", "Ruff formatting check"
+        format_success, _ = await self.run_command(
+            [_PYTHON, "-m", "ruff", "format", "--check", "."],
+            "Ruff formatting check",
+            inputs=["."],
         )
 
         # Type checking
-        type_success, _ = self.run_command("uv run mypy src", "MyPy type checking")
+        type_success, _ = await self.run_command(
+            [_PYTHON, "-m", "mypy", "src"], "MyPy type checking", inputs=["src"]
+        )
 
         return lint_success and format_success and type_success
 
-    def validate_security(self) -> bool:
+    async def validate_security(self) -> bool:
         """Validate security."""
-        print("\n🔒 SECURITY VALIDATION")
-        print("=" * 50)
+        self.say("\n🔒 SECURITY VALIDATION")
+        self.say("=" * 50)
 
         # Security linting
-        bandit_success, _ = self.run_command(
-            "uv run bandit -r src/ -f json", "Bandit security check"
+        bandit_success, _ = await self.run_command(
+            [_PYTHON, "-m", "bandit", "-r", "src/", "-f", "json"],
+            "Bandit security check",
+            inputs=["src"],
         )
 
         # Dependency security
-        audit_success, _ = self.run_command(
-            "uv run pip-audit", "pip-audit dependency scan"
+        audit_success, _ = await self.run_command(
+            [_PYTHON, "-m", "pip_audit"], "pip-audit dependency scan"
         )
 
         return bandit_success and audit_success
 
-    def validate_build(self) -> bool:
+    async def validate_build(self) -> bool:
         """Validate package build."""
-        print("\n📦 BUILD VALIDATION")
-        print("=" * 50)
+        self.say("\n📦 BUILD VALIDATION")
+        self.say("=" * 50)
 
         # Clean previous builds
-        self.run_command("rm -rf dist/", "Clean previous builds")
+        await self.run_command(["rm", "-rf", "dist/"], "Clean previous builds")
 
         # Build package
-        build_success, _ = self.run_command("uv build", "Package build")
+        build_success, _ = await self.run_command(["uv", "build"], "Package build")
 
         # Check build artifacts
         dist_path = self.project_root / "dist"
         if dist_path.exists():
             files = list(dist_path.glob("*"))
             if len(files) >= 2:  # Should have wheel and sdist
-                print(f"✅ Build artifacts created: {[f.name for f in files]}")
+                self.say(f"✅ Build artifacts created: {[f.name for f in files]}")
                 return build_success
 
-        print("❌ Build artifacts missing")
+        self.say("❌ Build artifacts missing")
         self.failed_checks.append("Build artifacts validation")
         return False
 
     async def validate_functionality(self) -> bool:
         """Validate core functionality."""
-        print("\n⚙️  FUNCTIONALITY VALIDATION")
-        print("=" * 50)
+        self.say("\n⚙️  FUNCTIONALITY VALIDATION")
+        self.say("=" * 50)
+
+        # The release is already blocked; don't pay for importing the server
+        # stack unless asked to
+        if self.failed_checks and not os.getenv("FORCE_FUNCTIONALITY_CHECK"):
+            self.say("⏭️  Skipping functionality check (earlier checks failed)")
+            return True
 
         try:
             # Test client creation
-            print("🔍 Testing client creation...")
+            self.say("🔍 Testing client creation...")
             from gopher_mcp.server import get_client_manager
 
             manager = await get_client_manager()
             gopher_client = await manager.get_gopher_client()
             gemini_client = await manager.get_gemini_client()
 
-            print("✅ Both clients created successfully")
+            self.say("✅ Both clients created successfully")
 
             # Test configuration
-            print("🔍 Testing configuration...")
+            self.say("🔍 Testing configuration...")
             assert gopher_client.cache_enabled is not None
             assert gemini_client.cache_enabled is not None
             assert gemini_client.tofu_enabled is not None
             assert gemini_client.client_certs_enabled is not None
 
-            print("✅ Configuration validation passed")
+            self.say("✅ Configuration validation passed")
 
             # Cleanup
             await gopher_client.close()
             await gemini_client.close()
 
-            print("✅ Client cleanup successful")
+            self.say("✅ Client cleanup successful")
             self.passed_checks.append("Functionality validation")
             return True
 
         except Exception as e:
-            print(f"❌ Functionality validation failed: {e}")
+            self.say(f"❌ Functionality validation failed: {e}")
             self.failed_checks.append("Functionality validation")
             return False
 
-    def validate_configuration(self) -> bool:
+    async def validate_configuration(self) -> bool:
         """Validate configuration system."""
-        print("\n⚙️  CONFIGURATION VALIDATION")
-        print("=" * 50)
+        self.say("\n⚙️  CONFIGURATION VALIDATION")
+        self.say("=" * 50)
 
         # Check if validation script exists and works
         config_script = self.project_root / "scripts" / "validate-config.py"
         if config_script.exists():
-            return self.run_command(
-                "python scripts/validate-config.py", "Configuration validation script"
-            )[0]
+            # ConfigValidator is plain Python, so run it in-process rather than
+            # paying for another interpreter start
+            description = "Configuration validation script"
+            self.say(f"🔍 {description}...")
+            spec = importlib.util.spec_from_file_location(
+                "validate_config", config_script
+            )
+            assert spec is not None and spec.loader is not None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            # Synchronous, so no other task can write while stdout is swapped
+            # or observe the cwd change. Relative config paths must resolve
+            # against the project root, as they did for the subprocess.
+            report = io.StringIO()
+            with (
+                contextlib.chdir(self.project_root),
+                contextlib.redirect_stdout(report),
+            ):
+                success = bool(module.ConfigValidator().validate_all())
+
+            if success:
+                self.say(f"✅ {description} - PASSED")
+                self.passed_checks.append(description)
+            else:
+                self.say(f"❌ {description} - FAILED")
+                self.say(report.getvalue().rstrip())
+                self.failed_checks.append(description)
+            return success
         else:
-            print("⚠️  Configuration validation script not found")
+            self.say("⚠️  Configuration validation script not found")
             return True  # Not critical for release
 
-    def validate_documentation(self) -> bool:
+    async def validate_documentation(self) -> bool:
         """Validate documentation."""
-        print("\n📚 DOCUMENTATION VALIDATION")
-        print("=" * 50)
+        self.say("\n📚 DOCUMENTATION VALIDATION")
+        self.say("=" * 50)
 
         # Check if docs build
-        docs_success, _ = self.run_command("uv run mkdocs build", "Documentation build")
+        docs_success, _ = await self.run_command(
+            [_PYTHON, "-m", "mkdocs", "build"],
+            "Documentation build",
+            inputs=["docs", "mkdocs.yml", "src"],
+        )
 
         # Check key documentation files exist
         required_docs = [
@@ -209,44 +359,61 @@ class ReleaseValidator:
                 missing_docs.append(doc)
 
         if missing_docs:
-            print(f"❌ Missing documentation files: {missing_docs}")
+            self.say(f"❌ Missing documentation files: {missing_docs}")
             self.failed_checks.append("Documentation files check")
             return False
 
-        print("✅ All required documentation files present")
+        self.say("✅ All required documentation files present")
         self.passed_checks.append("Documentation files check")
         return docs_success
 
     def print_summary(self) -> bool:
-        """Print validation summary."""
-        print("\n" + "=" * 60)
-        print("🎯 RELEASE VALIDATION SUMMARY")
-        print("=" * 60)
+        """Print validation summary, written to stdout in one go."""
+        lines = ["\n" + "=" * 60, "🎯 RELEASE VALIDATION SUMMARY", "=" * 60]
 
-        print(f"\n✅ PASSED CHECKS ({len(self.passed_checks)}):")
-        for check in self.passed_checks:
-            print(f"   • {check}")
+        lines.append(f"\n✅ PASSED CHECKS ({len(self.passed_checks)}):")
+        lines.extend(f"   • {check}" for check in self.passed_checks)
 
         if self.failed_checks:
-            print(f"\n❌ FAILED CHECKS ({len(self.failed_checks)}):")
-            for check in self.failed_checks:
-                print(f"   • {check}")
+            lines.append(f"\n❌ FAILED CHECKS ({len(self.failed_checks)}):")
+            lines.extend(f"   • {check}" for check in self.failed_checks)
 
         total_checks = len(self.passed_checks) + len(self.failed_checks)
         success_rate = (
             len(self.passed_checks) / total_checks * 100 if total_checks > 0 else 0
         )
 
-        print(
+        lines.append(
             f"\n📊 SUCCESS RATE: {success_rate:.1f}% ({len(self.passed_checks)}/{total_checks})"
         )
 
         if self.failed_checks:
-            print("\n🚨 RELEASE NOT READY - Please fix failed checks before releasing")
-            return False
+            lines.append(
+                "\n🚨 RELEASE NOT READY - Please fix failed checks before releasing"
+            )
         else:
-            print("\n🎉 RELEASE READY - All validations passed!")
-            return True
+            lines.append("\n🎉 RELEASE READY - All validations passed!")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        return not self.failed_checks
+
+    async def _run_buffered(
+        self,
+        name: str,
+        validation_func: Callable[[], Awaitable[bool]],
+        buffer: bool = True,
+    ) -> tuple[bool, list[str]]:
+        """Run one validation, capturing its output when ``buffer`` is set."""
+        lines: list[str] = []
+        if buffer:
+            _output.set(lines)
+        try:
+            return await validation_func(), lines
+        except Exception as e:
+            self.say(f"💥 {name} validation failed with exception: {e}")
+            self.failed_checks.append(f"{name} (exception)")
+            return False, lines
 
     async def run_all_validations(self) -> bool:
         """Run all validation checks."""
@@ -255,32 +422,32 @@ class ReleaseValidator:
 
         start_time = time.time()
 
-        # Run all validation steps
-        validations = [
+        # Independent checks run concurrently and report in order. The build
+        # wipes dist/ and the functionality check imports the package, so they
+        # run afterwards, one at a time.
+        independent = [
             ("Code Quality", self.validate_code_quality),
             ("Security", self.validate_security),
             ("Tests", self.validate_tests),
-            ("Build", self.validate_build),
             ("Configuration", self.validate_configuration),
             ("Documentation", self.validate_documentation),
+        ]
+        serial = [
+            ("Build", self.validate_build),
             ("Functionality", self.validate_functionality),
         ]
 
-        all_passed = True
-        for name, validation_func in validations:
-            try:
-                if asyncio.iscoroutinefunction(validation_func):
-                    result = await validation_func()
-                else:
-                    result = validation_func()
-
-                if not result:
-                    all_passed = False
-
-            except Exception as e:
-                print(f"💥 {name} validation failed with exception: {e}")
-                self.failed_checks.append(f"{name} (exception)")
-                all_passed = False
+        results = await asyncio.gather(
+            *(self._run_buffered(name, func) for name, func in independent)
+        )
+        for _, output in results:
+            for line in output:
+                print(line)
+        all_passed = all(passed for passed, _ in results)
+
+        for name, validation_func in serial:
+            passed, _ = await self._run_buffered(name, validation_func, buffer=False)
+            all_passed = all_passed and passed
 
         end_time = time.time()
         duration = end_time - start_time
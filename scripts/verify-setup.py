@@ -4,10 +4,39 @@ Setup verification script for open source release.
 Checks that all required files and configurations are in place.
 """
 
+import os
 import sys
+import threading
+import tomllib
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache
+def _dir_entries(path: Path) -> frozenset[str]:
+    """Return the names in a directory, listed once per run."""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _first_missing(base: Path, names: Iterable[str]) -> str | None:
+    """Return the first of ``names`` (relative to ``base``) that is missing.
+
+    Checks membership in one directory listing per parent instead of
+    stat-ing every file.
+    """
+    for name in names:
+        rel = Path(name)
+        if rel.name not in _dir_entries(base / rel.parent):
+            return name
+    return None
+
+
 class SetupVerifier:
     """Verifies open source release setup."""
 
@@ -15,6 +44,7 @@ class SetupVerifier:
         self.project_root = Path(__file__).parent.parent
         self.issues: list[str] = []
         self.warnings: list[str] = []
+        self._check_warnings = threading.local()
 
     def verify_setup(self) -> bool:
         """Run all verification checks."""
@@ -31,15 +61,23 @@ class SetupVerifier:
             ("🔧 Development Tools", self._check_dev_tools),
         ]
 
-        for check_name, check_func in checks:
-            print(f"{check_name}...")
-            try:
-                check_func()
-                print(f"✅ {check_name} - OK")
-            except Exception as e:
-                self.issues.append(f"{check_name}: {e}")
-                print(f"❌ {check_name} - FAILED: {e}")
-            print()
+        # The checks only read files, so they run side by side; results are
+        # merged here on the main thread and reported in declaration order.
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [
+                (check_name, executor.submit(self._run_check, check_func))
+                for check_name, check_func in checks
+            ]
+            for check_name, future in futures:
+                error, warnings = future.result()
+                print(f"{check_name}...")
+                if error is None:
+                    print(f"✅ {check_name} - OK")
+                else:
+                    self.issues.append(f"{check_name}: {error}")
+                    print(f"❌ {check_name} - FAILED: {error}")
+                self.warnings.extend(warnings)
+                print()
 
         # Summary
         print("📊 Summary")
@@ -58,6 +96,22 @@ class SetupVerifier:
 
         return len(self.issues) == 0
 
+    def _warn(self, message: str) -> None:
+        """Record a warning for the check running on this thread."""
+        self._check_warnings.messages.append(message)
+
+    def _run_check(
+        self, check_func: Callable[[], None]
+    ) -> tuple[Exception | None, list[str]]:
+        """Run one check in a worker thread, returning its failure and warnings."""
+        warnings: list[str] = []
+        self._check_warnings.messages = warnings
+        try:
+            check_func()
+        except Exception as e:
+            return e, warnings
+        return None, warnings
+
     def _check_required_files(self) -> None:
         """Check that all required files exist."""
         required_files = [
@@ -72,10 +126,9 @@ class SetupVerifier:
             ".github/dependabot.yml",
         ]
 
-        for file_path in required_files:
-            full_path = self.project_root / file_path
-            if not full_path.exists():
-                raise FileNotFoundError(f"Missing required file: {file_path}")
+        missing = _first_missing(self.project_root, required_files)
+        if missing:
+            raise FileNotFoundError(f"Missing required file: {missing}")
 
     def _check_workflows(self) -> None:
         """Check GitHub workflows."""
@@ -89,10 +142,9 @@ class SetupVerifier:
             "validate-pr.yml",
         ]
 
-        for workflow in required_workflows:
-            workflow_path = workflow_dir / workflow
-            if not workflow_path.exists():
-                raise FileNotFoundError(f"Missing workflow: {workflow}")
+        missing = _first_missing(workflow_dir, required_workflows)
+        if missing:
+            raise FileNotFoundError(f"Missing workflow: {missing}")
 
     def _check_templates(self) -> None:
         """Check issue and PR templates."""
@@ -104,14 +156,12 @@ class SetupVerifier:
             "config.yml",
         ]
 
-        for template in required_templates:
-            template_path = template_dir / template
-            if not template_path.exists():
-                raise FileNotFoundError(f"Missing issue template: {template}")
+        missing = _first_missing(template_dir, required_templates)
+        if missing:
+            raise FileNotFoundError(f"Missing issue template: {missing}")
 
         # Check PR template
-        pr_template = self.project_root / ".github" / "pull_request_template.md"
-        if not pr_template.exists():
+        if _first_missing(self.project_root, [".github/pull_request_template.md"]):
             raise FileNotFoundError("Missing pull request template")
 
     def _check_documentation(self) -> None:
@@ -125,46 +175,61 @@ class SetupVerifier:
             "development/releasing.md",
         ]
 
-        for doc in required_docs:
-            doc_path = docs_dir / doc
-            if not doc_path.exists():
-                raise FileNotFoundError(f"Missing documentation: {doc}")
+        missing = _first_missing(docs_dir, required_docs)
+        if missing:
+            raise FileNotFoundError(f"Missing documentation: {missing}")
 
         # Check MkDocs config
         mkdocs_config = self.project_root / "mkdocs.yml"
-        content = mkdocs_config.read_text()
-        if "cameronrye.github.io/gopher-mcp" not in content:
-            self.warnings.append(
-                "MkDocs site_url may not be configured for GitHub Pages"
-            )
+        try:
+            content = mkdocs_config.read_text()
+        except FileNotFoundError:
+            raise FileNotFoundError("Missing MkDocs config: mkdocs.yml") from None
+        # site_url is a top-level scalar, so read that one key rather than
+        # pulling in a YAML parser for the whole file.
+        site_url = next(
+            (
+                line.partition(":")[2].strip().strip("\"'")
+                for line in content.splitlines()
+                if line.startswith("site_url:")
+            ),
+            "",
+        )
+        if "cameronrye.github.io/gopher-mcp" not in site_url:
+            self._warn("MkDocs site_url may not be configured for GitHub Pages")
 
     def _check_package_config(self) -> None:
         """Check package configuration."""
         pyproject_path = self.project_root / "pyproject.toml"
-        content = pyproject_path.read_text()
+        try:
+            data = tomllib.loads(pyproject_path.read_text())
+        except FileNotFoundError:
+            raise ValueError("Missing pyproject.toml") from None
+        project = data.get("project", {})
 
         # Check required fields
-        required_fields = [
-            'name = "gopher-mcp"',
-            'license = "MIT"',
-            'requires-python = ">=3.11"',
-        ]
-
-        for field in required_fields:
-            if field not in content:
-                raise ValueError(f"Missing required field in pyproject.toml: {field}")
+        required_fields = {
+            "name": "gopher-mcp",
+            "license": "MIT",
+            "requires-python": ">=3.11",
+        }
+
+        for key, value in required_fields.items():
+            if project.get(key) != value:
+                raise ValueError(
+                    f'Missing required field in pyproject.toml: {key} = "{value}"'
+                )
 
         # Check URLs
-        if "cameronrye.github.io/gopher-mcp" not in content:
-            self.warnings.append(
-                "Documentation URL may not be updated for GitHub Pages"
-            )
+        urls = project.get("urls", {}).values()
+        if not any("cameronrye.github.io/gopher-mcp" in url for url in urls):
+            self._warn("Documentation URL may not be updated for GitHub Pages")
 
     def _check_dev_tools(self) -> None:
         """Check development tools configuration."""
         # Check if uv.lock exists
-        if not (self.project_root / "uv.lock").exists():
-            self.warnings.append("uv.lock not found - run 'uv sync' to generate")
+        if _first_missing(self.project_root, ["uv.lock"]):
+            self._warn("uv.lock not found - run 'uv sync' to generate")
 
         # Check scripts
         scripts_dir = self.project_root / "scripts"
@@ -173,10 +238,9 @@ class SetupVerifier:
             "verify-setup.py",
         ]
 
-        for script in required_scripts:
-            script_path = scripts_dir / script
-            if not script_path.exists():
-                raise FileNotFoundError(f"Missing script: {script}")
+        missing = _first_missing(scripts_dir, required_scripts)
+        if missing:
+            raise FileNotFoundError(f"Missing script: {missing}")
 
 
 def main():
@@ -8,14 +8,17 @@ concrete :class:`~gopher_mcp.models._BaseCacheEntry` subclass.
 """
 
 import time
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from collections import OrderedDict
+    from collections.abc import Awaitable, Callable
 
     from .models import _BaseCacheEntry
 
-V = TypeVar("V")
+V = TypeVar("V", bound=BaseModel)
 
 
 class TTLCacheMixin(Generic[V]):
@@ -23,10 +26,10 @@ class TTLCacheMixin(Generic[V]):
 
     Hosting classes must provide ``_cache`` (an ``OrderedDict``), the
     ``cache_enabled`` / ``max_cache_entries`` / ``cache_ttl_seconds`` settings,
-    and ``_cache_entry_cls`` (the entry model to construct). Subclasses inherit
-    these annotations rather than re-declaring ``_cache`` (``OrderedDict`` is
-    invariant in its value type, so a narrower re-declaration would not be
-    assignment-compatible).
+    ``_cache_entry_cls`` (the entry model to construct) and ``fetch``.
+    Subclasses inherit these annotations rather than re-declaring ``_cache``
+    (``OrderedDict`` is invariant in its value type, so a narrower
+    re-declaration would not be assignment-compatible).
     """
 
     _cache: "OrderedDict[str, _BaseCacheEntry[V]]"
@@ -34,6 +37,16 @@ class TTLCacheMixin(Generic[V]):
     max_cache_entries: int
     cache_ttl_seconds: int
     _cache_entry_cls: "type[_BaseCacheEntry[V]]"
+    fetch: "Callable[[str], Awaitable[V]]"
+
+    async def fetch_dict(self, url: str) -> dict[str, Any]:
+        """Fetch ``url`` and return the response as ``model_dump()`` would.
+
+        Each call gets its own dict, so callers may modify the result without
+        affecting the cached response or other callers.
+        """
+        response = await self.fetch(url)
+        return response.model_dump()
 
     def _get_cached_response(self, url: str) -> V | None:
         """Return a cached, non-expired response for ``url`` (LRU touch)."""
@@ -41,7 +54,7 @@ class TTLCacheMixin(Generic[V]):
             return None
 
         entry = self._cache[url]
-        if entry.is_expired(time.time()):
+        if entry.is_expired(time.monotonic()):
             del self._cache[url]
             return None
 
@@ -62,10 +75,12 @@ class TTLCacheMixin(Generic[V]):
         ):
             self._cache.popitem(last=False)
 
-        self._cache[url] = self._cache_entry_cls(
+        # ``response`` is a result model the client just built (and validated),
+        # so skip re-validating it against the response union on insert.
+        self._cache[url] = self._cache_entry_cls.model_construct(
             key=url,
             value=response,
-            timestamp=time.time(),
+            timestamp=time.monotonic(),
             ttl=self.cache_ttl_seconds,
         )
         self._cache.move_to_end(url)
@@ -115,7 +115,13 @@ class GeminiClient(TTLCacheMixin[GeminiFetchResponse]):
             else None
         )
         self.denied_mime_types = frozenset(denied_mime_types or ())
-        self.allowed_hosts = set(allowed_hosts) if allowed_hosts else None
+        self._allowed_hosts = frozenset(allowed_hosts) if allowed_hosts else None
+        # Normalized once here rather than on every request
+        self._normalized_allowed_hosts = (
+            frozenset(normalize_host(h) for h in allowed_hosts)
+            if allowed_hosts
+            else None
+        )
         self.allow_local_hosts = allow_local_hosts
         self.allowed_ports = allowed_ports
         self.tofu_enabled = tofu_enabled
@@ -184,6 +190,15 @@ class GeminiClient(TTLCacheMixin[GeminiFetchResponse]):
             self._client_cert_tls_clients[cache_key] = client
         return client
 
+    @property
+    def allowed_hosts(self) -> frozenset[str] | None:
+        """Hosts this client may fetch from, as configured (None = allow all).
+
+        Read-only: the host check uses a normalized copy built at init, so
+        rebinding this would not change what is allowed.
+        """
+        return self._allowed_hosts
+
     def _validate_security(self, parsed_url: GeminiURL) -> None:
         """Validate security constraints for a Gemini request.
 
@@ -194,10 +209,9 @@ class GeminiClient(TTLCacheMixin[GeminiFetchResponse]):
             ValueError: If security constraints are violated
         """
         # Check allowed hosts (normalized to close trailing-dot/case bypasses)
-        if self.allowed_hosts:
-            allowed = {normalize_host(h) for h in self.allowed_hosts}
-            if normalize_host(parsed_url.host) not in allowed:
-                raise ValueError(f"Host not allowed: {parsed_url.host}")
+        allowed = self._normalized_allowed_hosts
+        if allowed is not None and normalize_host(parsed_url.host) not in allowed:
+            raise ValueError(f"Host not allowed: {parsed_url.host}")
 
         # Validate port range
         if not 1 <= parsed_url.port <= 65535:
@@ -7,6 +7,8 @@ modules.
 """
 
 import contextlib
+import re
+from functools import lru_cache
 from typing import Any, Union
 from urllib.parse import urljoin, urlparse
 
@@ -33,6 +35,10 @@ from .models import (
     GeminiURL,
 )
 
+# Raw ASCII control characters (C0 range + DEL). A single compiled character
+# class scans the URL in C instead of a per-character ``ord()`` generator.
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
+
 
 class GeminiProtocolError(ValueError):
     """A server sent a malformed Gemini response (a server-side fault).
@@ -45,9 +51,14 @@ class GeminiProtocolError(ValueError):
     """
 
 
+@lru_cache(maxsize=4096)
 def parse_gemini_url(url: str) -> GeminiURL:
     """Parse a Gemini URL into its components.
 
+    Results are memoized like ``parse_gopher_url``: the same (frozen)
+    ``GeminiURL`` instance is returned for every call with that URL. Invalid
+    URLs raise every time.
+
     Args:
         url: Gemini URL to parse (e.g., gemini://example.org/path?query)
 
@@ -65,7 +76,7 @@ def parse_gemini_url(url: str) -> GeminiURL:
     # ``urlparse`` silently *strips* CR/LF/TAB, which would otherwise mask a
     # request-line injection attempt; other C0 bytes (NUL/VT/FF) survive into
     # the on-wire ``<url>\r\n`` request verbatim. Both must fail closed.
-    if any(ord(c) < 0x20 or ord(c) == 0x7F for c in url):
+    if _CONTROL_CHARS_RE.search(url):
         raise ValueError("URL must not contain control characters")
 
     # Check URL length limit. The spec's 1024-byte cap applies to the whole
@@ -12,6 +12,7 @@ from .models import (
     GemtextHeading,
     GemtextLine,
     GemtextLineType,
+    GemtextLineTypeT,
     GemtextLink,
     GemtextList,
     GemtextPreformat,
@@ -162,7 +163,7 @@ def _parse_gemtext_link_line(line: str) -> dict[str, str | None] | None:
 
 
 def _create_gemtext_line(
-    line_type: "GemtextLineType",
+    line_type: "GemtextLineTypeT",
     content: str,
     link: Optional["GemtextLink"] = None,
     heading: Optional["GemtextHeading"] = None,
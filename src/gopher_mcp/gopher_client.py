@@ -132,9 +132,15 @@ class GopherClient(TTLCacheMixin[GopherFetchResponse]):
         self.allow_local_hosts = allow_local_hosts
         self.allowed_ports = allowed_ports
 
-        # Convert allowed hosts to a set for faster lookup
-        self.allowed_hosts: set[str] | None = (
-            set(allowed_hosts) if allowed_hosts else None
+        # Convert allowed hosts to a set for faster lookup, normalizing once
+        # here rather than on every request
+        self._allowed_hosts: frozenset[str] | None = (
+            frozenset(allowed_hosts) if allowed_hosts else None
+        )
+        self._normalized_allowed_hosts: frozenset[str] | None = (
+            frozenset(normalize_host(h) for h in allowed_hosts)
+            if allowed_hosts
+            else None
         )
 
         # LRU cache (get/put behaviour lives in TTLCacheMixin). The element type
@@ -142,6 +148,15 @@ class GopherClient(TTLCacheMixin[GopherFetchResponse]):
         self._cache = OrderedDict()
         self._cache_entry_cls = CacheEntry
 
+    @property
+    def allowed_hosts(self) -> frozenset[str] | None:
+        """Hosts this client may fetch from, as configured (None = allow all).
+
+        Read-only: the host check uses a normalized copy built at init, so
+        rebinding this would not change what is allowed.
+        """
+        return self._allowed_hosts
+
     def _validate_security(self, parsed_url: GopherURL) -> None:
         """Validate security constraints for a Gopher request.
 
@@ -153,10 +168,9 @@ class GopherClient(TTLCacheMixin[GopherFetchResponse]):
 
         """
         # Check allowed hosts (normalized to close trailing-dot/case bypasses)
-        if self.allowed_hosts:
-            allowed = {normalize_host(h) for h in self.allowed_hosts}
-            if normalize_host(parsed_url.host) not in allowed:
-                raise ValueError(f"Host '{parsed_url.host}' not in allowed hosts list")
+        allowed = self._normalized_allowed_hosts
+        if allowed is not None and normalize_host(parsed_url.host) not in allowed:
+            raise ValueError(f"Host '{parsed_url.host}' not in allowed hosts list")
 
         # Validate selector length
         if len(parsed_url.selector) > self.max_selector_length:
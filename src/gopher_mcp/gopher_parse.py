@@ -1,15 +1,44 @@
 """Gopher URL and menu parsing, selector sanitizing, and item-type categories."""
 
 import re
+from functools import lru_cache
 from urllib.parse import quote, unquote, urlparse
 
 from .helpers import bracket_host
 from .models import GopherMenuItem, GopherURL
 
+# One menu line (already stripped of its CRLF): optional type char + display,
+# selector, host, then the port field. Anything after a fourth tab (e.g. a
+# Gopher+ "+" marker) is ignored -- the same fields the old split produced,
+# extracted in a single match.
+_MENU_LINE_RE = re.compile(r"([^\t]?)([^\t]*)\t([^\t]*)\t([^\t]*)\t([^\t]*)")
 
+# The same fields for every line of a whole menu, scanned in one pass. A line
+# starts at the beginning of the text or after any CR or LF (so CRLF, bare LF
+# and legacy bare CR all work), and the rest of a matched line is consumed. A
+# line that is only "." padded with whitespace matches the ``end`` group
+# instead: the RFC 1436 terminator.
+_MENU_RE = re.compile(
+    r"(?<![^\r\n])(?:"
+    r"(?P<end>[^\S\r\n]*\.[^\S\r\n]*)(?=[\r\n]|\Z)"
+    r"|([^\t\r\n]?)([^\t\r\n]*)\t([^\t\r\n]*)\t([^\t\r\n]*)\t([^\t\r\n]*)[^\r\n]*"
+    r")"
+)
+
+
+def _maybe_unquote(value: str) -> str:
+    """``unquote`` that skips the call entirely when there is no ``%`` escape."""
+    return unquote(value) if "%" in value else value
+
+
+@lru_cache(maxsize=4096)
 def parse_gopher_url(url: str) -> GopherURL:
     """Parse a Gopher URL into its components.
 
+    Results are memoized, so revisiting a URL skips re-parsing it; the same
+    (frozen) ``GopherURL`` instance is returned for every call with that URL.
+    Invalid URLs raise every time.
+
     Args:
         url: Gopher URL to parse
 
@@ -60,14 +89,14 @@ def parse_gopher_url(url: str) -> GopherURL:
     # with the field separator.
     search = None
     if parsed.query:
-        search = unquote(parsed.query)
-        selector = unquote(raw_selector)
-    elif "%09" in raw_selector:
-        sel_part, _, search_part = raw_selector.partition("%09")
-        selector = unquote(sel_part)
-        search = unquote(search_part)
+        search = _maybe_unquote(parsed.query)
+        selector = _maybe_unquote(raw_selector)
     else:
-        selector = unquote(raw_selector)
+        # One partition scan both finds and splits off an embedded %09 search
+        sel_part, sep, search_part = raw_selector.partition("%09")
+        selector = _maybe_unquote(sel_part)
+        if sep:
+            search = _maybe_unquote(search_part)
 
     # Fail closed on raw control bytes that percent-decoding can introduce. A
     # C0/DEL byte (CR/LF/TAB/NUL/ESC/...) in the selector or search would inject
@@ -99,32 +128,28 @@ def parse_menu_line(line: str) -> GopherMenuItem | None:
         Parsed menu item or None if invalid
 
     """
-    # Remove CRLF
-    line = line.rstrip("\r\n")
-
-    # Skip empty lines and termination marker
-    if not line or line == ".":
+    # Empty lines and the "." terminator have no tabs, so they never match
+    match = _MENU_LINE_RE.match(line.rstrip("\r\n"))
+    if match is None:
         return None
 
-    # Menu lines are tab-separated: type + display + tab + selector + tab + host + tab + port
-    parts = line.split("\t")
+    return _menu_item(*match.groups())
 
-    if len(parts) < 4:
-        return None
 
+def _menu_item(
+    item_type: str, display: str, selector: str, host: str, port_field: str
+) -> GopherMenuItem | None:
+    """Build a menu item from the raw fields of one menu line."""
     try:
-        item_type = parts[0][0] if parts[0] else "i"  # Default to info line
-        display = parts[0][1:] if len(parts[0]) > 1 else ""
-        selector = parts[1]
-        host = parts[2]
+        item_type = item_type or "i"  # Default to info line
         # ``str.isdigit()`` accepts unicode digits (e.g. "²") that ``int()``
         # rejects; require ASCII so a bad port degrades to the default rather
         # than dropping the whole menu item. Also bound the value: a numeric
         # but out-of-range port (>65535) would otherwise fail model validation
         # and drop the item -- degrade it to 70 instead.
         port = 70
-        if parts[3].isascii() and parts[3].isdigit():
-            candidate = int(parts[3])
+        if port_field.isascii() and port_field.isdigit():
+            candidate = int(port_field)
             if 0 <= candidate <= 65535:
                 port = candidate
 
@@ -149,6 +174,10 @@ def parse_menu_line(line: str) -> GopherMenuItem | None:
                 f"{item_type}{quote(selector, safe='/')}"
             )
 
+        # Deliberately the validating constructor, not ``model_construct``:
+        # for a flat all-scalar model like this, pydantic-core's compiled
+        # validator is about twice as fast as model_construct's Python-level
+        # field loop, so "skipping validation" would slow large menus down.
         return GopherMenuItem(
             type=item_type,
             title=display,
@@ -180,19 +209,19 @@ def parse_gopher_menu(
     """
     items: list[GopherMenuItem] = []
 
-    # Normalize all three RFC 1436 line endings (CRLF), bare LF and legacy
-    # bare CR before splitting -- a CR-only server would otherwise collapse the
-    # whole menu into one unparseable line. Avoid str.splitlines(), which also
-    # breaks on VT/FF/NEL and could split a display string mid-field.
-    normalized = content.replace("\r\n", "\n").replace("\r", "\n")
-    for line in normalized.split("\n"):
+    # Scan the buffer once with _MENU_RE rather than normalizing line endings
+    # and splitting into a list of lines. Every RFC 1436 line ending (CRLF),
+    # bare LF and legacy bare CR starts a new line -- a CR-only server would
+    # otherwise collapse the whole menu into one unparseable line -- but VT/FF/
+    # NEL do not, so a display string is never split mid-field.
+    for match in _MENU_RE.finditer(content):
         # RFC 1436: a lone '.' terminates the menu. Stop here so data a server
         # places AFTER the terminator is never parsed into navigable items.
-        # Strip trailing whitespace first so a non-conformant `. ` line still
+        # Surrounding whitespace is allowed so a non-conformant `. ` line still
         # reads as the terminator instead of leaking later items to the model.
-        if line.strip() == ".":
+        if match.group("end") is not None:
             break
-        item = parse_menu_line(line)
+        item = _menu_item(*match.groups()[1:])
         if item:
             items.append(item)
             if max_items is not None and len(items) >= max_items:
@@ -214,12 +243,12 @@ def sanitize_selector(selector: str) -> str:
         ValueError: If selector contains invalid characters
 
     """
-    # Check for forbidden characters per RFC 1436
-    forbidden_chars = ["\t", "\r", "\n"]
-
-    for char in forbidden_chars:
-        if char in selector:
-            raise ValueError(f"Selector contains forbidden character: {char!r}")
+    # Check for forbidden characters per RFC 1436. Chained substring tests
+    # (memchr-backed) beat both a regex search and a translate pass on
+    # selector-sized strings; the loop only runs on the rejection path.
+    if "\t" in selector or "\r" in selector or "\n" in selector:
+        char = next(c for c in "\t\r\n" if c in selector)
+        raise ValueError(f"Selector contains forbidden character: {char!r}")
 
     # Limit length
     if len(selector) > 255:
@@ -251,18 +280,13 @@ def format_gopher_url(
     # Sanitize inputs
     selector = sanitize_selector(selector)
 
-    # Build the URL (bracket an IPv6 literal host per RFC 3986)
-    url = f"gopher://{bracket_host(host)}"
-
-    if port != 70:
-        url += f":{port}"
-
-    url += f"/{gopher_type}{selector}"
-
-    if search and gopher_type == "7":
-        url += f"%09{search}"
-
-    return url
+    # Build the URL in one formatting pass rather than growing it piece by
+    # piece (bracket an IPv6 literal host per RFC 3986)
+    port_part = f":{port}" if port != 70 else ""
+    search_part = f"%09{search}" if search and gopher_type == "7" else ""
+    return (
+        f"gopher://{bracket_host(host)}{port_part}/{gopher_type}{selector}{search_part}"
+    )
 
 
 # Canonical Gopher item-type -> handling category. Single source of truth so
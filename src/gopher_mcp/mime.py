@@ -7,6 +7,34 @@ parse, default, validate and deny-list Gemini MIME types.
 
 from .models import GeminiMimeType
 
+# Standard Gopher type mappings
+_GOPHER_TYPE_MIME: dict[str, str] = {
+    "0": "text/plain",
+    "1": "text/gopher-menu",
+    "4": "application/mac-binhex40",
+    "5": "application/zip",
+    "6": "application/x-uuencoded",
+    "7": "text/gopher-menu",  # Search results are menus
+    "9": "application/octet-stream",
+    "g": "image/gif",
+    "I": "image/jpeg",  # Generic image
+}
+
+# Selector file extensions that refine the type-based guess
+_EXTENSION_MIME: dict[str, str] = {
+    "txt": "text/plain",
+    "html": "text/html",
+    "htm": "text/html",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "pdf": "application/pdf",
+    "zip": "application/zip",
+    "tar": "application/x-tar",
+    "gz": "application/gzip",
+}
+
 
 def guess_mime_type(gopher_type: str, selector: str = "") -> str:
     """Guess MIME type from Gopher type and selector.
@@ -19,41 +47,12 @@ def guess_mime_type(gopher_type: str, selector: str = "") -> str:
         Guessed MIME type
 
     """
-    # Standard Gopher type mappings
-    type_mappings = {
-        "0": "text/plain",
-        "1": "text/gopher-menu",
-        "4": "application/mac-binhex40",
-        "5": "application/zip",
-        "6": "application/x-uuencoded",
-        "7": "text/gopher-menu",  # Search results are menus
-        "9": "application/octet-stream",
-        "g": "image/gif",
-        "I": "image/jpeg",  # Generic image
-    }
-
-    mime_type = type_mappings.get(gopher_type, "application/octet-stream")
+    mime_type = _GOPHER_TYPE_MIME.get(gopher_type, "application/octet-stream")
 
     # Refine based on file extension if available
-    if selector and "." in selector:
-        extension = selector.split(".")[-1].lower()
-        extension_mappings = {
-            "txt": "text/plain",
-            "html": "text/html",
-            "htm": "text/html",
-            "jpg": "image/jpeg",
-            "jpeg": "image/jpeg",
-            "png": "image/png",
-            "gif": "image/gif",
-            "pdf": "application/pdf",
-            "zip": "application/zip",
-            "tar": "application/x-tar",
-            "gz": "application/gzip",
-        }
-
-        if extension in extension_mappings:
-            mime_type = extension_mappings[extension]
-
+    _, dot, extension = selector.rpartition(".")
+    if dot:
+        return _EXTENSION_MIME.get(extension.lower(), mime_type)
     return mime_type
 
 
@@ -1,17 +1,32 @@
 """Pydantic models for Gopher MCP data validation."""
 
-from enum import Enum, IntEnum
-from typing import Any, Generic, Literal, TypeVar
+import sys
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import cached_property
+from typing import Annotated, Any, Final, Generic, Literal, TypeVar
 from urllib.parse import urlparse
 
 from pydantic import (
+    AfterValidator,
     BaseModel,
+    ConfigDict,
     Field,
+    StringConstraints,
     field_validator,
     model_serializer,
 )
 
 
+def _check_gopher_url(v: str) -> str:
+    """Require the ``gopher://`` scheme and the 8192-byte URL cap."""
+    if not v.startswith("gopher://"):
+        raise ValueError("URL must start with 'gopher://'")
+    if _utf8_len(v) > 8192:
+        raise ValueError("URL must not exceed 8192 bytes")
+    return v
+
+
 class GopherFetchRequest(BaseModel):
     """Request model for gopher.fetch tool."""
 
@@ -28,11 +43,7 @@ class GopherFetchRequest(BaseModel):
     @classmethod
     def validate_gopher_url(cls, v: str) -> str:
         """Validate that the URL is a proper Gopher URL."""
-        if not v.startswith("gopher://"):
-            raise ValueError("URL must start with 'gopher://'")
-        if len(v.encode("utf-8")) > 8192:
-            raise ValueError("URL must not exceed 8192 bytes")
-        return v
+        return _check_gopher_url(v)
 
 
 class GopherMenuItem(BaseModel):
@@ -121,7 +132,7 @@ class ErrorResult(BaseModel):
 # Union type for all possible response types
 GopherFetchResponse = MenuResult | TextResult | BinaryResult | ErrorResult
 
-_CacheValueT = TypeVar("_CacheValueT")
+_CacheValueT = TypeVar("_CacheValueT", bound=BaseModel)
 
 
 class _BaseCacheEntry(BaseModel, Generic[_CacheValueT]):
@@ -129,17 +140,28 @@ class _BaseCacheEntry(BaseModel, Generic[_CacheValueT]):
 
     key: str = Field(..., description="Cache key")
     value: _CacheValueT = Field(..., description="Cached response")
-    timestamp: float = Field(..., description="Cache entry timestamp")
+    # The clients stamp entries with ``time.monotonic()`` so a wall-clock step
+    # (NTP, DST, manual change) can neither expire nor resurrect entries.
+    timestamp: float = Field(..., description="Cache entry timestamp (monotonic)")
     ttl: int = Field(..., description="Time to live in seconds")
 
+    @cached_property
+    def expires_at(self) -> float:
+        """Absolute expiry time (``timestamp + ttl``), computed once per entry."""
+        return self.timestamp + self.ttl
+
     def is_expired(self, current_time: float) -> bool:
         """Check if cache entry is expired."""
-        return current_time - self.timestamp > self.ttl
+        return current_time > self.expires_at
 
 
 class GopherURL(BaseModel):
     """Model for parsed Gopher URLs."""
 
+    # Frozen: ``parse_gopher_url`` memoizes and shares instances, so a caller
+    # rebinding ``host`` would otherwise poison every later parse of that URL.
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(..., description="Hostname")
     port: int = Field(default=70, description="Port number")
     gopher_type: str = Field(
@@ -182,38 +204,94 @@ class CacheEntry(_BaseCacheEntry[GopherFetchResponse]):
 # ============================================================================
 
 
+_GEMINI_PREFIX: Final = sys.intern("gemini://")
+
+
+def _utf8_len(v: str) -> int:
+    """Byte length of ``v`` as UTF-8 without encoding an ASCII string.
+
+    ``str.isascii()`` is a constant-time flag check on CPython, and for ASCII
+    the character count *is* the byte count, so the throwaway ``bytes`` copy is
+    only made for the (rare) non-ASCII URL or meta line.
+    """
+    return len(v) if v.isascii() else len(v.encode("utf-8"))
+
+
+def _check_gemini_url(v: str) -> str:
+    """Require the ``gemini://`` scheme and the 1024-byte URL cap."""
+    if not v.startswith(_GEMINI_PREFIX):
+        raise ValueError("URL must start with 'gemini://'")
+    if _utf8_len(v) > 1024:
+        raise ValueError("URL must not exceed 1024 bytes")
+    return v
+
+
+def _check_meta_length(v: str) -> str:
+    """Validate meta field length (reasonable limit)."""
+    if _utf8_len(v) > 1024:
+        raise ValueError("Meta field too long")
+    return v
+
+
+def _check_link_url(v: str) -> str:
+    """Strip a link URL and reject it if nothing is left."""
+    v = v.strip()
+    if not v:
+        raise ValueError("Link URL cannot be empty")
+    return v
+
+
+def _check_gemini_host(v: str) -> str:
+    """Reject a host that is empty once whitespace is stripped."""
+    if not v:
+        raise ValueError("Host cannot be empty")
+    return v
+
+
+def _check_gemini_port(v: int) -> int:
+    """Validate port number range."""
+    if not 1 <= v <= 65535:
+        raise ValueError("Port must be between 1 and 65535")
+    return v
+
+
+# Constraint types for the Gemini models. Stripping is a ``StringConstraints``
+# step pydantic-core runs natively; the checks with a user-facing message or a
+# byte-length measurement run as (module-level, not classmethod) after-validators.
+_GeminiHost = Annotated[
+    str, StringConstraints(strip_whitespace=True), AfterValidator(_check_gemini_host)
+]
+_GeminiPort = Annotated[int, AfterValidator(_check_gemini_port)]
+_GeminiUrlStr = Annotated[str, AfterValidator(_check_gemini_url)]
+_GeminiMeta = Annotated[str, AfterValidator(_check_meta_length)]
+_GemtextLinkUrl = Annotated[str, AfterValidator(_check_link_url)]
+# MIME components come from a small, highly repetitive vocabulary ("text",
+# "gemini", "utf-8", ...). Interning them shares one object per value, so the
+# ``==`` checks in the ``is_*`` properties resolve on CPython's identity fast
+# path instead of a character compare.
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
 class GeminiURL(BaseModel):
     """Model for parsed Gemini URLs.
 
     Based on the ``gemini://<host>[:<port>][/<path>][?<query>]`` format.
     """
 
-    host: str = Field(..., description="Hostname or IP address")
-    port: int = Field(default=1965, description="Port number (default: 1965)")
+    # Frozen for the same reason as ``GopherURL``: ``parse_gemini_url`` shares
+    # memoized instances between callers.
+    model_config = ConfigDict(frozen=True)
+
+    host: _GeminiHost = Field(..., description="Hostname or IP address")
+    port: _GeminiPort = Field(default=1965, description="Port number (default: 1965)")
     path: str = Field(default="/", description="Resource path")
     query: str | None = Field(None, description="Query string for user input")
 
-    @field_validator("port")
-    @classmethod
-    def validate_port(cls, v: int) -> int:
-        """Validate port number range."""
-        if not 1 <= v <= 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        return v
-
-    @field_validator("host")
-    @classmethod
-    def validate_host(cls, v: str) -> str:
-        """Validate hostname is not empty."""
-        if not v.strip():
-            raise ValueError("Host cannot be empty")
-        return v.strip()
-
 
 class GeminiFetchRequest(BaseModel):
     """Request model for gemini_fetch tool."""
 
-    url: str = Field(
+    url: _GeminiUrlStr = Field(
         ...,
         description="Gemini URL to fetch (e.g., gemini://gemini.circumlunar.space/)",
         examples=[
@@ -222,16 +300,6 @@ class GeminiFetchRequest(BaseModel):
         ],
     )
 
-    @field_validator("url")
-    @classmethod
-    def validate_gemini_url(cls, v: str) -> str:
-        """Validate that the URL is a proper Gemini URL."""
-        if not v.startswith("gemini://"):
-            raise ValueError("URL must start with 'gemini://'")
-        if len(v.encode("utf-8")) > 1024:
-            raise ValueError("URL must not exceed 1024 bytes")
-        return v
-
 
 class GeminiStatusCode(IntEnum):
     """Gemini protocol status codes."""
@@ -270,9 +338,9 @@ class GeminiStatusCode(IntEnum):
 class GeminiMimeType(BaseModel):
     """Model for Gemini MIME type parsing."""
 
-    type: str = Field(..., description="Main MIME type (e.g., 'text')")
-    subtype: str = Field(..., description="MIME subtype (e.g., 'gemini')")
-    charset: str = Field(default="utf-8", description="Character encoding")
+    type: _InternedStr = Field(..., description="Main MIME type (e.g., 'text')")
+    subtype: _InternedStr = Field(..., description="MIME subtype (e.g., 'gemini')")
+    charset: _InternedStr = Field(default="utf-8", description="Character encoding")
     lang: str | None = Field(None, description="Language tag (BCP47)")
 
     @property
@@ -350,20 +418,30 @@ class GeminiResponse(BaseModel):
     """Base model for Gemini protocol responses."""
 
     status: GeminiStatusCode | int = Field(..., description="Gemini status code")
-    meta: str = Field(..., description="Status-dependent metadata")
+    meta: _GeminiMeta = Field(..., description="Status-dependent metadata")
     body: bytes | None = Field(None, description="Response body (if any)")
 
-    @field_validator("meta")
-    @classmethod
-    def validate_meta_length(cls, v: str) -> str:
-        """Validate meta field length (reasonable limit)."""
-        if len(v.encode("utf-8")) > 1024:
-            raise ValueError("Meta field too long")
-        return v
+
+class _RequestInfoMixin(BaseModel):
+    """Shared ``request_info`` field for every Gemini result model.
+
+    Declared once so each result class inherits the field (and its compiled
+    validator) instead of re-declaring an identical copy.
+    """
+
+    # Results are built once by the client and then only read (cached,
+    # serialized), so they are frozen.
+    model_config = ConfigDict(frozen=True)
+
+    request_info: dict[str, Any] = Field(
+        default_factory=dict,
+        alias="requestInfo",
+        description="Information about the original request",
+    )
 
 
 # Response result models following Gopher patterns
-class GeminiSuccessResult(BaseModel):
+class GeminiSuccessResult(_RequestInfoMixin):
     """Result model for a successful Gemini response carrying TEXT content.
 
     Binary success responses use :class:`GeminiBinaryResult` (metadata only), so
@@ -382,14 +460,8 @@ class GeminiSuccessResult(BaseModel):
         "(`size` still reports the full original size).",
     )
 
-    request_info: dict[str, Any] = Field(
-        default_factory=dict,
-        alias="requestInfo",
-        description="Information about the original request",
-    )
-
 
-class GeminiBinaryResult(BaseModel):
+class GeminiBinaryResult(_RequestInfoMixin):
     """Result model for a successful BINARY Gemini response (metadata only).
 
     Mirrors the Gopher :class:`BinaryResult`: the raw bytes are NOT returned to
@@ -408,52 +480,32 @@ class GeminiBinaryResult(BaseModel):
         default="Binary content not returned to preserve context",
         description="Note about binary handling",
     )
-    request_info: dict[str, Any] = Field(
-        default_factory=dict,
-        alias="requestInfo",
-        description="Information about the original request",
-    )
 
 
-class GeminiInputResult(BaseModel):
+class GeminiInputResult(_RequestInfoMixin):
     """Result model for input request responses (status 10/11)."""
 
     kind: Literal["input"] = "input"
     prompt: str = Field(..., description="Input prompt text")
     sensitive: bool = Field(default=False, description="Whether input is sensitive")
-    request_info: dict[str, Any] = Field(
-        default_factory=dict,
-        alias="requestInfo",
-        description="Information about the original request",
-    )
 
 
-class GeminiRedirectResult(BaseModel):
+class GeminiRedirectResult(_RequestInfoMixin):
     """Result model for redirect responses (status 30/31)."""
 
     kind: Literal["redirect"] = "redirect"
     new_url: str = Field(..., alias="newUrl", description="Redirect target URL")
     permanent: bool = Field(default=False, description="Whether redirect is permanent")
-    request_info: dict[str, Any] = Field(
-        default_factory=dict,
-        alias="requestInfo",
-        description="Information about the original request",
-    )
 
 
-class GeminiErrorResult(BaseModel):
+class GeminiErrorResult(_RequestInfoMixin):
     """Result model for error responses."""
 
     kind: Literal["error"] = "error"
     error: dict[str, Any] = Field(..., description="Error information")
-    request_info: dict[str, Any] = Field(
-        default_factory=dict,
-        alias="requestInfo",
-        description="Information about the original request",
-    )
 
 
-class GeminiCertificateResult(BaseModel):
+class GeminiCertificateResult(_RequestInfoMixin):
     """Result model for certificate request responses (status 60-62)."""
 
     kind: Literal["certificate"] = "certificate"
@@ -470,41 +522,43 @@ class GeminiCertificateResult(BaseModel):
         description="Whether the server is prompting for a certificate (status "
         "60). False for 61/62, which are rejections of a presented identity.",
     )
-    request_info: dict[str, Any] = Field(
-        default_factory=dict,
-        alias="requestInfo",
-        description="Information about the original request",
-    )
 
 
 # Gemtext content models
-class GemtextLineType(str, Enum):
-    """Types of lines in gemtext format."""
+GemtextLineTypeT = Literal[
+    "text", "link", "heading1", "heading2", "heading3", "list", "quote", "preformat"
+]
+
+
+class GemtextLineType:
+    """Types of lines in gemtext format.
+
+    Plain string constants rather than an ``Enum``: ``GemtextLine.type`` is a
+    ``Literal`` validated by pydantic-core as a direct string match, with no
+    per-line Enum coercion, and comparisons against these names stay valid.
+    """
+
+    TEXT: Final = "text"
+    LINK: Final = "link"
+    HEADING_1: Final = "heading1"
+    HEADING_2: Final = "heading2"
+    HEADING_3: Final = "heading3"
+    LIST_ITEM: Final = "list"
+    QUOTE: Final = "quote"
+    PREFORMAT: Final = "preformat"
 
-    TEXT = "text"
-    LINK = "link"
-    HEADING_1 = "heading1"
-    HEADING_2 = "heading2"
-    HEADING_3 = "heading3"
-    LIST_ITEM = "list"
-    QUOTE = "quote"
-    PREFORMAT = "preformat"
+
+_HEADING_TYPES: frozenset[str] = frozenset(
+    {GemtextLineType.HEADING_1, GemtextLineType.HEADING_2, GemtextLineType.HEADING_3}
+)
 
 
 class GemtextLink(BaseModel):
     """Model for gemtext link lines."""
 
-    url: str = Field(..., description="Link URL (absolute or relative)")
+    url: _GemtextLinkUrl = Field(..., description="Link URL (absolute or relative)")
     text: str | None = Field(None, description="Link text (optional)")
 
-    @field_validator("url")
-    @classmethod
-    def validate_url_not_empty(cls, v: str) -> str:
-        """Validate URL is not empty."""
-        if not v.strip():
-            raise ValueError("Link URL cannot be empty")
-        return v.strip()
-
     @property
     def is_external(self) -> bool:
         """Whether the link points outside the current capsule.
@@ -565,26 +619,28 @@ class GemtextPreformat(BaseModel):
         return {k: v for k, v in data.items() if v is not None and v != {}}
 
 
-class GemtextLine(BaseModel):
-    """Model for a single line in gemtext format."""
+@dataclass(slots=True, frozen=True)
+class GemtextLine:
+    """A single line in gemtext format.
+
+    A slotted, frozen dataclass rather than a ``BaseModel``: the parser emits
+    one per line (thousands for a large document) from values it has already
+    classified, so per-instance validation and ``__dict__`` were pure overhead.
+    Pydantic still serializes it (with the serializer below) as part of
+    ``GemtextDocument``.
+    """
 
-    type: GemtextLineType = Field(..., description="Type of gemtext line")
-    content: str = Field(..., description="Line content")
-    link: GemtextLink | None = Field(None, description="Link data (for link lines)")
-    level: int | None = Field(None, description="Heading level (1-3, for headings)")
-    alt_text: str | None = Field(None, description="Alt text (for preformat blocks)")
+    type: GemtextLineTypeT  # Type of gemtext line
+    content: str  # Line content
+    link: GemtextLink | None = None  # Link data (for link lines)
+    level: int | None = None  # Heading level (1-3, for headings)
+    alt_text: str | None = None  # Alt text (for preformat blocks)
 
     # Structured content for specific line types
-    heading: GemtextHeading | None = Field(
-        None, description="Heading data (for heading lines)"
-    )
-    list_item: GemtextList | None = Field(
-        None, description="List data (for list lines)"
-    )
-    quote: GemtextQuote | None = Field(None, description="Quote data (for quote lines)")
-    preformat: GemtextPreformat | None = Field(
-        None, description="Preformat data (for preformat lines)"
-    )
+    heading: GemtextHeading | None = None
+    list_item: GemtextList | None = None
+    quote: GemtextQuote | None = None
+    preformat: GemtextPreformat | None = None
 
     @model_serializer(mode="wrap")
     def _serialize(self, handler: Any) -> dict[str, Any]:
@@ -615,7 +671,7 @@ class GemtextDocument(BaseModel):
     @property
     def has_headings(self) -> bool:
         """Check if document has any headings."""
-        return any(line.type.startswith("heading") for line in self.lines)
+        return any(line.type in _HEADING_TYPES for line in self.lines)
 
     @property
     def line_count(self) -> int:
@@ -638,7 +694,7 @@ class GemtextDocument(BaseModel):
         for line in self.lines:
             if line.type == GemtextLineType.TEXT:
                 summary["text_lines"] += 1
-            elif line.type.startswith("heading"):
+            elif line.type in _HEADING_TYPES:
                 summary["headings"] += 1
             elif line.type == GemtextLineType.LINK:
                 summary["links"] += 1
@@ -697,7 +753,7 @@ class GemtextDocument(BaseModel):
         return "\n".join(text_parts)
 
 
-class GeminiGemtextResult(BaseModel):
+class GeminiGemtextResult(_RequestInfoMixin):
     """Result model for gemtext content responses."""
 
     kind: Literal["gemtext"] = "gemtext"
@@ -711,23 +767,21 @@ class GeminiGemtextResult(BaseModel):
         description="True if the gemtext was truncated to the render limit "
         "(`size` still reports the full original byte size)",
     )
-    request_info: dict[str, Any] = Field(
-        default_factory=dict,
-        alias="requestInfo",
-        description="Information about the original request",
-    )
 
 
-# Union type for all possible Gemini fetch responses
-GeminiFetchResponse = (
+# Union type for all possible Gemini fetch responses. Every member carries a
+# distinct ``kind`` literal, so it is a tagged union: pydantic dispatches on
+# ``kind`` directly instead of trying each member in turn.
+GeminiFetchResponse = Annotated[
     GeminiSuccessResult
     | GeminiBinaryResult
     | GeminiGemtextResult
     | GeminiInputResult
     | GeminiRedirectResult
     | GeminiErrorResult
-    | GeminiCertificateResult
-)
+    | GeminiCertificateResult,
+    Field(discriminator="kind"),
+]
 
 
 # Certificate and security models
@@ -10,14 +10,17 @@ from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 from pydantic import Field
 
-from .config import get_config
+from .config import AppConfig, get_config
 from .gemini_client import GeminiClient
+from .gemini_parse import parse_gemini_url
 from .gopher_client import GopherClient
+from .gopher_parse import parse_gopher_url
 from .models import (
     ErrorResult,
     GeminiErrorResult,
     GeminiFetchRequest,
     GopherFetchRequest,
+    _check_gopher_url,
 )
 
 logger = structlog.get_logger(__name__)
@@ -108,8 +111,15 @@ class ClientManager:
     _instance: Optional["ClientManager"] = None
     _lock = asyncio.Lock()
 
-    def __init__(self) -> None:
-        """Initialize the client manager."""
+    def __init__(self, config: AppConfig | None = None) -> None:
+        """Initialize the client manager.
+
+        Args:
+            config: Settings to build clients from; defaults to the global
+                configuration loaded from the environment on first use.
+
+        """
+        self._config = config
         self._gopher_client: GopherClient | None = None
         self._gemini_client: GeminiClient | None = None
         self._gopher_lock = asyncio.Lock()
@@ -124,11 +134,23 @@ class ClientManager:
                     cls._instance = cls()
         return cls._instance
 
+    @classmethod
+    def for_settings(cls, config: AppConfig) -> "ClientManager":
+        """Create a manager that builds its clients from ``config``.
+
+        Skips environment parsing entirely, so callers that already hold an
+        ``AppConfig`` (tests, embedding applications) don't pay for it again.
+        """
+        return cls(config)
+
+    def _get_config(self) -> AppConfig:
+        return self._config if self._config is not None else get_config()
+
     async def get_gopher_client(self) -> GopherClient:
         """Get or create the Gopher client instance."""
         async with self._gopher_lock:
             if self._gopher_client is None:
-                config = get_config()
+                config = self._get_config()
                 gopher_config = config.gopher
 
                 self._gopher_client = GopherClient(
@@ -159,7 +181,7 @@ class ClientManager:
         """Get or create the Gemini client instance."""
         async with self._gemini_lock:
             if self._gemini_client is None:
-                config = get_config()
+                config = self._get_config()
                 gemini_config = config.gemini
 
                 # Convert Path to str if needed
@@ -235,12 +257,13 @@ async def gopher_fetch(url: _GopherUrl) -> dict[str, Any]:
 
     """
     # Validate the request separately so a bad URL becomes a sanitized,
-    # structured error instead of a raised ValidationError that FastMCP would
+    # structured error instead of a raised exception that FastMCP would
     # surface to the model as a raw ToolError (matching the batch tools and the
-    # client layer's no-raise contract).
+    # client layer's no-raise contract). Only ``url`` is validated, so run the
+    # GopherFetchRequest check directly rather than building a throwaway model.
     try:
-        request = GopherFetchRequest(url=url)
-    except Exception as e:
+        _check_gopher_url(url)
+    except ValueError as e:
         logger.info("Rejected invalid Gopher URL", url=url, error=str(e))
         return ErrorResult(
             error={"code": "INVALID_REQUEST", "message": str(e)},
@@ -250,8 +273,7 @@ async def gopher_fetch(url: _GopherUrl) -> dict[str, Any]:
     try:
         manager = await get_client_manager()
         client = await manager.get_gopher_client()
-        response = await client.fetch(request.url)
-        return response.model_dump()
+        return await client.fetch_dict(url)
     except Exception as e:  # defensive: client.fetch normally returns ErrorResult
         logger.error("Gopher fetch failed", url=url, error=str(e))
         return ErrorResult(
@@ -297,8 +319,7 @@ async def gemini_fetch(url: _GeminiUrl, input: _GeminiInput = None) -> dict[str,
     try:
         manager = await get_client_manager()
         client = await manager.get_gemini_client()
-        response = await client.fetch(request.url)
-        return response.model_dump()
+        return await client.fetch_dict(request.url)
     except Exception as e:  # defensive: client.fetch normally returns ErrorResult
         logger.error("Gemini fetch failed", url=url, error=str(e))
         return GeminiErrorResult(
@@ -356,8 +377,7 @@ async def _batch_fetch(
             except Exception as e:
                 return _error(url, "INVALID_REQUEST", str(e))
             try:
-                response = await client.fetch(request.url)
-                return response.model_dump()
+                return await client.fetch_dict(request.url)
             except Exception as e:  # defensive: client.fetch normally never raises
                 logger.error(f"{label} batch item failed", url=url, error=str(e))
                 return _error(url, "FETCH_ERROR", _GENERIC_FETCH_ERROR)
@@ -427,6 +447,8 @@ async def cleanup() -> None:
     if instance is not None:
         await instance.cleanup()
         ClientManager._instance = None
+    parse_gopher_url.cache_clear()
+    parse_gemini_url.cache_clear()
 
 
 def main() -> None:
@@ -4,11 +4,19 @@ Cross-platform task runner for gopher-mcp
 Unified replacement for Makefile and task.bat
 """
 
+import asyncio
+import functools
 import os
-import platform
+import re
+import shlex
+import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import Any
+
+# Shell syntax that a plain argv split cannot reproduce
+_SHELL_SYNTAX = re.compile(r"[&|;<>*?$`]")
 
 
 class Colors:
@@ -32,18 +40,23 @@ class Colors:
     RESET = "\033[0m"
 
     @staticmethod
+    @functools.cache
     def is_supported() -> bool:
-        """Check if terminal supports colors."""
+        """Check if terminal supports colors (probed once per process)."""
         # Allow disabling colors via environment variable
         if os.getenv("NO_COLOR") or os.getenv("TASK_NO_COLOR"):
             return False
 
         # Check if we're in a terminal and not redirected
-        if not sys.stdout.isatty():
+        if not sys.stdout.isatty() or os.getenv("TERM") == "dumb":
             return False
 
         # Windows terminal support
-        if platform.system() == "Windows":
+        if sys.platform == "win32":
+            # Windows Terminal and ANSICON already handle ANSI sequences
+            if os.getenv("WT_SESSION") or os.getenv("ANSICON"):
+                return True
+
             # Enable ANSI colors on Windows 10+
             try:
                 import ctypes
@@ -58,125 +71,158 @@ class Colors:
         return True
 
 
+_IS_WINDOWS = sys.platform == "win32"
+
+# Build and tool artifacts removed by the clean task, relative to the root
+_CLEAN_DIRS = (
+    ".pytest_cache",
+    "htmlcov",
+    "dist",
+    "build",
+    ".mypy_cache",
+    ".ruff_cache",
+)
+_CLEAN_FILES = (".coverage",)
+
+
+@functools.cache
+def _build_tasks(is_windows: bool) -> dict[str, dict[str, Any]]:
+    """Task definitions - mirrors pyproject.toml [tool.taskipy.tasks].
+
+    Only the setup command depends on the platform, so the table is built
+    once per process rather than on every ``TaskRunner()``.
+    """
+    return {
+        # Development setup
+        "dev-setup": {
+            "cmd": "scripts\\dev-setup.bat"
+            if is_windows
+            else "bash scripts/dev-setup.sh",
+            "desc": "Set up development environment",
+            "category": "Setup",
+        },
+        "install-hooks": {
+            "cmd": "pre-commit install",
+            "desc": "Install pre-commit hooks",
+            "category": "Setup",
+        },
+        # Code quality
+        "lint": {
+            # Whole-repo to match CI (`ruff check .`); scoping to src/tests
+            # lets violations in task.py/scripts/ pass locally but fail CI.
+            "cmd": "ruff check .",
+            "desc": "Run ruff linting",
+            "category": "Code Quality",
+        },
+        "format": {
+            "cmd": "ruff format .",
+            "desc": "Format code with ruff",
+            "category": "Code Quality",
+        },
+        "typecheck": {
+            # Match CI's `mypy src` (no --ignore-missing-imports, which
+            # would hide missing-stub errors locally that CI still fails on).
+            "cmd": "mypy src",
+            "desc": "Run mypy type checking",
+            "category": "Code Quality",
+        },
+        "quality": {
+            "steps": ["check", "test"],
+            "desc": "Run all quality checks",
+            "category": "Code Quality",
+        },
+        "check": {
+            "parallel_steps": ["lint", "typecheck"],
+            "desc": "Run lint + typecheck",
+            "category": "Code Quality",
+        },
+        # Testing
+        "test": {
+            "cmd": "pytest tests/ -v -n auto --dist=loadfile",
+            "desc": "Run all tests",
+            "category": "Testing",
+        },
+        "test-cov": {
+            "cmd": "pytest tests/ -v --cov=src/gopher_mcp --cov-report=term-missing --cov-report=html",
+            "desc": "Run tests with coverage",
+            "category": "Testing",
+        },
+        "test-unit": {
+            "cmd": (
+                "pytest tests/ -v -n auto --dist=loadfile "
+                "-m 'not integration and not slow'"
+            ),
+            "desc": "Run unit tests only",
+            "category": "Testing",
+        },
+        "test-integration": {
+            "cmd": "pytest tests/ -v -m integration",
+            "desc": "Run integration tests",
+            "category": "Testing",
+        },
+        "test-slow": {
+            "cmd": "pytest tests/ -v -m slow",
+            "desc": "Run slow tests",
+            "category": "Testing",
+        },
+        # Server operations
+        "serve": {
+            "cmd": "python -m gopher_mcp",
+            "desc": "Run MCP server (stdio)",
+            "category": "Server",
+        },
+        "serve-http": {
+            "cmd": "python -m gopher_mcp --transport streamable-http",
+            "desc": "Run MCP server (streamable HTTP)",
+            "category": "Server",
+        },
+        "serve-sse": {
+            "cmd": "python -m gopher_mcp --transport sse",
+            "desc": "Run MCP server (SSE)",
+            "category": "Server",
+        },
+        # Documentation
+        "docs-serve": {
+            "cmd": "mkdocs serve",
+            "desc": "Serve docs locally",
+            "category": "Documentation",
+        },
+        "docs-build": {
+            "cmd": "mkdocs build",
+            "desc": "Build documentation",
+            "category": "Documentation",
+        },
+        # Maintenance
+        "clean": {
+            "callable": "_clean",
+            "desc": "Clean build artifacts",
+            "category": "Maintenance",
+        },
+        "ci": {
+            "steps": ["check", "test-cov"],
+            "desc": "Run CI pipeline locally",
+            "category": "Maintenance",
+        },
+    }
+
+
 class TaskRunner:
     """Cross-platform task runner using uv and taskipy."""
 
     def __init__(self) -> None:
-        self.system = platform.system().lower()
-        self.is_windows = self.system == "windows"
+        self.is_windows = _IS_WINDOWS
         self.project_root = Path(__file__).parent
+        # Children are started in the project root. cwd is left as None when
+        # we are already there, since subprocess only takes the posix_spawn
+        # path without a cwd.
+        in_root = Path.cwd().resolve() == self.project_root.resolve()
+        self.cwd = None if in_root else self.project_root
         self.colors_enabled = Colors.is_supported()
+        # Status-line templates, colored once per runner
+        self._running_line = self._colorize("Running: {}", Colors.GREEN + Colors.BOLD)
+        self._command_line = self._colorize("Command: {}", Colors.BLUE + Colors.DIM)
 
-        # Task definitions - mirrors pyproject.toml [tool.taskipy.tasks]
-        self.tasks = {
-            # Development setup
-            "dev-setup": {
-                "cmd": "bash scripts/dev-setup.sh"
-                if not self.is_windows
-                else "scripts\\dev-setup.bat",
-                "desc": "Set up development environment",
-                "category": "Setup",
-            },
-            "install-hooks": {
-                "cmd": "pre-commit install",
-                "desc": "Install pre-commit hooks",
-                "category": "Setup",
-            },
-            # Code quality
-            "lint": {
-                # Whole-repo to match CI (`ruff check .`); scoping to src/tests
-                # lets violations in task.py/scripts/ pass locally but fail CI.
-                "cmd": "ruff check .",
-                "desc": "Run ruff linting",
-                "category": "Code Quality",
-            },
-            "format": {
-                "cmd": "ruff format .",
-                "desc": "Format code with ruff",
-                "category": "Code Quality",
-            },
-            "typecheck": {
-                # Match CI's `mypy src` (no --ignore-missing-imports, which
-                # would hide missing-stub errors locally that CI still fails on).
-                "cmd": "mypy src",
-                "desc": "Run mypy type checking",
-                "category": "Code Quality",
-            },
-            "quality": {
-                "cmd": "uv run task lint && uv run task typecheck && uv run task test",
-                "desc": "Run all quality checks",
-                "category": "Code Quality",
-            },
-            "check": {
-                "cmd": "uv run task lint && uv run task typecheck",
-                "desc": "Run lint + typecheck",
-                "category": "Code Quality",
-            },
-            # Testing
-            "test": {
-                "cmd": "pytest tests/ -v",
-                "desc": "Run all tests",
-                "category": "Testing",
-            },
-            "test-cov": {
-                "cmd": "pytest tests/ -v --cov=src/gopher_mcp --cov-report=term-missing --cov-report=html",
-                "desc": "Run tests with coverage",
-                "category": "Testing",
-            },
-            "test-unit": {
-                "cmd": "pytest tests/ -v -m 'not integration and not slow'",
-                "desc": "Run unit tests only",
-                "category": "Testing",
-            },
-            "test-integration": {
-                "cmd": "pytest tests/ -v -m integration",
-                "desc": "Run integration tests",
-                "category": "Testing",
-            },
-            "test-slow": {
-                "cmd": "pytest tests/ -v -m slow",
-                "desc": "Run slow tests",
-                "category": "Testing",
-            },
-            # Server operations
-            "serve": {
-                "cmd": "python -m gopher_mcp",
-                "desc": "Run MCP server (stdio)",
-                "category": "Server",
-            },
-            "serve-http": {
-                "cmd": "python -m gopher_mcp --transport streamable-http",
-                "desc": "Run MCP server (streamable HTTP)",
-                "category": "Server",
-            },
-            "serve-sse": {
-                "cmd": "python -m gopher_mcp --transport sse",
-                "desc": "Run MCP server (SSE)",
-                "category": "Server",
-            },
-            # Documentation
-            "docs-serve": {
-                "cmd": "mkdocs serve",
-                "desc": "Serve docs locally",
-                "category": "Documentation",
-            },
-            "docs-build": {
-                "cmd": "mkdocs build",
-                "desc": "Build documentation",
-                "category": "Documentation",
-            },
-            # Maintenance
-            "clean": {
-                "cmd": self._get_clean_command(),
-                "desc": "Clean build artifacts",
-                "category": "Maintenance",
-            },
-            "ci": {
-                "cmd": "uv run task check && uv run task test-cov",
-                "desc": "Run CI pipeline locally",
-                "category": "Maintenance",
-            },
-        }
+        self.tasks = _build_tasks(self.is_windows)
 
     def _colorize(self, text: str, color: str) -> str:
         """Apply color to text if colors are supported."""
@@ -184,25 +230,6 @@ class TaskRunner:
             return f"{color}{text}{Colors.RESET}"
         return text
 
-    def _get_clean_command(self) -> str:
-        """Get platform-specific clean command."""
-        if self.is_windows:
-            return (
-                "if exist .pytest_cache rmdir /s /q .pytest_cache && "
-                "if exist .coverage del .coverage && "
-                "if exist htmlcov rmdir /s /q htmlcov && "
-                "if exist dist rmdir /s /q dist && "
-                "if exist build rmdir /s /q build && "
-                'for /d %%i in (*.egg-info) do rmdir /s /q "%%i" && '
-                "if exist .mypy_cache rmdir /s /q .mypy_cache && "
-                "if exist .ruff_cache rmdir /s /q .ruff_cache"
-            )
-        else:
-            return (
-                "rm -rf .pytest_cache .coverage htmlcov dist build "
-                "*.egg-info .mypy_cache .ruff_cache"
-            )
-
     def run_task(self, task_name: str, extra_args: list[str] | None = None) -> int:
         """Run a specific task."""
         if task_name not in self.tasks:
@@ -217,123 +244,239 @@ class TaskRunner:
             return 1
 
         task = self.tasks[task_name]
-        cmd = task["cmd"]
-
-        # For most tasks, use uv run to ensure proper environment
-        if not cmd.startswith(("bash ", "scripts\\", "uv run task")):
-            cmd = f"uv run {cmd}"
+        if "parallel_steps" in task:
+            return asyncio.run(self._run_parallel_steps(task, extra_args))
+        if "steps" in task:
+            return self._run_steps(task, extra_args)
+        if "callable" in task:
+            print(self._running_line.format(task["desc"]))
+            returncode: int = getattr(self, task["callable"])()
+            return returncode
+        cmd = self._command(task)
+        argv = self._argv(cmd, extra_args or [])
 
         # Add extra arguments if provided
         if extra_args:
             cmd += " " + " ".join(extra_args)
 
-        running_msg = self._colorize(
-            f"Running: {task['desc']}", Colors.GREEN + Colors.BOLD
-        )
-        print(running_msg)
-        command_msg = self._colorize(f"Command: {cmd}", Colors.BLUE + Colors.DIM)
-        print(command_msg)
-
-        # Change to project root
-        os.chdir(self.project_root)
+        print(self._running_line.format(task["desc"]))
+        print(self._command_line.format(cmd))
 
         # Execute command
-        if self.is_windows and not cmd.startswith("uv run"):
-            # Use cmd for Windows-specific commands
-            # shell=True is required for Windows batch files and complex commands  # nosec B602
-            result = subprocess.run(cmd, check=False, shell=True)  # nosec B602
+        if argv is None:
+            # shell=True is required for Windows batch files and for
+            # commands that use shell syntax  # nosec B602
+            result = subprocess.run(cmd, check=False, shell=True, cwd=self.cwd)  # nosec B602
         else:
-            # Use shell for cross-platform commands
-            # shell=True is required for pipes, redirects, and environment variables  # nosec B602
-            result = subprocess.run(cmd, check=False, shell=True)  # nosec B602
+            try:
+                result = subprocess.run(
+                    argv, check=False, cwd=self.cwd, close_fds=False
+                )
+            except FileNotFoundError:
+                return self._not_found(argv[0])
 
         return result.returncode
 
-    def show_help(self) -> None:
-        """Display help information."""
-        title = self._colorize(
-            "Gopher MCP Development Commands", Colors.BOLD + Colors.CYAN
+    def _clean(self) -> int:
+        """Remove build artifacts in-process rather than via rm/rmdir."""
+        root = self.project_root
+        for name in _CLEAN_DIRS:
+            shutil.rmtree(root / name, ignore_errors=True)
+        for name in _CLEAN_FILES:
+            (root / name).unlink(missing_ok=True)
+        for egg_info in root.glob("*.egg-info"):
+            shutil.rmtree(egg_info, ignore_errors=True)
+        return 0
+
+    def _command(self, task: dict[str, Any]) -> str:
+        """Return a leaf task's command line."""
+        cmd: str = task["cmd"]
+
+        # For most tasks, use uv run to ensure proper environment
+        if not cmd.startswith(("bash ", "scripts\\")):
+            cmd = f"uv run {cmd}"
+        return cmd
+
+    def _argv(self, cmd: str, extra_args: list[str]) -> list[str] | None:
+        """Split a command for running without a shell, or None if it needs one.
+
+        Plain commands skip the intermediate /bin/sh. Passing the executable
+        by path with close_fds=False lets subprocess use posix_spawn instead
+        of fork+exec.
+        """
+        if self.is_windows or _SHELL_SYNTAX.search(cmd):
+            return None
+        argv = shlex.split(cmd) + extra_args
+        argv[0] = shutil.which(argv[0]) or argv[0]
+        return argv
+
+    def _not_found(self, executable: str) -> int:
+        """Report a missing executable with the shell's "not found" status."""
+        print(self._colorize(f"Error: {executable}: not found", Colors.RED))
+        return 127
+
+    def _run_steps(self, task: dict[str, Any], extra_args: list[str] | None) -> int:
+        """Run a composite task's steps in order, stopping at the first failure.
+
+        The steps run from this interpreter instead of re-launching
+        ``uv run task`` for each one. Extra arguments go to the last step,
+        as they did when the steps were chained with ``&&``.
+        """
+        print(self._running_line.format(task["desc"]))
+        steps_msg = self._colorize(
+            f"Steps: {', '.join(task['steps'])}", Colors.BLUE + Colors.DIM
         )
-        separator = self._colorize("=" * 31, Colors.CYAN)
-        print()
-        print(title)
-        print(separator)
-        print()
-
-        # Group tasks by category
-        categories: dict[str, list[tuple[str, str]]] = {}
-        for task_name, task_info in self.tasks.items():
-            category = task_info["category"]
-            if category not in categories:
-                categories[category] = []
-            categories[category].append((task_name, task_info["desc"]))
-
-        # Display tasks by category
-        category_colors = {
-            "Setup": Colors.GREEN,
-            "Code Quality": Colors.YELLOW,
-            "Testing": Colors.BLUE,
-            "Server": Colors.MAGENTA,
-            "Documentation": Colors.CYAN,
-            "Maintenance": Colors.RED,
-        }
-
-        for category in [
-            "Setup",
-            "Code Quality",
-            "Testing",
-            "Server",
-            "Documentation",
-            "Maintenance",
-        ]:
-            if category in categories:
-                category_header = self._colorize(
-                    f"{category}:",
-                    Colors.BOLD + category_colors.get(category, Colors.WHITE),
-                )
-                print(category_header)
-                for task_name, desc in sorted(categories[category]):
-                    colored_task = self._colorize(task_name, Colors.BOLD + Colors.WHITE)
-                    colored_desc = self._colorize(desc, Colors.DIM)
-                    # Use fixed spacing to account for ANSI codes
-                    print(
-                        f"  {colored_task} {' ' * (16 - len(task_name))} {colored_desc}"
-                    )
-                print()
-
-        usage_header = self._colorize(
-            "Cross-platform usage:", Colors.BOLD + Colors.CYAN
+        print(steps_msg)
+
+        *leading, last = task["steps"]
+        for step in leading:
+            if returncode := self.run_task(step):
+                return returncode
+        return self.run_task(last, extra_args)
+
+    async def _run_parallel_steps(
+        self, task: dict[str, Any], extra_args: list[str] | None
+    ) -> int:
+        """Run independent leaf tasks concurrently.
+
+        Each child's stdout and stderr are merged and printed line by line,
+        tagged with the task name. Every step runs to completion; the result
+        is the first non-zero exit status in step order, or 0.
+        """
+        print(self._running_line.format(task["desc"]))
+        steps_msg = self._colorize(
+            f"Parallel steps: {', '.join(task['parallel_steps'])}",
+            Colors.BLUE + Colors.DIM,
         )
-        print(usage_header)
-        python_cmd = self._colorize("python task.py <command>", Colors.GREEN)
-        print(f"  {python_cmd}")
-        example_cmd = self._colorize("python task.py test", Colors.GREEN)
-        print(f"  Example: {example_cmd}")
-        print()
+        print(steps_msg)
 
-        alt_header = self._colorize("Alternative options:", Colors.BOLD + Colors.CYAN)
-        print(alt_header)
-        make_cmd = self._colorize("make <command>", Colors.YELLOW)
-        uv_cmd = self._colorize("uv run task <command>", Colors.YELLOW)
-        print(f"  Unix/macOS:   {make_cmd}")
-        print(f"  Universal:    {uv_cmd}")
+        *leading, last = task["parallel_steps"]
+        returncodes = await asyncio.gather(
+            *(self._run_tagged(step, []) for step in leading),
+            self._run_tagged(last, extra_args or []),
+        )
+        return next((code for code in returncodes if code), 0)
+
+    async def _run_tagged(self, task_name: str, extra_args: list[str]) -> int:
+        """Run one leaf task, prefixing each line of its output with its name."""
+        cmd = self._command(self.tasks[task_name])
+        argv = self._argv(cmd, extra_args)
+        if extra_args:
+            cmd += " " + " ".join(extra_args)
+
+        tag = self._colorize(f"[{task_name}]", Colors.CYAN)
+        print(f"{tag} {self._command_line.format(cmd)}")
+
+        if argv is None:
+            process = await asyncio.create_subprocess_shell(  # nosec B602
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=self.cwd
+            )
+        else:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    cwd=self.cwd,
+                    close_fds=False,
+                )
+            except FileNotFoundError:
+                return self._not_found(argv[0])
+
+        assert process.stdout is not None
+        async for line in process.stdout:
+            print(f"{tag} {line.decode(errors='replace').rstrip()}")
+        return await process.wait()
+
+    def show_help(self) -> None:
+        """Display help information."""
+        sys.stdout.write(_render_help(self.is_windows, self.colors_enabled))
+
+
+@functools.lru_cache(maxsize=2)
+def _render_help(is_windows: bool, colors_enabled: bool) -> str:
+    """Build the help text in one piece, so show_help does a single write."""
+
+    def colorize(text: str, color: str) -> str:
+        if colors_enabled:
+            return f"{color}{text}{Colors.RESET}"
+        return text
+
+    title = colorize("Gopher MCP Development Commands", Colors.BOLD + Colors.CYAN)
+    separator = colorize("=" * 31, Colors.CYAN)
+    lines = ["", title, separator, ""]
+
+    # Group tasks by category
+    categories: dict[str, list[tuple[str, str]]] = {}
+    for task_name, task_info in _build_tasks(is_windows).items():
+        category = task_info["category"]
+        if category not in categories:
+            categories[category] = []
+        categories[category].append((task_name, task_info["desc"]))
+
+    # Display tasks by category
+    category_colors = {
+        "Setup": Colors.GREEN,
+        "Code Quality": Colors.YELLOW,
+        "Testing": Colors.BLUE,
+        "Server": Colors.MAGENTA,
+        "Documentation": Colors.CYAN,
+        "Maintenance": Colors.RED,
+    }
+
+    for category in [
+        "Setup",
+        "Code Quality",
+        "Testing",
+        "Server",
+        "Documentation",
+        "Maintenance",
+    ]:
+        if category in categories:
+            category_header = colorize(
+                f"{category}:",
+                Colors.BOLD + category_colors.get(category, Colors.WHITE),
+            )
+            lines.append(category_header)
+            for task_name, desc in sorted(categories[category]):
+                # Pad the plain name before coloring so ANSI codes don't
+                # affect the column
+                colored_task = colorize(task_name.ljust(16), Colors.BOLD + Colors.WHITE)
+                colored_desc = colorize(desc, Colors.DIM)
+                lines.append(f"  {colored_task}  {colored_desc}")
+            lines.append("")
+
+    lines.append(colorize("Cross-platform usage:", Colors.BOLD + Colors.CYAN))
+    python_cmd = colorize("python task.py <command>", Colors.GREEN)
+    lines.append(f"  {python_cmd}")
+    example_cmd = colorize("python task.py test", Colors.GREEN)
+    lines.append(f"  Example: {example_cmd}")
+    lines.append("")
+
+    lines.append(colorize("Alternative options:", Colors.BOLD + Colors.CYAN))
+    make_cmd = colorize("make <command>", Colors.YELLOW)
+    uv_cmd = colorize("uv run task <command>", Colors.YELLOW)
+    lines.append(f"  Unix/macOS:   {make_cmd}")
+    lines.append(f"  Universal:    {uv_cmd}")
+    lines.append("")
+    return "\n".join(lines)
 
 
 def main() -> int:
     """Main entry point."""
-    # Handle help case first
+    # Handle help case first, without setting up a TaskRunner
     if len(sys.argv) == 1 or (
         len(sys.argv) == 2 and sys.argv[1] in ["help", "-h", "--help"]
     ):
-        runner = TaskRunner()
-        runner.show_help()
+        sys.stdout.write(_render_help(_IS_WINDOWS, Colors.is_supported()))
         return 0
 
+    runner = TaskRunner()
+
     # Parse task name and remaining arguments
     task_name = sys.argv[1]
     extra_args = sys.argv[2:] if len(sys.argv) > 2 else []
 
-    runner = TaskRunner()
     return runner.run_task(task_name, extra_args)
 
 
@@ -5,6 +5,19 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+# Category markers recorded on each test's JUnit ``<properties>`` so a single
+# suite run can be broken down by category afterwards (see
+# ``scripts/prepare-release.py``).
+_REPORTED_MARKERS = ("integration", "slow", "unit")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Record each test's category markers as JUnit user properties."""
+    for item in items:
+        for name in _REPORTED_MARKERS:
+            if item.get_closest_marker(name) is not None:
+                item.user_properties.append(("marker", name))
+
 
 @pytest.fixture(autouse=True)
 def isolated_home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
@@ -2,12 +2,13 @@
 
 import asyncio
 import time
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, create_autospec, patch
 
 import pytest
 
 from gopher_mcp.gemini_client import GeminiClient, _safe_display_url
-from gopher_mcp.gemini_tls import TLSConfig, TLSConnectionError
+from gopher_mcp.gemini_tls import GeminiTLSClient, TLSConfig, TLSConnectionError
 from gopher_mcp.models import (
     GeminiErrorResult,
     GeminiMimeType,
@@ -96,6 +97,10 @@ class TestGeminiClientInit:
         assert client.cache_ttl_seconds == 600
         assert client.max_cache_entries == 500
         assert client.allowed_hosts == {"example.com", "test.org"}
+        assert isinstance(client.allowed_hosts, frozenset)
+        # Read-only, so the configured allow-list can't be silently bypassed
+        with pytest.raises(AttributeError):
+            client.allowed_hosts = {"other.example"}
 
 
 class TestGeminiClientSecurity:
@@ -488,11 +493,37 @@ class TestGeminiClientFetch:
             )
 
 
+@pytest.fixture
+def patched_tls(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stub the TLS transport and response handling behind ``_fetch_content``.
+
+    Clients built while the fixture is active get an autospec'd
+    ``GeminiTLSClient`` (``tls``), whose async methods are ``AsyncMock``s.
+    ``parse_response`` and ``process_response`` replace the module-level
+    response helpers; tests set return values and side effects per case.
+    """
+    tls = create_autospec(GeminiTLSClient, instance=True)
+    parse_response = Mock()
+    process_response = Mock()
+    monkeypatch.setattr(
+        "gopher_mcp.gemini_client.GeminiTLSClient", Mock(return_value=tls)
+    )
+    monkeypatch.setattr(
+        "gopher_mcp.gemini_client.parse_gemini_response", parse_response
+    )
+    monkeypatch.setattr(
+        "gopher_mcp.gemini_client.process_gemini_response", process_response
+    )
+    return SimpleNamespace(
+        tls=tls, parse_response=parse_response, process_response=process_response
+    )
+
+
 class TestGeminiClientFetchContent:
     """Test GeminiClient _fetch_content method."""
 
     @pytest.mark.asyncio
-    async def test_fetch_content_success(self):
+    async def test_fetch_content_success(self, patched_tls):
         """Test successful content fetch."""
         client = GeminiClient()
 
@@ -523,38 +554,31 @@ class TestGeminiClientFetchContent:
             requestInfo={},
         )
 
-        with (
-            patch.object(client.tls_client, "connect") as mock_connect,
-            patch.object(client.tls_client, "send_data") as mock_send,
-            patch.object(client.tls_client, "receive_data") as mock_receive,
-            patch.object(client.tls_client, "close") as mock_close,
-            patch("gopher_mcp.gemini_client.parse_gemini_response") as mock_parse_resp,
-            patch("gopher_mcp.gemini_client.process_gemini_response") as mock_process,
-        ):
-            mock_connect.return_value = (mock_ssl_sock, mock_connection_info)
-            mock_receive.return_value = mock_raw_response
-            mock_parse_resp.return_value = mock_parsed_response
-            mock_process.return_value = mock_result
+        tls = patched_tls.tls
+        tls.connect.return_value = (mock_ssl_sock, mock_connection_info)
+        tls.receive_data.return_value = mock_raw_response
+        patched_tls.parse_response.return_value = mock_parsed_response
+        patched_tls.process_response.return_value = mock_result
 
-            result = await client._fetch_content(mock_parsed_url)
+        result = await client._fetch_content(mock_parsed_url)
 
-            assert result == mock_result
+        assert result == mock_result
 
-            # Verify TLS operations
-            mock_connect.assert_called_once_with(
-                "example.com", 1965, timeout=30.0, connect_ip="93.184.216.34"
-            )
-            mock_send.assert_called_once()
-            mock_receive.assert_called_once_with(mock_ssl_sock, 1024 * 1024)
-            mock_close.assert_called_once_with(mock_ssl_sock)
+        # Verify TLS operations
+        tls.connect.assert_called_once_with(
+            "example.com", 1965, timeout=30.0, connect_ip="93.184.216.34"
+        )
+        tls.send_data.assert_called_once()
+        tls.receive_data.assert_called_once_with(mock_ssl_sock, 1024 * 1024)
+        tls.close.assert_called_once_with(mock_ssl_sock)
 
-            # Verify request format
-            sent_data = mock_send.call_args[0][1]
-            expected_request = b"gemini://example.com/test?search\r\n"
-            assert sent_data == expected_request
+        # Verify request format
+        sent_data = tls.send_data.call_args[0][1]
+        expected_request = b"gemini://example.com/test?search\r\n"
+        assert sent_data == expected_request
 
     @pytest.mark.asyncio
-    async def test_fetch_content_brackets_ipv6_host_on_the_wire(self):
+    async def test_fetch_content_brackets_ipv6_host_on_the_wire(self, patched_tls):
         """An IPv6 literal host must be bracketed in the request line sent.
 
         Per RFC 3986 the address must be ``[..]`` so a server (and any URL
@@ -575,22 +599,15 @@ class TestGeminiClientFetchContent:
             size=2,
             requestInfo={},
         )
-        with (
-            patch.object(client.tls_client, "connect") as mock_connect,
-            patch.object(client.tls_client, "send_data") as mock_send,
-            patch.object(client.tls_client, "receive_data") as mock_receive,
-            patch.object(client.tls_client, "close"),
-            patch("gopher_mcp.gemini_client.parse_gemini_response"),
-            patch("gopher_mcp.gemini_client.process_gemini_response") as mock_process,
-        ):
-            mock_connect.return_value = (Mock(), mock_connection_info)
-            mock_receive.return_value = b"20 text/plain\r\nok"
-            mock_process.return_value = mock_result
+        tls = patched_tls.tls
+        tls.connect.return_value = (Mock(), mock_connection_info)
+        tls.receive_data.return_value = b"20 text/plain\r\nok"
+        patched_tls.process_response.return_value = mock_result
 
-            await client._fetch_content(mock_parsed_url)
+        await client._fetch_content(mock_parsed_url)
 
-            sent_data = mock_send.call_args[0][1]
-            assert sent_data == b"gemini://[2606:4700:4700::1111]:1966/p\r\n"
+        sent_data = tls.send_data.call_args[0][1]
+        assert sent_data == b"gemini://[2606:4700:4700::1111]:1966/p\r\n"
 
     def test_safe_display_url_brackets_ipv6_host(self):
         """The display/log helper must also bracket IPv6 hosts."""
@@ -601,7 +618,7 @@ class TestGeminiClientFetchContent:
         assert _safe_display_url(parsed) == "gemini://[2001:db8::1]/x"
 
     @pytest.mark.asyncio
-    async def test_send_is_bounded_by_request_deadline(self):
+    async def test_send_is_bounded_by_request_deadline(self, patched_tls):
         """A peer that completes the handshake then stops reading must not pin
         the request forever: the send must run under the request deadline, the
         same as the receive does (and as the Gopher transport already does)."""
@@ -618,20 +635,13 @@ class TestGeminiClientFetchContent:
         async def hanging_send(*args, **kwargs):
             await asyncio.sleep(0.5)  # far longer than the 0.05s deadline
 
-        with (
-            patch.object(client.tls_client, "connect") as mock_connect,
-            patch.object(client.tls_client, "send_data", side_effect=hanging_send),
-            patch.object(client.tls_client, "receive_data"),
-            patch.object(client.tls_client, "close"),
-            patch("gopher_mcp.gemini_client.parse_gemini_response"),
-            patch("gopher_mcp.gemini_client.process_gemini_response"),
-        ):
-            mock_connect.return_value = (Mock(), {"cert_fingerprint": "abc"})
-            with pytest.raises(TimeoutError):
-                await client._fetch_content(parsed)
+        patched_tls.tls.connect.return_value = (Mock(), {"cert_fingerprint": "abc"})
+        patched_tls.tls.send_data.side_effect = hanging_send
+        with pytest.raises(TimeoutError):
+            await client._fetch_content(parsed)
 
     @pytest.mark.asyncio
-    async def test_fetch_content_tls_error(self):
+    async def test_fetch_content_tls_error(self, patched_tls):
         """Test content fetch with TLS error."""
         client = GeminiClient()
 
@@ -639,15 +649,14 @@ class TestGeminiClientFetchContent:
         mock_parsed_url.host = "example.com"
         mock_parsed_url.port = 1965
 
-        with patch.object(client.tls_client, "connect") as mock_connect:
-            mock_connect.side_effect = TLSConnectionError("Connection failed")
+        patched_tls.tls.connect.side_effect = TLSConnectionError("Connection failed")
 
-            # The typed error now propagates (fetch() maps it to TLS_ERROR).
-            with pytest.raises(TLSConnectionError, match="Connection failed"):
-                await client._fetch_content(mock_parsed_url)
+        # The typed error now propagates (fetch() maps it to TLS_ERROR).
+        with pytest.raises(TLSConnectionError, match="Connection failed"):
+            await client._fetch_content(mock_parsed_url)
 
     @pytest.mark.asyncio
-    async def test_fetch_content_cleanup_on_error(self):
+    async def test_fetch_content_cleanup_on_error(self, patched_tls):
         """Test that TLS connection is cleaned up on error."""
         client = GeminiClient(tofu_enabled=False)
 
@@ -659,39 +668,52 @@ class TestGeminiClientFetchContent:
 
         mock_ssl_sock = Mock()
 
-        with (
-            patch.object(client.tls_client, "connect") as mock_connect,
-            patch.object(client.tls_client, "send_data") as mock_send,
-            patch.object(client.tls_client, "close") as mock_close,
-        ):
-            mock_connect.return_value = (mock_ssl_sock, {})
-            mock_send.side_effect = Exception("Send failed")
+        tls = patched_tls.tls
+        tls.connect.return_value = (mock_ssl_sock, {})
+        tls.send_data.side_effect = TLSConnectionError("Send failed")
+
+        with pytest.raises(TLSConnectionError, match="Send failed"):
+            await client._fetch_content(mock_parsed_url)
+
+        # Verify cleanup was called
+        tls.close.assert_called_once_with(mock_ssl_sock)
+
+
+@pytest.fixture
+def success_factory():
+    """Build text/plain ``GeminiSuccessResult``s from one validated prototype.
+
+    ``model_copy(update=...)`` reuses the prototype's validated mime type and
+    request info instead of re-running validation for every cached response.
+    """
+    prototype = GeminiSuccessResult(
+        content="",
+        mimeType=GeminiMimeType(type="text", subtype="plain"),
+        size=0,
+        requestInfo={},
+    )
 
-            with pytest.raises(Exception, match="Send failed"):
-                await client._fetch_content(mock_parsed_url)
+    def make(content: str) -> GeminiSuccessResult:
+        return prototype.model_copy(update={"content": content, "size": len(content)})
 
-            # Verify cleanup was called
-            mock_close.assert_called_once_with(mock_ssl_sock)
+    return make
 
 
 class TestGeminiClientCaching:
     """Test GeminiClient caching functionality."""
 
-    def test_get_cached_response_hit(self):
+    def test_get_cached_response_hit(self, success_factory):
         """Test cache hit."""
         client = GeminiClient(cache_enabled=True)
 
         # Add entry to cache
-        response = GeminiSuccessResult(
-            content="Cached",
-            mimeType=GeminiMimeType(type="text", subtype="plain"),
-            size=6,
-            requestInfo={},
-        )
+        response = success_factory("Cached")
         client._cache_response("gemini://example.com/", response)
 
         result = client._get_cached_response("gemini://example.com/")
         assert result == response
+        # Stored as-is, not re-validated into a copy
+        assert result is response
 
     def test_get_cached_response_miss(self):
         """Test cache miss."""
@@ -707,29 +729,14 @@ class TestGeminiClientCaching:
         result = client._get_cached_response("gemini://example.com/")
         assert result is None
 
-    def test_cache_response_eviction(self):
+    def test_cache_response_eviction(self, success_factory):
         """Test cache eviction when full."""
         client = GeminiClient(cache_enabled=True, max_cache_entries=2)
 
         # Fill cache
-        response1 = GeminiSuccessResult(
-            content="1",
-            mimeType=GeminiMimeType(type="text", subtype="plain"),
-            size=1,
-            requestInfo={},
-        )
-        response2 = GeminiSuccessResult(
-            content="2",
-            mimeType=GeminiMimeType(type="text", subtype="plain"),
-            size=1,
-            requestInfo={},
-        )
-        response3 = GeminiSuccessResult(
-            content="3",
-            mimeType=GeminiMimeType(type="text", subtype="plain"),
-            size=1,
-            requestInfo={},
-        )
+        response1 = success_factory("1")
+        response2 = success_factory("2")
+        response3 = success_factory("3")
 
         client._cache_response("url1", response1)
         client._cache_response("url2", response2)
@@ -741,17 +748,12 @@ class TestGeminiClientCaching:
         assert client._get_cached_response("url3") == response3
 
     @pytest.mark.asyncio
-    async def test_close(self):
+    async def test_close(self, success_factory):
         """Test client cleanup."""
         client = GeminiClient()
 
         # Add some cache entries
-        response = GeminiSuccessResult(
-            content="test",
-            mimeType=GeminiMimeType(type="text", subtype="plain"),
-            size=4,
-            requestInfo={},
-        )
+        response = success_factory("test")
         client._cache_response("url", response)
 
         await client.close()
@@ -762,38 +764,28 @@ class TestGeminiClientCaching:
 class TestGeminiClientCacheExpiry:
     """Test cache expiry functionality."""
 
-    def test_cache_expiry_and_cleanup(self):
+    def test_cache_expiry_and_cleanup(self, success_factory):
         """Test that expired cache entries are cleaned up."""
         client = GeminiClient(cache_ttl_seconds=1)
 
-        response = GeminiSuccessResult(
-            content="test",
-            mimeType=GeminiMimeType(type="text", subtype="plain"),
-            size=4,
-            requestInfo={},
-        )
+        response = success_factory("test")
 
         # Cache a response
         client._cache_response("test_url", response)
         assert len(client._cache) == 1
 
         # Mock time to simulate expiry
-        with patch("time.time", return_value=time.time() + 2):
+        with patch("time.monotonic", return_value=time.monotonic() + 2):
             # This should trigger cache cleanup
             cached = client._get_cached_response("test_url")
             assert cached is None
             assert len(client._cache) == 0
 
-    def test_disabled_caching_early_return(self):
+    def test_disabled_caching_early_return(self, success_factory):
         """Test that disabled caching returns early."""
         client = GeminiClient(cache_enabled=False)
 
-        response = GeminiSuccessResult(
-            content="test",
-            mimeType=GeminiMimeType(type="text", subtype="plain"),
-            size=4,
-            requestInfo={},
-        )
+        response = success_factory("test")
 
         # This should return early and not cache anything
         client._cache_response("test_url", response)
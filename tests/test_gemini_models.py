@@ -1,7 +1,7 @@
 """Tests for Gemini protocol models."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from gopher_mcp.models import (
     GeminiCacheEntry,
@@ -75,6 +75,29 @@ class TestGeminiMimeType:
         assert mime.is_text is True
         assert mime.is_gemtext is True
 
+    def test_mime_components_are_interned(self):
+        """Equal components parsed from different strings share one object."""
+        raw = "".join(["te", "xt/", "gem", "ini"])  # built at runtime, not a constant
+        main, sub = raw.split("/")
+        mime = GeminiMimeType(type=main, subtype=sub, charset="UTF-8".lower())
+
+        assert mime.type is GeminiMimeType(type="text", subtype="plain").type
+        assert mime.subtype is GeminiMimeType(type="text", subtype="gemini").subtype
+        assert (
+            mime.charset
+            is GeminiMimeType(type="a", subtype="b", charset="utf-8").charset
+        )
+
+    def test_full_type_tracks_subtype_changes(self):
+        """full_type reflects copies and reassignment, never a stale value."""
+        mime = GeminiMimeType(type="text", subtype="gemini")
+        assert mime.full_type == "text/gemini"
+        assert mime.model_copy(update={"subtype": "plain"}).full_type == "text/plain"
+
+        mime.subtype = "plain"
+        assert mime.full_type == "text/plain"
+        assert "full_type" not in mime.model_dump()
+
     def test_mime_type_with_charset(self):
         """Test MIME type with custom charset."""
         mime = GeminiMimeType(type="text", subtype="plain", charset="iso-8859-1")
@@ -198,6 +221,15 @@ class TestGeminiResponse:
         with pytest.raises(ValidationError, match="Meta field too long"):
             GeminiResponse(status=GeminiStatusCode.SUCCESS, meta=long_meta)
 
+    def test_meta_length_counts_utf8_bytes(self):
+        """A non-ASCII meta is measured in bytes, not characters."""
+        # 400 characters but 1200 bytes ("€" is three bytes in UTF-8)
+        with pytest.raises(ValidationError, match="Meta field too long"):
+            GeminiResponse(status=GeminiStatusCode.SUCCESS, meta="€" * 400)
+
+        response = GeminiResponse(status=GeminiStatusCode.SUCCESS, meta="é" * 512)
+        assert len(response.meta.encode("utf-8")) == 1024
+
 
 class TestGeminiResultModels:
     """Test Gemini result models."""
@@ -218,6 +250,14 @@ class TestGeminiResultModels:
         assert result.size == 13
         assert result.request_info["url"] == "gemini://example.org/"
 
+    def test_results_are_frozen(self):
+        """Result models are read-only once built."""
+        result = GeminiInputResult(prompt="Search", requestInfo={"url": "x"})
+        assert result.request_info == {"url": "x"}
+
+        with pytest.raises(ValidationError, match="frozen"):
+            result.prompt = "changed"
+
     def test_input_result(self):
         """Test GeminiInputResult model."""
         result = GeminiInputResult(
@@ -279,7 +319,7 @@ class TestGemtextModels:
     """Test gemtext content models."""
 
     def test_gemtext_line_types(self):
-        """Test GemtextLineType enum values."""
+        """Test GemtextLineType constant values."""
         assert GemtextLineType.TEXT == "text"
         assert GemtextLineType.LINK == "link"
         assert GemtextLineType.HEADING_1 == "heading1"
@@ -341,7 +381,10 @@ class TestGemtextModels:
         """The serialized line drops the always-null per-line fields to cut LLM
         token cost (a text line carried 7 null fields before)."""
         line = GemtextLine(type=GemtextLineType.TEXT, content="hello")
-        assert line.model_dump() == {"type": "text", "content": "hello"}
+        assert TypeAdapter(GemtextLine).dump_python(line) == {
+            "type": "text",
+            "content": "hello",
+        }
 
     def test_gemtext_line_serialization_keeps_populated_fields(self):
         """Populated structured fields still serialize."""
@@ -353,7 +396,7 @@ class TestGemtextModels:
             level=1,
             heading=GemtextHeading(level=1, text="Hi", raw_content="# Hi"),
         )
-        dumped = line.model_dump()
+        dumped = TypeAdapter(GemtextLine).dump_python(line)
         assert dumped["level"] == 1
         assert dumped["heading"]["text"] == "Hi"
         # ...but the unrelated null fields are gone.
@@ -498,6 +541,24 @@ class TestSecurityModels:
         assert not entry.is_expired(1640995300.0)  # Within TTL
         assert entry.is_expired(1640995600.0)  # After TTL
 
+    def test_cache_entry_value_dispatches_on_kind(self):
+        """The response union is tagged by ``kind``."""
+        entry = GeminiCacheEntry(
+            key="gemini://example.org/",
+            value={"kind": "redirect", "newUrl": "gemini://example.org/new"},
+            timestamp=1640995200.0,
+            ttl=300,
+        )
+        assert isinstance(entry.value, GeminiRedirectResult)
+
+        with pytest.raises(ValidationError, match="does not match any of the"):
+            GeminiCacheEntry(
+                key="gemini://example.org/",
+                value={"kind": "bogus"},
+                timestamp=1640995200.0,
+                ttl=300,
+            )
+
 
 class TestGemtextDocumentProperties:
     """Test GemtextDocument property methods."""
@@ -10,79 +10,119 @@ from gopher_mcp.utils import (
     validate_gemini_url_components,
 )
 
+# "gemini://example.org/" is 21 bytes, so this path takes the URL past the
+# 1024-byte limit
+_LONG_PATH = "a" * 1010
+_LONG_URL = f"gemini://example.org/{_LONG_PATH}"
+
+# (url, host, port, path, query) for valid URLs
+PARSE_CASES = [
+    pytest.param("gemini://example.org/", "example.org", 1965, "/", None, id="basic"),
+    pytest.param(
+        "gemini://example.org:7070/", "example.org", 7070, "/", None, id="port"
+    ),
+    pytest.param(
+        "gemini://example.org/docs/spec.gmi",
+        "example.org",
+        1965,
+        "/docs/spec.gmi",
+        None,
+        id="path",
+    ),
+    pytest.param(
+        "gemini://example.org/search?gemini%20protocol",
+        "example.org",
+        1965,
+        "/search",
+        "gemini%20protocol",
+        id="query",
+    ),
+    pytest.param(
+        "gemini://gemini.circumlunar.space:1965/docs/specification.gmi?section=status",
+        "gemini.circumlunar.space",
+        1965,
+        "/docs/specification.gmi",
+        "section=status",
+        id="complete",
+    ),
+    pytest.param(
+        "gemini://example.org", "example.org", 1965, "/", None, id="empty-path"
+    ),
+    pytest.param(
+        "gemini://192.168.1.100:1965/test",
+        "192.168.1.100",
+        1965,
+        "/test",
+        None,
+        id="ip-address",
+    ),
+]
+
+# (format_gemini_url kwargs, expected URL)
+FORMAT_CASES = [
+    pytest.param({"host": "example.org"}, "gemini://example.org/", id="basic"),
+    pytest.param(
+        {"host": "example.org", "port": 7070}, "gemini://example.org:7070/", id="port"
+    ),
+    pytest.param(
+        {"host": "example.org", "port": 1965},
+        "gemini://example.org/",
+        id="default-port-omitted",
+    ),
+    pytest.param(
+        {"host": "example.org", "path": "/docs/spec.gmi"},
+        "gemini://example.org/docs/spec.gmi",
+        id="path",
+    ),
+    pytest.param(
+        {"host": "example.org", "path": "docs/spec.gmi"},
+        "gemini://example.org/docs/spec.gmi",
+        id="path-normalized",
+    ),
+    pytest.param(
+        {"host": "example.org", "query": "search=test"},
+        "gemini://example.org/?search=test",
+        id="query",
+    ),
+    pytest.param(
+        {"host": "example.org", "port": 7070, "path": "/search", "query": "q=gemini"},
+        "gemini://example.org:7070/search?q=gemini",
+        id="complete",
+    ),
+]
+
+# GeminiURL keyword arguments that must fail validation
+_PORT_RANGE = "Port must be between 1 and 65535"
+_EMPTY_HOST = "Host cannot be empty"
+
+INVALID_MODEL_CASES = [
+    pytest.param({"host": "example.org", "port": 0}, _PORT_RANGE, id="port-low"),
+    pytest.param({"host": "example.org", "port": 70000}, _PORT_RANGE, id="port-high"),
+    pytest.param({"host": ""}, _EMPTY_HOST, id="empty-host"),
+    pytest.param({"host": "   "}, _EMPTY_HOST, id="whitespace-host"),
+]
+
+ROUNDTRIP_URLS = [
+    "gemini://example.org/",
+    "gemini://example.org:7070/",
+    "gemini://example.org/path",
+    "gemini://example.org/path?query=test",
+    "gemini://example.org:7070/path?query=test",
+]
+
 
 class TestGeminiURLParsing:
     """Test Gemini URL parsing functionality."""
 
-    def test_basic_gemini_url(self):
-        """Test parsing a basic Gemini URL."""
-        url = "gemini://example.org/"
-        parsed = parse_gemini_url(url)
-
-        assert parsed.host == "example.org"
-        assert parsed.port == 1965
-        assert parsed.path == "/"
-        assert parsed.query is None
-
-    def test_gemini_url_with_port(self):
-        """Test parsing Gemini URL with custom port."""
-        url = "gemini://example.org:7070/"
-        parsed = parse_gemini_url(url)
-
-        assert parsed.host == "example.org"
-        assert parsed.port == 7070
-        assert parsed.path == "/"
-        assert parsed.query is None
-
-    def test_gemini_url_with_path(self):
-        """Test parsing Gemini URL with path."""
-        url = "gemini://example.org/docs/spec.gmi"
-        parsed = parse_gemini_url(url)
-
-        assert parsed.host == "example.org"
-        assert parsed.port == 1965
-        assert parsed.path == "/docs/spec.gmi"
-        assert parsed.query is None
-
-    def test_gemini_url_with_query(self):
-        """Test parsing Gemini URL with query string."""
-        url = "gemini://example.org/search?gemini%20protocol"
-        parsed = parse_gemini_url(url)
-
-        assert parsed.host == "example.org"
-        assert parsed.port == 1965
-        assert parsed.path == "/search"
-        assert parsed.query == "gemini%20protocol"
-
-    def test_gemini_url_complete(self):
-        """Test parsing complete Gemini URL with all components."""
-        url = "gemini://gemini.circumlunar.space:1965/docs/specification.gmi?section=status"
-        parsed = parse_gemini_url(url)
-
-        assert parsed.host == "gemini.circumlunar.space"
-        assert parsed.port == 1965
-        assert parsed.path == "/docs/specification.gmi"
-        assert parsed.query == "section=status"
-
-    def test_gemini_url_empty_path(self):
-        """Test parsing Gemini URL with empty path."""
-        url = "gemini://example.org"
-        parsed = parse_gemini_url(url)
-
-        assert parsed.host == "example.org"
-        assert parsed.port == 1965
-        assert parsed.path == "/"
-        assert parsed.query is None
-
-    def test_gemini_url_ip_address(self):
-        """Test parsing Gemini URL with IP address."""
-        url = "gemini://192.168.1.100:1965/test"
+    @pytest.mark.parametrize(("url", "host", "port", "path", "query"), PARSE_CASES)
+    def test_parse_valid_url(self, url, host, port, path, query):
+        """Test parsing valid Gemini URLs into their components."""
         parsed = parse_gemini_url(url)
 
-        assert parsed.host == "192.168.1.100"
-        assert parsed.port == 1965
-        assert parsed.path == "/test"
-        assert parsed.query is None
+        assert parsed.host == host
+        assert parsed.port == port
+        assert parsed.path == path
+        assert parsed.query == query
 
     def test_invalid_scheme(self):
         """Test that non-Gemini URLs are rejected."""
@@ -106,13 +146,8 @@ class TestGeminiURLParsing:
 
     def test_url_length_limit(self):
         """Test that URLs exceeding 1024 bytes are rejected."""
-        # Create a URL that exceeds 1024 bytes
-        # "gemini://example.org/" is 21 bytes, so we need path > 1003 bytes
-        long_path = "a" * 1010  # This will make the total URL > 1024 bytes
-        url = f"gemini://example.org/{long_path}"
-
         with pytest.raises(ValueError, match="URL must not exceed 1024 bytes"):
-            parse_gemini_url(url)
+            parse_gemini_url(_LONG_URL)
 
     def test_invalid_port_range(self):
         """Test that invalid port numbers are rejected."""
@@ -161,42 +196,10 @@ class TestGeminiURLParsing:
 class TestGeminiURLFormatting:
     """Test Gemini URL formatting functionality."""
 
-    def test_basic_url_formatting(self):
-        """Test formatting a basic Gemini URL."""
-        url = format_gemini_url("example.org")
-        assert url == "gemini://example.org/"
-
-    def test_url_formatting_with_port(self):
-        """Test formatting Gemini URL with custom port."""
-        url = format_gemini_url("example.org", port=7070)
-        assert url == "gemini://example.org:7070/"
-
-    def test_url_formatting_default_port_omitted(self):
-        """Test that default port 1965 is omitted."""
-        url = format_gemini_url("example.org", port=1965)
-        assert url == "gemini://example.org/"
-
-    def test_url_formatting_with_path(self):
-        """Test formatting Gemini URL with path."""
-        url = format_gemini_url("example.org", path="/docs/spec.gmi")
-        assert url == "gemini://example.org/docs/spec.gmi"
-
-    def test_url_formatting_path_normalization(self):
-        """Test that paths are normalized to start with /."""
-        url = format_gemini_url("example.org", path="docs/spec.gmi")
-        assert url == "gemini://example.org/docs/spec.gmi"
-
-    def test_url_formatting_with_query(self):
-        """Test formatting Gemini URL with query."""
-        url = format_gemini_url("example.org", query="search=test")
-        assert url == "gemini://example.org/?search=test"
-
-    def test_url_formatting_complete(self):
-        """Test formatting complete Gemini URL."""
-        url = format_gemini_url(
-            "example.org", port=7070, path="/search", query="q=gemini"
-        )
-        assert url == "gemini://example.org:7070/search?q=gemini"
+    @pytest.mark.parametrize(("kwargs", "expected"), FORMAT_CASES)
+    def test_url_formatting(self, kwargs, expected):
+        """Test formatting Gemini URLs from their components."""
+        assert format_gemini_url(**kwargs) == expected
 
 
 class TestGeminiURLValidation:
@@ -234,14 +237,10 @@ class TestGeminiURLValidation:
 
     def test_url_length_limit_validation(self):
         """Test that resulting URL length is validated."""
-        # Create components that would result in a URL > 1024 bytes
-        # "gemini://example.org/" is 21 bytes, so path needs to be > 1003 bytes
-        long_path = "/" + "a" * 1010  # This will make the total URL > 1024 bytes
-
         with pytest.raises(
             ValueError, match="Resulting URL would exceed 1024 byte limit"
         ):
-            validate_gemini_url_components("example.org", 1965, long_path)
+            validate_gemini_url_components("example.org", 1965, "/" + _LONG_PATH)
 
 
 class TestGeminiURLModel:
@@ -267,21 +266,11 @@ class TestGeminiURLModel:
         assert url.path == "/"
         assert url.query is None
 
-    def test_gemini_url_port_validation(self):
-        """Test GeminiURL port validation."""
-        with pytest.raises(ValidationError):
-            GeminiURL(host="example.org", port=0)
-
-        with pytest.raises(ValidationError):
-            GeminiURL(host="example.org", port=70000)
-
-    def test_gemini_url_host_validation(self):
-        """Test GeminiURL host validation."""
-        with pytest.raises(ValidationError):
-            GeminiURL(host="")
-
-        with pytest.raises(ValidationError):
-            GeminiURL(host="   ")
+    @pytest.mark.parametrize(("kwargs", "message"), INVALID_MODEL_CASES)
+    def test_gemini_url_invalid(self, kwargs, message):
+        """Test GeminiURL rejects out-of-range ports and empty hosts."""
+        with pytest.raises(ValidationError, match=message):
+            GeminiURL(**kwargs)
 
 
 class TestGeminiFetchRequest:
@@ -299,11 +288,8 @@ class TestGeminiFetchRequest:
 
     def test_url_length_validation(self):
         """Test URL length validation in request model."""
-        # Create a URL that exceeds 1024 bytes
-        long_url = "gemini://example.org/" + "a" * 1010
-
         with pytest.raises(ValidationError, match="URL must not exceed 1024 bytes"):
-            GeminiFetchRequest(url=long_url)
+            GeminiFetchRequest(url=_LONG_URL)
 
     def test_gemini_fetch_request_examples(self):
         """Test that example URLs in the model are valid."""
@@ -320,29 +306,21 @@ class TestGeminiFetchRequest:
 class TestGeminiURLRoundTrip:
     """Test round-trip parsing and formatting."""
 
-    def test_parse_format_roundtrip(self):
+    @pytest.mark.parametrize("original_url", ROUNDTRIP_URLS)
+    def test_parse_format_roundtrip(self, original_url):
         """Test that parsing and formatting are consistent."""
-        original_urls = [
-            "gemini://example.org/",
-            "gemini://example.org:7070/",
-            "gemini://example.org/path",
-            "gemini://example.org/path?query=test",
-            "gemini://example.org:7070/path?query=test",
-        ]
-
-        for original_url in original_urls:
-            parsed = parse_gemini_url(original_url)
-            formatted = format_gemini_url(
-                parsed.host, parsed.port, parsed.path, parsed.query
-            )
+        parsed = parse_gemini_url(original_url)
+        formatted = format_gemini_url(
+            parsed.host, parsed.port, parsed.path, parsed.query
+        )
 
-            # Parse again to compare components
-            reparsed = parse_gemini_url(formatted)
+        # Parse again to compare components
+        reparsed = parse_gemini_url(formatted)
 
-            assert reparsed.host == parsed.host
-            assert reparsed.port == parsed.port
-            assert reparsed.path == parsed.path
-            assert reparsed.query == parsed.query
+        assert reparsed.host == parsed.host
+        assert reparsed.port == parsed.port
+        assert reparsed.path == parsed.path
+        assert reparsed.query == parsed.query
 
 
 class TestGeminiUtilityFunctions:
@@ -399,20 +377,19 @@ class TestGeminiUtilityFunctions:
         assert home_dir.exists()
         assert home_dir.is_dir()
 
-    def test_get_home_directory_fallback(self):
+    def test_get_home_directory_fallback(self, monkeypatch):
         """Test home directory fallback handling."""
-        import os
         from pathlib import Path
         from unittest.mock import patch
 
         from gopher_mcp.utils import get_home_directory
 
         # Test fallback to environment variables
+        monkeypatch.setenv("HOME", "/tmp")
         with patch("pathlib.Path.home", side_effect=Exception("No home")):
-            with patch.dict(os.environ, {"HOME": "/tmp"}, clear=False):
-                home_dir = get_home_directory()
-                assert home_dir is not None
-                assert home_dir == Path("/tmp")
+            home_dir = get_home_directory()
+            assert home_dir is not None
+            assert home_dir == Path("/tmp")
 
     def test_guess_mime_type(self):
         """Test MIME type guessing functionality."""
@@ -604,6 +581,22 @@ class TestGemtextParsingRobustness:
         assert line.type == "quote"
         assert line.quote.text == " two leading spaces"
 
+    def test_parser_has_headings(self):
+        from gopher_mcp.utils import parse_gemtext
+
+        # A heading marker inside a preformat block is content, not a heading.
+        assert parse_gemtext("text\n## Section").has_headings is True
+        assert parse_gemtext("text\n```\n# not a heading\n```").has_headings is False
+
+    def test_has_headings_follows_copied_lines(self):
+        from gopher_mcp.utils import parse_gemtext
+
+        doc = parse_gemtext("# Title\ntext\n")
+        text_only = [line for line in doc.lines if line.type == "text"]
+
+        assert doc.has_headings is True
+        assert doc.model_copy(update={"lines": text_only}).has_headings is False
+
 
 class TestGeminiResponseErrorMessages:
     """parse_gemini_response must not double-wrap its own validation errors."""
@@ -11,6 +11,7 @@ from gopher_mcp.models import (
     BinaryResult,
     CacheEntry,
     ErrorResult,
+    GopherMenuItem,
     GopherURL,
     MenuResult,
     TextResult,
@@ -55,6 +56,10 @@ class TestGopherClientInitialization:
         assert client.max_selector_length == 512
         assert client.max_search_length == 128
         assert client.allowed_hosts == {"example.com", "test.com"}
+        assert isinstance(client.allowed_hosts, frozenset)
+        # Read-only, so the configured allow-list can't be silently bypassed
+        with pytest.raises(AttributeError):
+            client.allowed_hosts = {"other.example"}
 
 
 class TestSecurityValidation:
@@ -192,29 +197,27 @@ class TestSecurityValidation:
         client = GopherClient()
 
         # Test with port 0 (invalid)
+        # model_copy skips validation, so it can carry an out-of-range port
         parsed_url_low = GopherURL(
             host="example.com",
             port=1,  # Valid port for creation
             gopherType="1",
             selector="/test",
             search=None,
-        )
-        # Manually set invalid port to test validation
-        parsed_url_low.port = 0
+        ).model_copy(update={"port": 0})
 
         with pytest.raises(ValueError, match="Invalid port number"):
             client._validate_security(parsed_url_low)
 
         # Test with port > 65535 (invalid)
+        # model_copy skips validation, so it can carry an out-of-range port
         parsed_url_high = GopherURL(
             host="example.com",
             port=65535,  # Valid port for creation
             gopherType="1",
             selector="/test",
             search=None,
-        )
-        # Manually set invalid port to test validation
-        parsed_url_high.port = 70000
+        ).model_copy(update={"port": 70000})
 
         with pytest.raises(ValueError, match="Invalid port number"):
             client._validate_security(parsed_url_high)
@@ -244,7 +247,7 @@ class TestCacheManagement:
         expired_entry = CacheEntry(
             key=url,
             value=MenuResult(items=[]),
-            timestamp=time.time() - 1000,  # Old timestamp
+            timestamp=time.monotonic() - 1000,  # Old timestamp
             ttl=300,
         )
         client._cache[url] = expired_entry
@@ -261,7 +264,7 @@ class TestCacheManagement:
 
         # Add valid entry
         entry = CacheEntry(
-            key=url, value=expected_result, timestamp=time.time(), ttl=300
+            key=url, value=expected_result, timestamp=time.monotonic(), ttl=300
         )
         client._cache[url] = entry
 
@@ -300,6 +303,39 @@ class TestCacheManagement:
         assert url2 in client._cache
         assert url3 in client._cache
 
+    @pytest.mark.asyncio
+    async def test_fetch_dict_cache_hits_are_independent(self):
+        """Each cache hit gets its own dict, so edits can't leak between callers."""
+        client = GopherClient()
+        url = "gopher://example.com/1/"
+        item = GopherMenuItem(
+            type="0",
+            title="Doc",
+            selector="/d",
+            host="example.com",
+            port=70,
+            nextUrl="gopher://example.com/0/d",
+        )
+        client._cache_response(url, MenuResult(items=[item]))
+
+        first = await client.fetch_dict(url)
+        first["items"][0]["title"] = "changed"
+        second = await client.fetch_dict(url)
+
+        assert second is not first
+        assert second["items"][0]["title"] == "Doc"
+
+    @pytest.mark.asyncio
+    async def test_fetch_dict_uncached_response_is_dumped(self):
+        """Responses that were not cached are serialized on every call."""
+        client = GopherClient(cache_enabled=False)
+        response = TextResult(text="hi", bytes=2)
+
+        with patch.object(client, "fetch", AsyncMock(return_value=response)):
+            result = await client.fetch_dict("gopher://example.com/0/file.txt")
+
+        assert result == response.model_dump()
+
 
 class TestClientCleanup:
     """Test client cleanup functionality."""
@@ -311,12 +347,12 @@ class TestClientCleanup:
 
         # Add some cache entries
         client._cache["test1"] = CacheEntry(
-            key="test1", value=MenuResult(items=[]), timestamp=time.time(), ttl=300
+            key="test1", value=MenuResult(items=[]), timestamp=time.monotonic(), ttl=300
         )
         client._cache["test2"] = CacheEntry(
             key="test2",
             value=TextResult(text="test", bytes=4, charset="utf-8"),
-            timestamp=time.time(),
+            timestamp=time.monotonic(),
             ttl=300,
         )
 
@@ -344,7 +380,7 @@ class TestFetchMethod:
             client._cache[url] = CacheEntry(
                 key=url,
                 value=expected_result,
-                timestamp=time.time(),
+                timestamp=time.monotonic(),
                 ttl=300,
             )
 
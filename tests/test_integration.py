@@ -13,6 +13,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from gopher_mcp.config import AppConfig
 from gopher_mcp.server import (
     ClientManager,
     gemini_fetch,
@@ -20,10 +21,13 @@ from gopher_mcp.server import (
     gopher_fetch,
 )
 
+# None of these tests exercise env handling, so parse the settings once.
+SETTINGS = AppConfig()
+
 
 def clear_client_manager():
-    """Helper to clear client manager singleton."""
-    ClientManager._instance = None
+    """Helper to reset the client manager singleton to fresh clients."""
+    ClientManager._instance = ClientManager.for_settings(SETTINGS)
 
 
 def patch_gopher(raw: bytes) -> Any:
@@ -432,7 +436,7 @@ class TestConcurrency:
     @pytest.mark.asyncio
     async def test_client_manager_singleton_thread_safety(self) -> None:
         """Test that ClientManager singleton is thread-safe."""
-        clear_client_manager()
+        ClientManager._instance = None
 
         # Get client manager multiple times concurrently
         tasks = [get_client_manager() for _ in range(10)]
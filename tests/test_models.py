@@ -285,3 +285,7 @@ class TestCacheEntry:
 
         # Expired
         assert entry.is_expired(1400.0)  # 400 seconds later
+
+        # Boundary: expires strictly after timestamp + ttl
+        assert entry.expires_at == 1300.0
+        assert not entry.is_expired(1300.0)
@@ -10,6 +10,8 @@ below and the corresponding documentation/examples.
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from gopher_mcp import models
@@ -83,7 +85,10 @@ EXPECTED_KEYS: dict[str, set[str]] = {
 def test_serialized_keys_match_contract(model_name: str) -> None:
     """The model's serialized key set matches the documented contract."""
     model = getattr(models, model_name)
-    serialized = set(model.model_fields) | set(model.model_computed_fields)
+    if dataclasses.is_dataclass(model):
+        serialized = {f.name for f in dataclasses.fields(model)}
+    else:
+        serialized = set(model.model_fields) | set(model.model_computed_fields)
     assert serialized == EXPECTED_KEYS[model_name], (
         f"{model_name} serialized keys changed: "
         f"unexpected={serialized - EXPECTED_KEYS[model_name]}, "
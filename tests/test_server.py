@@ -1,155 +1,351 @@
 """Tests for gopher_mcp.server module."""
 
 import os
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from gopher_mcp.config import reset_config
+from gopher_mcp import __main__ as entry
+from gopher_mcp.config import AppConfig, GopherConfig, reset_config
+from gopher_mcp.gemini_client import GeminiClient
+from gopher_mcp.gemini_parse import parse_gemini_url
+from gopher_mcp.gopher_client import GopherClient
+from gopher_mcp.gopher_parse import parse_gopher_url
+from gopher_mcp.models import GopherMenuItem
 from gopher_mcp.server import (
+    MAX_BATCH_URLS,
+    SERVER_INSTRUCTIONS,
     ClientManager,
+    _GopherUrl,
     cleanup,
+    gemini_batch_fetch,
     gemini_fetch,
     get_client_manager,
+    gopher_batch_fetch,
     gopher_fetch,
     mcp,
 )
 
+_ENV_PREFIXES = ("GOPHER_", "GEMINI_")
+
+# Settings already parsed, keyed on the protocol environment they came from.
+_parsed_configs: dict[tuple[tuple[str, str], ...], AppConfig] = {}
+
 
 def clear_client_manager():
-    """Helper to clear the client-manager singleton."""
-    ClientManager._instance = None
-    # Also reset the config so it picks up new environment variables
-    reset_config()
+    """Install a fresh client manager built from the current environment.
 
+    The manager gets its settings through ``ClientManager.for_settings``;
+    they are parsed once per distinct set of ``GOPHER_*``/``GEMINI_*``
+    variables, so consecutive cases with the same environment reuse them.
+    """
+    env = tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.upper().startswith(_ENV_PREFIXES)
+        )
+    )
+    config = _parsed_configs.get(env)
+    if config is None:
+        config = _parsed_configs[env] = AppConfig()
+    ClientManager._instance = ClientManager.for_settings(config)
 
-class TestGetGopherClient:
-    """Test get_gopher_client function via ClientManager."""
 
-    @pytest.mark.asyncio
-    async def test_get_gopher_client_default_config(self):
-        """Test getting gopher client with default configuration."""
+@pytest.fixture(autouse=True)
+def _clear_protocol_env(monkeypatch):
+    """Remove inherited ``GOPHER_*``/``GEMINI_*`` settings for every test.
+
+    Only those keys are touched (and restored afterwards), so the rest of the
+    environment -- including the isolated ``HOME`` -- stays in place.
+    """
+    for key in list(os.environ):
+        if key.upper().startswith(_ENV_PREFIXES):
+            monkeypatch.delenv(key)
+
+
+@pytest.fixture
+def set_env(monkeypatch):
+    """Return a setter for environment variables, undone after the test.
+
+    monkeypatch records only the keys it touches, so nothing beyond the
+    given mapping is snapshotted or restored.
+    """
+
+    def _set(mapping):
+        for key, value in mapping.items():
+            monkeypatch.setenv(key, value)
+
+    return _set
+
+
+@pytest.fixture
+def build_client(set_env):
+    """Return a builder for the ClientManager's client of a given protocol.
+
+    The environment is applied before a fresh manager is installed, so each
+    client is built from exactly the given variables.
+    """
+
+    async def _build(protocol, env=None):
+        set_env(env or {})
         clear_client_manager()
 
-        with patch.dict(os.environ, {}, clear=True):
-            manager = await get_client_manager()
-            client = await manager.get_gopher_client()
+        manager = await get_client_manager()
+        return await getattr(manager, f"get_{protocol}_client")()
+
+    return _build
+
+
+@pytest.fixture
+async def gopher_client(request, build_client):
+    """Build the ClientManager's Gopher client from the given environment.
+
+    Parametrize indirectly with a dict of environment variables.
+    """
+    return await build_client("gopher", getattr(request, "param", None))
+
 
-            assert client is not None
-            assert client.max_response_size == 1048576  # 1MB default
-            assert client.timeout_seconds == 30.0
-            assert client.cache_enabled is True
-            assert client.cache_ttl_seconds == 300
-            assert client.max_cache_entries == 1000
-            assert client.allowed_hosts is None
-            assert client.max_selector_length == 1024
-            assert client.max_search_length == 256
+PROTOCOLS = ["gopher", "gemini"]
+
+# Settings shared by both clients, with their defaults.
+_DEFAULT_CLIENT_SETTINGS = {
+    "max_response_size": 1048576,  # 1MB
+    "timeout_seconds": 30.0,
+    "cache_enabled": True,
+    "cache_ttl_seconds": 300,
+    "max_cache_entries": 1000,
+    "allowed_hosts": None,
+}
+
+
+def _client_settings(client, expected):
+    """Read the attributes named in ``expected`` off ``client``.
+
+    Comparing the whole mapping reports every mismatched setting at once.
+    """
+    return {name: getattr(client, name) for name in expected}
+
+
+class TestGetClient:
+    """Test the Gopher and Gemini client getters on ClientManager."""
 
     @pytest.mark.asyncio
-    async def test_get_gopher_client_custom_config(self):
-        """Test getting gopher client with custom configuration."""
-        clear_client_manager()
+    @pytest.mark.parametrize("protocol", PROTOCOLS)
+    async def test_get_client_default_config(self, build_client, protocol):
+        """Test getting a client with default configuration.
 
-        env_vars = {
-            "GOPHER_MAX_RESPONSE_SIZE": "2097152",  # 2MB
-            "GOPHER_TIMEOUT_SECONDS": "60.0",
-            "GOPHER_CACHE_ENABLED": "false",
-            "GOPHER_CACHE_TTL_SECONDS": "600",
-            "GOPHER_MAX_CACHE_ENTRIES": "2000",
-            "GOPHER_ALLOWED_HOSTS": "example.com,test.com",
-            "GOPHER_MAX_SELECTOR_LENGTH": "2048",
-            "GOPHER_MAX_SEARCH_LENGTH": "512",
+        Gemini TOFU and client-cert storage land in the per-test home directory
+        set up by the autouse ``isolated_home`` fixture.
+        """
+        client = await build_client(protocol)
+
+        assert _client_settings(client, _DEFAULT_CLIENT_SETTINGS) == (
+            _DEFAULT_CLIENT_SETTINGS
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("protocol", PROTOCOLS)
+    @pytest.mark.parametrize(
+        ("attribute", "value", "expected"),
+        [
+            ("max_response_size", "2097152", 2097152),
+            ("timeout_seconds", "60.0", 60.0),
+            ("cache_enabled", "false", False),
+            ("cache_ttl_seconds", "600", 600),
+            ("max_cache_entries", "2000", 2000),
+            (
+                "allowed_hosts",
+                "  host1.com , host2.com  , host3.com  ",
+                {"host1.com", "host2.com", "host3.com"},
+            ),
+        ],
+    )
+    async def test_get_client_custom_config(
+        self, build_client, protocol, attribute, value, expected
+    ):
+        """Test that each shared setting is read from the protocol's env prefix."""
+        client = await build_client(
+            protocol, {f"{protocol}_{attribute}".upper(): value}
+        )
+
+        assert getattr(client, attribute) == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("protocol", PROTOCOLS)
+    async def test_get_client_singleton(self, build_client, protocol):
+        """Test that the getter returns the same instance."""
+        client = await build_client(protocol)
+        manager = await get_client_manager()
+
+        assert await getattr(manager, f"get_{protocol}_client")() is client
+
+    @pytest.mark.asyncio
+    async def test_get_gopher_client_selector_limits(self, gopher_client):
+        """Test the Gopher-only selector and search length defaults."""
+        assert gopher_client.max_selector_length == 1024
+        assert gopher_client.max_search_length == 256
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "gopher_client",
+        [
+            {
+                "GOPHER_MAX_RESPONSE_SIZE": "2097152",  # 2MB
+                "GOPHER_TIMEOUT_SECONDS": "60.0",
+                "GOPHER_CACHE_ENABLED": "false",
+                "GOPHER_CACHE_TTL_SECONDS": "600",
+                "GOPHER_MAX_CACHE_ENTRIES": "2000",
+                "GOPHER_ALLOWED_HOSTS": "example.com,test.com",
+                "GOPHER_MAX_SELECTOR_LENGTH": "2048",
+                "GOPHER_MAX_SEARCH_LENGTH": "512",
+            }
+        ],
+        indirect=True,
+    )
+    async def test_get_gopher_client_combined_config(self, gopher_client):
+        """Test that all Gopher settings apply together."""
+        expected = {
+            "max_response_size": 2097152,
+            "timeout_seconds": 60.0,
+            "cache_enabled": False,
+            "cache_ttl_seconds": 600,
+            "max_cache_entries": 2000,
+            "allowed_hosts": {"example.com", "test.com"},
+            "max_selector_length": 2048,
+            "max_search_length": 512,
         }
+        assert _client_settings(gopher_client, expected) == expected
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            manager = await get_client_manager()
-            client = await manager.get_gopher_client()
+    @pytest.mark.asyncio
+    async def test_get_gemini_client_security_defaults(self, build_client):
+        """Test that TOFU and client certificates are enabled by default."""
+        client = await build_client("gemini")
 
-            assert client.max_response_size == 2097152
-            assert client.timeout_seconds == 60.0
-            assert client.cache_enabled is False
-            assert client.cache_ttl_seconds == 600
-            assert client.max_cache_entries == 2000
-            assert client.allowed_hosts == {"example.com", "test.com"}
-            assert client.max_selector_length == 2048
-            assert client.max_search_length == 512
+        assert client.tofu_enabled is True
+        assert client.client_certs_enabled is True
 
     @pytest.mark.asyncio
-    async def test_get_gopher_client_singleton(self):
-        """Test that get_gopher_client returns the same instance."""
-        clear_client_manager()
+    @pytest.mark.parametrize(
+        ("variable", "attribute"),
+        [
+            ("GEMINI_TOFU_ENABLED", "tofu_enabled"),
+            ("GEMINI_CLIENT_CERTS_ENABLED", "client_certs_enabled"),
+        ],
+    )
+    async def test_get_gemini_client_security_disabled(
+        self, build_client, variable, attribute
+    ):
+        """Test disabling the Gemini-only security features from environment."""
+        client = await build_client("gemini", {variable: "false"})
 
-        manager = await get_client_manager()
-        client1 = await manager.get_gopher_client()
-        client2 = await manager.get_gopher_client()
+        assert getattr(client, attribute) is False
 
-        assert client1 is client2
+    @pytest.mark.asyncio
+    async def test_default_manager_reads_global_config(self, monkeypatch):
+        """Test that a manager without settings uses the env-backed global config."""
+        monkeypatch.setenv("GOPHER_TIMEOUT_SECONDS", "45.0")
+        reset_config()
+        try:
+            client = await ClientManager().get_gopher_client()
+        finally:
+            reset_config()
+
+        assert client.timeout_seconds == 45.0
 
     @pytest.mark.asyncio
-    async def test_get_gopher_client_allowed_hosts_parsing(self):
-        """Test parsing of allowed hosts from environment."""
-        clear_client_manager()
+    async def test_for_settings_ignores_environment(self, monkeypatch):
+        """Test that a manager built from settings never reads the environment."""
+        monkeypatch.setenv("GOPHER_TIMEOUT_SECONDS", "99.0")
+        config = AppConfig(gopher=GopherConfig(timeout_seconds=5.0))
 
-        with patch.dict(
-            os.environ,
-            {"GOPHER_ALLOWED_HOSTS": "  host1.com , host2.com  , host3.com  "},
-            clear=True,
-        ):
-            manager = await get_client_manager()
-            client = await manager.get_gopher_client()
+        with patch("gopher_mcp.server.get_config") as mock_get_config:
+            client = await ClientManager.for_settings(config).get_gopher_client()
+
+        mock_get_config.assert_not_called()
+        assert client.timeout_seconds == 5.0
+
+
+class _StubFetchClient:
+    """Minimal stand-in for a client's ``fetch_dict`` that records its calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.response: dict = {}
+        self.error: Exception | None = None
+
+    async def fetch_dict(self, url: str) -> dict:
+        self.calls.append(url)
+        if self.error is not None:
+            raise self.error
+        return self.response
 
-            assert client.allowed_hosts == {"host1.com", "host2.com", "host3.com"}
+
+@pytest.fixture
+def stub_gopher_client(monkeypatch):
+    """Install a ``_StubFetchClient`` as the manager's Gopher client."""
+    client = _StubFetchClient()
+    manager = ClientManager()
+    manager._gopher_client = client
+    monkeypatch.setattr(ClientManager, "_instance", manager)
+    return client
+
+
+@pytest.fixture
+def stub_gemini_client(monkeypatch):
+    """Install a ``_StubFetchClient`` as the manager's Gemini client."""
+    client = _StubFetchClient()
+    manager = ClientManager()
+    manager._gemini_client = client
+    monkeypatch.setattr(ClientManager, "_instance", manager)
+    return client
 
 
 class TestGopherFetch:
     """Test gopher_fetch tool function."""
 
     @pytest.mark.asyncio
-    async def test_gopher_fetch_success(self):
+    async def test_gopher_fetch_success(self, stub_gopher_client):
         """Test successful gopher fetch."""
-        mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.model_dump.return_value = {
+        stub_gopher_client.response = {
             "kind": "text",
             "text": "Hello, Gopher!",
             "bytes": 15,
             "charset": "utf-8",
         }
-        mock_client.fetch.return_value = mock_response
 
-        mock_manager = AsyncMock()
-        mock_manager.get_gopher_client.return_value = mock_client
+        result = await gopher_fetch("gopher://example.com/0/test.txt")
 
-        with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
-            result = await gopher_fetch("gopher://example.com/0/test.txt")
-
-            assert result["kind"] == "text"
-            assert result["text"] == "Hello, Gopher!"
-            assert result["bytes"] == 15
-            assert result["charset"] == "utf-8"
-
-            mock_client.fetch.assert_called_once_with("gopher://example.com/0/test.txt")
+        assert result["kind"] == "text"
+        assert result["text"] == "Hello, Gopher!"
+        assert result["bytes"] == 15
+        assert result["charset"] == "utf-8"
+        assert stub_gopher_client.calls == ["gopher://example.com/0/test.txt"]
 
     @pytest.mark.asyncio
     async def test_gopher_fetch_invalid_url(self):
         """An invalid URL returns a sanitized error, not a raised exception."""
         result = await gopher_fetch("http://example.com/")
         assert result["error"]["code"] == "INVALID_REQUEST"
+        assert "gopher://" in result["error"]["message"]
 
     @pytest.mark.asyncio
-    async def test_gopher_fetch_client_error(self):
+    async def test_gopher_fetch_overlong_url(self):
+        """The 8192-byte URL cap is enforced before any client is created."""
+        with patch("gopher_mcp.server.get_client_manager") as mock_get_manager:
+            result = await gopher_fetch("gopher://example.com/0/" + "a" * 8192)
+
+        assert result["error"]["code"] == "INVALID_REQUEST"
+        assert "8192 bytes" in result["error"]["message"]
+        mock_get_manager.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_gopher_fetch_client_error(self, stub_gopher_client):
         """An unexpected client failure is a sanitized FETCH_ERROR whose
         message does not leak internal exception detail to the LLM."""
-        mock_client = AsyncMock()
-        mock_client.fetch.side_effect = Exception("/home/u/.gemini/secret boom")
-
-        mock_manager = AsyncMock()
-        mock_manager.get_gopher_client.return_value = mock_client
+        stub_gopher_client.error = RuntimeError("/home/u/.gemini/secret boom")
 
-        with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
-            result = await gopher_fetch("gopher://example.com/0/test.txt")
+        result = await gopher_fetch("gopher://example.com/0/test.txt")
 
         assert result["error"]["code"] == "FETCH_ERROR"
         assert "secret" not in result["error"]["message"]
@@ -162,28 +358,24 @@ class TestGopherBatchFetch:
     @pytest.mark.asyncio
     async def test_gopher_batch_fetch_success(self):
         """Test successful batch fetch of multiple Gopher URLs."""
-        from gopher_mcp.server import gopher_batch_fetch
-
-        mock_response1 = MagicMock()
-        mock_response1.model_dump.return_value = {
+        mock_response1 = {
             "kind": "text",
             "text": "Content 1",
             "bytes": 9,
             "charset": "utf-8",
         }
 
-        mock_response2 = MagicMock()
-        mock_response2.model_dump.return_value = {
+        mock_response2 = {
             "kind": "text",
             "text": "Content 2",
             "bytes": 9,
             "charset": "utf-8",
         }
 
-        mock_client = AsyncMock()
-        mock_client.fetch.side_effect = [mock_response1, mock_response2]
+        mock_client = AsyncMock(spec=GopherClient)
+        mock_client.fetch_dict.side_effect = [mock_response1, mock_response2]
 
-        mock_manager = AsyncMock()
+        mock_manager = AsyncMock(spec=ClientManager)
         mock_manager.get_gopher_client.return_value = mock_client
 
         with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
@@ -200,21 +392,21 @@ class TestGopherBatchFetch:
     @pytest.mark.asyncio
     async def test_gopher_batch_fetch_with_errors(self):
         """Test batch fetch with some URLs failing."""
-        from gopher_mcp.server import gopher_batch_fetch
-
-        mock_response = MagicMock()
-        mock_response.model_dump.return_value = {
+        mock_response = {
             "kind": "text",
             "text": "Success",
             "bytes": 7,
             "charset": "utf-8",
         }
 
-        mock_client = AsyncMock()
+        mock_client = AsyncMock(spec=GopherClient)
         # First URL succeeds, second fails
-        mock_client.fetch.side_effect = [mock_response, Exception("Connection failed")]
+        mock_client.fetch_dict.side_effect = [
+            mock_response,
+            ConnectionError("Connection failed"),
+        ]
 
-        mock_manager = AsyncMock()
+        mock_manager = AsyncMock(spec=ClientManager)
         mock_manager.get_gopher_client.return_value = mock_client
 
         with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
@@ -232,10 +424,8 @@ class TestGopherBatchFetch:
     @pytest.mark.asyncio
     async def test_gopher_batch_fetch_invalid_url(self):
         """An invalid URL yields a per-item error, not a whole-batch failure."""
-        from gopher_mcp.server import gopher_batch_fetch
-
-        mock_manager = AsyncMock()
-        mock_manager.get_gopher_client.return_value = AsyncMock()
+        mock_manager = AsyncMock(spec=ClientManager)
+        mock_manager.get_gopher_client.return_value = AsyncMock(spec=GopherClient)
         with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
             results = await gopher_batch_fetch(["http://example.com/"])
 
@@ -245,8 +435,6 @@ class TestGopherBatchFetch:
     @pytest.mark.asyncio
     async def test_gopher_batch_fetch_too_many_urls(self):
         """Over-limit preserves the order/length contract: one error per URL."""
-        from gopher_mcp.server import MAX_BATCH_URLS, gopher_batch_fetch
-
         urls = [f"gopher://example.com/0/{i}" for i in range(MAX_BATCH_URLS + 1)]
         results = await gopher_batch_fetch(urls)
         # Same length as input so a model can zip responses to URLs by index.
@@ -259,11 +447,9 @@ class TestGopherBatchFetch:
     @pytest.mark.asyncio
     async def test_gopher_batch_fetch_setup_failure_returns_error(self):
         """A client-setup failure (e.g. corrupt store) is a sanitized error, not a raise."""
-        from gopher_mcp.server import gopher_batch_fetch
-
         with patch(
             "gopher_mcp.server.get_client_manager",
-            side_effect=Exception("corrupt store"),
+            side_effect=RuntimeError("corrupt store"),
         ):
             results = await gopher_batch_fetch(["gopher://example.com/1/"])
 
@@ -277,10 +463,7 @@ class TestGeminiBatchFetch:
     @pytest.mark.asyncio
     async def test_gemini_batch_fetch_success(self):
         """Test successful batch fetch of multiple Gemini URLs."""
-        from gopher_mcp.server import gemini_batch_fetch
-
-        mock_response1 = MagicMock()
-        mock_response1.model_dump.return_value = {
+        mock_response1 = {
             "kind": "gemtext",
             "document": {"lines": [], "links": []},
             "raw_content": "# Page 1",
@@ -288,8 +471,7 @@ class TestGeminiBatchFetch:
             "size": 8,
         }
 
-        mock_response2 = MagicMock()
-        mock_response2.model_dump.return_value = {
+        mock_response2 = {
             "kind": "gemtext",
             "document": {"lines": [], "links": []},
             "raw_content": "# Page 2",
@@ -297,10 +479,10 @@ class TestGeminiBatchFetch:
             "size": 8,
         }
 
-        mock_client = AsyncMock()
-        mock_client.fetch.side_effect = [mock_response1, mock_response2]
+        mock_client = AsyncMock(spec=GeminiClient)
+        mock_client.fetch_dict.side_effect = [mock_response1, mock_response2]
 
-        mock_manager = AsyncMock()
+        mock_manager = AsyncMock(spec=ClientManager)
         mock_manager.get_gemini_client.return_value = mock_client
 
         with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
@@ -314,10 +496,7 @@ class TestGeminiBatchFetch:
     @pytest.mark.asyncio
     async def test_gemini_batch_fetch_with_errors(self):
         """Test batch fetch with some URLs failing."""
-        from gopher_mcp.server import gemini_batch_fetch
-
-        mock_response = MagicMock()
-        mock_response.model_dump.return_value = {
+        mock_response = {
             "kind": "gemtext",
             "document": {"lines": [], "links": []},
             "raw_content": "# Success",
@@ -325,11 +504,11 @@ class TestGeminiBatchFetch:
             "size": 9,
         }
 
-        mock_client = AsyncMock()
+        mock_client = AsyncMock(spec=GeminiClient)
         # First URL succeeds, second fails
-        mock_client.fetch.side_effect = [mock_response, Exception("TLS error")]
+        mock_client.fetch_dict.side_effect = [mock_response, RuntimeError("TLS error")]
 
-        mock_manager = AsyncMock()
+        mock_manager = AsyncMock(spec=ClientManager)
         mock_manager.get_gemini_client.return_value = mock_client
 
         with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
@@ -344,10 +523,8 @@ class TestGeminiBatchFetch:
     @pytest.mark.asyncio
     async def test_gemini_batch_fetch_invalid_url(self):
         """An invalid URL yields a per-item error, not a whole-batch failure."""
-        from gopher_mcp.server import gemini_batch_fetch
-
-        mock_manager = AsyncMock()
-        mock_manager.get_gemini_client.return_value = AsyncMock()
+        mock_manager = AsyncMock(spec=ClientManager)
+        mock_manager.get_gemini_client.return_value = AsyncMock(spec=GeminiClient)
         with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
             results = await gemini_batch_fetch(["http://example.com/"])
 
@@ -357,8 +534,6 @@ class TestGeminiBatchFetch:
     @pytest.mark.asyncio
     async def test_gemini_batch_fetch_too_many_urls(self):
         """Over-limit preserves the order/length contract: one error per URL."""
-        from gopher_mcp.server import MAX_BATCH_URLS, gemini_batch_fetch
-
         urls = [f"gemini://example.org/{i}" for i in range(MAX_BATCH_URLS + 1)]
         results = await gemini_batch_fetch(urls)
         assert len(results) == len(urls)
@@ -370,11 +545,9 @@ class TestGeminiBatchFetch:
     @pytest.mark.asyncio
     async def test_gemini_batch_fetch_setup_failure_returns_error(self):
         """A client-setup failure (e.g. corrupt store) is a sanitized error, not a raise."""
-        from gopher_mcp.server import gemini_batch_fetch
-
         with patch(
             "gopher_mcp.server.get_client_manager",
-            side_effect=Exception("corrupt store"),
+            side_effect=RuntimeError("corrupt store"),
         ):
             results = await gemini_batch_fetch(["gemini://example.org/"])
 
@@ -412,6 +585,20 @@ class TestCleanup:
         # Cleanup should not raise error
         await cleanup()
 
+    @pytest.mark.asyncio
+    async def test_cleanup_clears_parsed_url_cache(self):
+        """Cleanup drops the memoized Gopher and Gemini URL parses."""
+        clear_client_manager()
+        parse_gopher_url("gopher://example.com/1/")
+        parse_gemini_url("gemini://example.org/")
+        assert parse_gopher_url.cache_info().currsize > 0
+        assert parse_gemini_url.cache_info().currsize > 0
+
+        await cleanup()
+
+        assert parse_gopher_url.cache_info().currsize == 0
+        assert parse_gemini_url.cache_info().currsize == 0
+
 
 class TestMCPServer:
     """Test MCP server instance."""
@@ -476,42 +663,37 @@ class TestGeminiInputRoundTrip:
 
     @pytest.mark.asyncio
     async def test_input_is_percent_encoded_into_query(self):
-        mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.model_dump.return_value = {"kind": "input"}
-        mock_client.fetch.return_value = mock_response
-        mock_manager = AsyncMock()
+        mock_client = AsyncMock(spec=GeminiClient)
+        mock_response = {"kind": "input"}
+        mock_client.fetch_dict.return_value = mock_response
+        mock_manager = AsyncMock(spec=ClientManager)
         mock_manager.get_gemini_client.return_value = mock_client
 
         with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
             await gemini_fetch("gemini://example.org/search", input="a b&c=d")
 
         # The raw answer must arrive percent-encoded, replacing any query.
-        fetched = mock_client.fetch.call_args.args[0]
+        fetched = mock_client.fetch_dict.call_args.args[0]
         assert fetched == "gemini://example.org/search?a%20b%26c%3Dd"
 
     @pytest.mark.asyncio
     async def test_input_replaces_existing_query_and_fragment(self):
-        mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.model_dump.return_value = {"kind": "input"}
-        mock_client.fetch.return_value = mock_response
-        mock_manager = AsyncMock()
+        mock_client = AsyncMock(spec=GeminiClient)
+        mock_response = {"kind": "input"}
+        mock_client.fetch_dict.return_value = mock_response
+        mock_manager = AsyncMock(spec=ClientManager)
         mock_manager.get_gemini_client.return_value = mock_client
 
         with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
             await gemini_fetch("gemini://example.org/p?old#frag", input="new")
 
-        assert mock_client.fetch.call_args.args[0] == "gemini://example.org/p?new"
+        assert mock_client.fetch_dict.call_args.args[0] == "gemini://example.org/p?new"
 
 
 class TestEntrypointTransportArgs:
     """The CLI must let an operator bind host/port for the http/sse transports."""
 
     def test_host_and_port_flow_into_fastmcp_settings(self):
-        from gopher_mcp import __main__ as entry
-        from gopher_mcp.server import mcp as server_mcp
-
         argv = [
             "prog",
             "--transport",
@@ -523,160 +705,70 @@ class TestEntrypointTransportArgs:
         ]
         with (
             patch("sys.argv", argv),
-            patch.object(server_mcp, "run") as mock_run,
+            patch.object(mcp, "run") as mock_run,
         ):
             entry.main()
 
         mock_run.assert_called_once()
-        assert server_mcp.settings.host == "0.0.0.0"
-        assert server_mcp.settings.port == 9999
+        assert mcp.settings.host == "0.0.0.0"
+        assert mcp.settings.port == 9999
 
 
 class TestEnvironmentVariables:
     """Test environment variable handling."""
 
     @pytest.mark.asyncio
-    async def test_boolean_env_var_parsing(self):
+    @pytest.mark.parametrize(
+        ("gopher_client", "expected"),
+        [
+            ({"GOPHER_CACHE_ENABLED": "true"}, True),
+            ({"GOPHER_CACHE_ENABLED": "True"}, True),
+            ({"GOPHER_CACHE_ENABLED": "TRUE"}, True),
+            ({"GOPHER_CACHE_ENABLED": "yes"}, True),  # Pydantic accepts yes as True
+            ({"GOPHER_CACHE_ENABLED": "1"}, True),  # Pydantic accepts 1 as True
+            ({"GOPHER_CACHE_ENABLED": "on"}, True),  # Pydantic accepts on as True
+            ({"GOPHER_CACHE_ENABLED": "false"}, False),
+            ({"GOPHER_CACHE_ENABLED": "False"}, False),
+            ({"GOPHER_CACHE_ENABLED": "FALSE"}, False),
+            ({"GOPHER_CACHE_ENABLED": "no"}, False),  # Pydantic accepts no as False
+            ({"GOPHER_CACHE_ENABLED": "0"}, False),  # Pydantic accepts 0 as False
+            ({"GOPHER_CACHE_ENABLED": "off"}, False),  # Pydantic accepts off as False
+        ],
+        indirect=["gopher_client"],
+    )
+    async def test_boolean_env_var_parsing(self, gopher_client, expected):
         """Test parsing of boolean environment variables.
 
         Pydantic accepts: true, yes, 1, on as True
         Pydantic accepts: false, no, 0, off as False
         """
-        test_cases = [
-            ("true", True),
-            ("True", True),
-            ("TRUE", True),
-            ("yes", True),  # Pydantic accepts yes as True
-            ("1", True),  # Pydantic accepts 1 as True
-            ("on", True),  # Pydantic accepts on as True
-            ("false", False),
-            ("False", False),
-            ("FALSE", False),
-            ("no", False),  # Pydantic accepts no as False
-            ("0", False),  # Pydantic accepts 0 as False
-            ("off", False),  # Pydantic accepts off as False
-        ]
-
-        for env_value, expected in test_cases:
-            with patch.dict(
-                os.environ, {"GOPHER_CACHE_ENABLED": env_value}, clear=True
-            ):
-                # Clear client manager to force recreation
-                clear_client_manager()
-                manager = await get_client_manager()
-                client = await manager.get_gopher_client()
-                assert client.cache_enabled is expected, (
-                    f"Failed for env_value='{env_value}'"
-                )
+        assert gopher_client.cache_enabled is expected
 
     @pytest.mark.asyncio
-    async def test_numeric_env_var_parsing(self):
+    @pytest.mark.parametrize(
+        ("gopher_client", "attribute", "expected"),
+        [
+            ({"GOPHER_MAX_RESPONSE_SIZE": "123456"}, "max_response_size", 123456),
+            ({"GOPHER_TIMEOUT_SECONDS": "45.5"}, "timeout_seconds", 45.5),
+            ({"GOPHER_CACHE_TTL_SECONDS": "900"}, "cache_ttl_seconds", 900),
+            ({"GOPHER_MAX_CACHE_ENTRIES": "5000"}, "max_cache_entries", 5000),
+            ({"GOPHER_MAX_SELECTOR_LENGTH": "4096"}, "max_selector_length", 4096),
+            ({"GOPHER_MAX_SEARCH_LENGTH": "1024"}, "max_search_length", 1024),
+        ],
+        indirect=["gopher_client"],
+    )
+    async def test_numeric_env_var_parsing(self, gopher_client, attribute, expected):
         """Test parsing of numeric environment variables."""
-        clear_client_manager()
-
-        with patch.dict(
-            os.environ,
-            {
-                "GOPHER_MAX_RESPONSE_SIZE": "123456",
-                "GOPHER_TIMEOUT_SECONDS": "45.5",
-                "GOPHER_CACHE_TTL_SECONDS": "900",
-                "GOPHER_MAX_CACHE_ENTRIES": "5000",
-                "GOPHER_MAX_SELECTOR_LENGTH": "4096",
-                "GOPHER_MAX_SEARCH_LENGTH": "1024",
-            },
-            clear=True,
-        ):
-            manager = await get_client_manager()
-            client = await manager.get_gopher_client()
-
-            assert client.max_response_size == 123456
-            assert client.timeout_seconds == 45.5
-            assert client.cache_ttl_seconds == 900
-            assert client.max_cache_entries == 5000
-            assert client.max_selector_length == 4096
-            assert client.max_search_length == 1024
-
-
-class TestGetGeminiClient:
-    """Test get_gemini_client function via ClientManager."""
-
-    @pytest.mark.asyncio
-    async def test_get_gemini_client_default_config(self):
-        """Test getting gemini client with default configuration."""
-        clear_client_manager()
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with (
-                patch.dict(os.environ, {}, clear=True),
-                patch("gopher_mcp.tofu.get_home_directory") as mock_tofu_home,
-                patch("gopher_mcp.client_certs.get_home_directory") as mock_certs_home,
-            ):
-                # Mock home directory for both TOFU and client certs
-                mock_tofu_home.return_value = Path(temp_dir)
-                mock_certs_home.return_value = Path(temp_dir)
-
-                manager = await get_client_manager()
-                client = await manager.get_gemini_client()
-
-                assert client is not None
-                assert client.max_response_size == 1048576  # 1MB default
-                assert client.timeout_seconds == 30.0
-                assert client.cache_enabled is True
-                assert client.cache_ttl_seconds == 300
-                assert client.max_cache_entries == 1000
-                assert client.allowed_hosts is None
-                assert client.tofu_enabled is True
-                assert client.client_certs_enabled is True
-
-    @pytest.mark.asyncio
-    async def test_get_gemini_client_custom_config(self):
-        """Test getting gemini client with custom configuration."""
-        clear_client_manager()
-
-        env_vars = {
-            "GEMINI_MAX_RESPONSE_SIZE": "2097152",  # 2MB
-            "GEMINI_TIMEOUT_SECONDS": "60.0",
-            "GEMINI_CACHE_ENABLED": "false",
-            "GEMINI_CACHE_TTL_SECONDS": "600",
-            "GEMINI_MAX_CACHE_ENTRIES": "2000",
-            "GEMINI_ALLOWED_HOSTS": "example.org,test.org",
-            "GEMINI_TOFU_ENABLED": "false",
-            "GEMINI_CLIENT_CERTS_ENABLED": "false",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
-            manager = await get_client_manager()
-            client = await manager.get_gemini_client()
-
-            assert client.max_response_size == 2097152
-            assert client.timeout_seconds == 60.0
-            assert client.cache_enabled is False
-            assert client.cache_ttl_seconds == 600
-            assert client.max_cache_entries == 2000
-            assert client.allowed_hosts == {"example.org", "test.org"}
-            assert client.tofu_enabled is False
-            assert client.client_certs_enabled is False
-
-    @pytest.mark.asyncio
-    async def test_get_gemini_client_singleton(self):
-        """Test that get_gemini_client returns the same instance."""
-        clear_client_manager()
-
-        manager = await get_client_manager()
-        client1 = await manager.get_gemini_client()
-        client2 = await manager.get_gemini_client()
-
-        assert client1 is client2
+        assert getattr(gopher_client, attribute) == expected
 
 
 class TestGeminiFetch:
     """Test gemini_fetch function."""
 
     @pytest.mark.asyncio
-    async def test_gemini_fetch_success(self):
+    async def test_gemini_fetch_success(self, stub_gemini_client):
         """Test successful gemini fetch."""
-        mock_response = MagicMock()
-        mock_response.model_dump.return_value = {
+        stub_gemini_client.response = {
             "kind": "gemtext",
             "document": {"lines": [], "links": []},
             "raw_content": "# Test",
@@ -685,18 +777,11 @@ class TestGeminiFetch:
             "request_info": {"url": "gemini://example.org/", "timestamp": 1234567890},
         }
 
-        mock_client = AsyncMock()
-        mock_client.fetch.return_value = mock_response
+        result = await gemini_fetch("gemini://example.org/")
 
-        mock_manager = AsyncMock()
-        mock_manager.get_gemini_client.return_value = mock_client
-
-        with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
-            result = await gemini_fetch("gemini://example.org/")
-
-            assert result["kind"] == "gemtext"
-            assert result["raw_content"] == "# Test"
-            mock_client.fetch.assert_called_once_with("gemini://example.org/")
+        assert result["kind"] == "gemtext"
+        assert result["raw_content"] == "# Test"
+        assert stub_gemini_client.calls == ["gemini://example.org/"]
 
     @pytest.mark.asyncio
     async def test_gemini_fetch_invalid_url(self):
@@ -705,16 +790,11 @@ class TestGeminiFetch:
         assert result["error"]["code"] == "INVALID_REQUEST"
 
     @pytest.mark.asyncio
-    async def test_gemini_fetch_client_error(self):
+    async def test_gemini_fetch_client_error(self, stub_gemini_client):
         """An unexpected client failure must not leak exception detail."""
-        mock_client = AsyncMock()
-        mock_client.fetch.side_effect = Exception("/home/u/.gemini/secret boom")
+        stub_gemini_client.error = RuntimeError("/home/u/.gemini/secret boom")
 
-        mock_manager = AsyncMock()
-        mock_manager.get_gemini_client.return_value = mock_client
-
-        with patch("gopher_mcp.server.get_client_manager", return_value=mock_manager):
-            result = await gemini_fetch("gemini://example.org/")
+        result = await gemini_fetch("gemini://example.org/")
 
         assert result["error"]["code"] == "FETCH_ERROR"
         assert "secret" not in result["error"]["message"]
@@ -729,9 +809,6 @@ class TestLLMFacingFieldNames:
     """
 
     def test_instructions_and_param_desc_use_serialized_menu_key(self):
-        from gopher_mcp.models import GopherMenuItem
-        from gopher_mcp.server import SERVER_INSTRUCTIONS, _GopherUrl
-
         keys = set(
             GopherMenuItem(
                 type="1",
@@ -5,12 +5,14 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from pydantic import ValidationError
 
 from gopher_mcp.utils import (
     atomic_write_json,
     format_gemini_url,
     format_gopher_url,
     guess_mime_type,
+    parse_gemini_url,
     parse_gopher_menu,
     parse_gopher_url,
     parse_menu_line,
@@ -19,6 +21,39 @@ from gopher_mcp.utils import (
 )
 
 
+class TestParsedUrlMemoization:
+    """The memoized URL parsers share one frozen result per URL string."""
+
+    @pytest.mark.parametrize(
+        ("parse", "url", "bad_url", "match"),
+        [
+            (
+                parse_gopher_url,
+                "gopher://example.com/0/memoized",
+                "gopher://example.com:0/1/",
+                r"[Pp]ort",
+            ),
+            (
+                parse_gemini_url,
+                "gemini://example.org/memoized",
+                "gemini://user@example.org/",
+                "userinfo",
+            ),
+        ],
+        ids=["gopher", "gemini"],
+    )
+    def test_parsed_url_is_memoized(self, parse, url, bad_url, match):
+        """Repeat parses of a URL reuse the first result; bad URLs still raise."""
+        parsed = parse(url)
+        assert parse(url) is parsed
+        # The shared instance is frozen, so no caller can poison the cache
+        with pytest.raises(ValidationError):
+            parsed.host = "evil.example"
+        for _ in range(2):
+            with pytest.raises(ValueError, match=match):
+                parse(bad_url)
+
+
 class TestAtomicWriteJson:
     """Durability and cleanup contract of atomic_write_json."""
 
@@ -205,6 +240,15 @@ class TestParseMenuLine:
         assert result.type == "0"
         assert result.title == "Test File"
 
+    def test_gopher_plus_field_is_ignored(self):
+        """Fields after the port (e.g. a Gopher+ '+' marker) are ignored."""
+        line = "0Test File\t/test.txt\texample.com\t7070\t+\r\n"
+        result = parse_menu_line(line)
+
+        assert result is not None
+        assert result.host == "example.com"
+        assert result.port == 7070
+
     def test_insufficient_parts(self):
         """Test parsing line with insufficient parts."""
         line = "1About\t/about"  # Missing host and port